@@ -0,0 +1,73 @@
+"""Add indexes for the files table access patterns
+
+Indexes are created concurrently, so that the files table can still be written
+to while they are built.
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7b8c9d0e1f2"
+down_revision = "f6a7b8c9d0e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_files_active_last_modified_date",
+            "files",
+            ["last_modified_date"],
+            postgresql_where=sa.text("deletion_date IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_files_deletion_date",
+            "files",
+            ["deletion_date"],
+            postgresql_where=sa.text("deletion_date IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_files_path_pattern",
+            "files",
+            ["path"],
+            postgresql_ops={"path": "text_pattern_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_files_active_descriptor_content_date",
+            "files",
+            ["descriptor", "content_date"],
+            postgresql_where=sa.text("deletion_date IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+    op.execute("ANALYZE files")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in [
+            "ix_files_active_descriptor_content_date",
+            "ix_files_path_pattern",
+            "ix_files_deletion_date",
+            "ix_files_active_last_modified_date",
+        ]:
+            op.drop_index(
+                index_name,
+                table_name="files",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -7,7 +7,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Self
 
-from sqlalchemy import JSON, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -34,6 +42,33 @@ class File(Base):
             "deletion_date",
             name="uq_files_descriptor_content_date_version_deletion_date",
         ),
+        # Active files modified since a date, i.e., `Database.get_files_since`.
+        Index(
+            "ix_files_active_last_modified_date",
+            "last_modified_date",
+            postgresql_where=text("deletion_date IS NULL"),
+        ),
+        # Files deleted since a date, i.e., `Database.get_files_deleted_since`.
+        Index(
+            "ix_files_deletion_date",
+            "deletion_date",
+            postgresql_where=text("deletion_date IS NOT NULL"),
+        ),
+        # Path prefix matches (`LIKE 'prefix%'`), regardless of the collation, i.e.,
+        # `Database.get_files_by_path` and `Database.get_active_files_in_folder`.
+        Index(
+            "ix_files_path_pattern",
+            "path",
+            postgresql_ops={"path": "text_pattern_ops"},
+        ),
+        # Active files of a type on a given day, i.e.,
+        # `Database.get_active_files_by_descriptor`.
+        Index(
+            "ix_files_active_descriptor_content_date",
+            "descriptor",
+            "content_date",
+            postgresql_where=text("deletion_date IS NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -13,6 +13,7 @@ from imap_mag.check.IALiRTAnomaly import (
 from imap_mag.check.SeverityLevel import SeverityLevel
 from imap_mag.process import get_packet_definition_folder
 from imap_mag.util.constants import CONSTANTS
+from imap_mag.util.tabularFile import read_tabular_file
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,7 @@ def check_ialirt_files(
     ialirt_data = pd.DataFrame()
 
     for file in files:
-        file_data: pd.DataFrame = pd.read_csv(
+        file_data: pd.DataFrame = read_tabular_file(
             file, parse_dates=["time_utc"], index_col="time_utc"
         )
         ialirt_data = pd.concat([ialirt_data, file_data])
@@ -12,10 +12,12 @@ from imap_mag.cli.cliUtils import (
     initialiseLoggingForCommand,
 )
 from imap_mag.config import AppSettings, SaveMode
+from imap_mag.db.Database import Database
 from imap_mag.io import DatastoreFileManager, FileFinder
 from imap_mag.io.file import (
     AncillaryPathHandler,
     CalibrationLayerPathHandler,
+    IFilePathHandler,
     SciencePathHandler,
 )
 from imap_mag.io.file.VersionedPathHandler import VersionedPathHandler
@@ -331,7 +333,12 @@ def _apply_for_date(
         )
 
     # Resolve layer patterns to actual filenames
-    datastore_finder = FileFinder(app_settings.data_store, app_settings.work_folder)
+    datastore_finder = FileFinder(
+        app_settings.data_store,
+        app_settings.work_folder,
+        database=Database() if Database.get_environment_url() else None,
+        search_database=app_settings.find_files_in_database,
+    )
     resolved_layers = (
         datastore_finder.find_layers_by_date_and_patterns(
             layers, date, mode, throw_if_not_found=True
@@ -427,7 +434,9 @@ def _apply_for_date(
         spice_metakernel=spice_metakernel,
         reference_frames=reference_frames,
     )
-    outputManager.add_file(offset_file, offset_file_handler)
+    output_files: list[tuple[Path, IFilePathHandler]] = [
+        (offset_file, offset_file_handler)
+    ]
     for L2_file in L2_files:
         l2_handler = SciencePathHandler.from_filename(L2_file.name)
 
@@ -446,7 +455,9 @@ def _apply_for_date(
         else:
             l2_handler.version = 1
             l2_handler.version_major = app_settings.version_major
-        outputManager.add_file(L2_file, l2_handler)
+        output_files.append((L2_file, l2_handler))
+
+    outputManager.add_files(output_files)
 
     cleanup_workfolder_after_apply(
         app_settings,
@@ -340,6 +340,7 @@ def _calibrate_for_date(
         app_settings.data_store,
         work_folder,
         database=Database() if Database.get_environment_url() else None,
+        search_database=app_settings.find_files_in_database,
     )
 
     # The scripted-l2 method uses an extended configuration with extra required
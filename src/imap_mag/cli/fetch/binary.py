@@ -16,6 +16,86 @@ from imap_mag.util import HKPacket
 logger = logging.getLogger(__name__)
 
 
+def create_fetch_binary(app_settings: AppSettings) -> FetchBinary:
+    """Create a FetchBinary instance with common configuration.
+
+    Its WebPODA client keeps a session per thread, so reusing the instance for
+    several packets reuses connections to WebPODA.
+    """
+
+    work_folder = app_settings.setup_work_folder_for_command(app_settings.fetch_binary)
+
+    initialiseLoggingForCommand(
+        work_folder
+    )  # DO NOT log anything before this point (it won't be captured in the log file)
+
+    poda = WebPODA(
+        app_settings.fetch_binary.api.auth_code,
+        work_folder,
+        app_settings.fetch_binary.api.url_base,
+    )
+
+    return FetchBinary(
+        poda,
+        slice_duration=app_settings.fetch_binary.download_slice_duration,
+        max_concurrent_slices=app_settings.fetch_binary.max_concurrent_slice_downloads,
+        slice_settling_time=app_settings.fetch_binary.download_slice_settling_time,
+        retries=app_settings.fetch_binary.download_retries,
+    )
+
+
+def download_and_publish_binaries(
+    fetch: FetchBinary,
+    app_settings: AppSettings,
+    packet: HKPacket,
+    start_date: datetime,
+    end_date: datetime,
+    use_ert: bool = False,
+    fetch_mode: FetchMode = FetchMode.DownloadOnly,
+) -> dict[Path, HKBinaryPathHandler]:
+    """Download binary data for a packet from WebPODA and publish it to the data store."""
+
+    packet_name = packet.packet_name
+
+    logger.info(
+        f"Downloading raw packet {packet_name} from {start_date} to {end_date}."
+    )
+
+    downloaded_binaries: dict[Path, HKBinaryPathHandler] = fetch.download_binaries(
+        packet=packet,
+        start_date=start_date,
+        end_date=end_date,
+        use_ert=use_ert,
+    )
+
+    if not downloaded_binaries:
+        logger.info(
+            f"No data downloaded for packet {packet_name} from {start_date} to {end_date}."
+        )
+    else:
+        logger.debug(
+            f"Downloaded {len(downloaded_binaries)} files:\n{', '.join(str(f) for f in downloaded_binaries.keys())}"
+        )
+
+    output_binaries: dict[Path, HKBinaryPathHandler] = dict()
+
+    if app_settings.fetch_binary.publish_to_data_store:
+        datastore_manager = DatastoreFileManager.CreateByMode(
+            app_settings,
+            use_database=(fetch_mode == FetchMode.DownloadAndUpdateProgress),
+        )
+
+        for output_file, output_handler, _ in datastore_manager.add_files(
+            list(downloaded_binaries.items())
+        ):
+            output_binaries[output_file] = output_handler
+    else:
+        logger.info("Files not published to data store based on config.")
+        output_binaries = downloaded_binaries
+
+    return output_binaries
+
+
 # E.g.,
 # imap-mag fetch binary --apid 1063 --start-date 2025-01-02 --end-date 2025-01-03
 # imap-mag fetch binary --packet SID3_PW --start-date 2025-01-02 --end-date 2025-01-03
@@ -52,63 +132,19 @@ def fetch_binary(
         raise ValueError("Must provide either --apid or --packet, and not both")
 
     app_settings = AppSettings()  # type: ignore
-    work_folder = app_settings.setup_work_folder_for_command(app_settings.fetch_binary)
-
-    initialiseLoggingForCommand(
-        work_folder
-    )  # DO NOT log anything before this point (it won't be captured in the log file)
+    fetch = create_fetch_binary(app_settings)
 
     if apid is not None:
         packet = HKPacket.from_apid(apid)
     else:
         assert packet is not None
 
-    packet_name = packet.packet_name
-
-    logger.info(
-        f"Downloading raw packet {packet_name} from {start_date} to {end_date}."
-    )
-
-    poda = WebPODA(
-        app_settings.fetch_binary.api.auth_code,
-        work_folder,
-        app_settings.fetch_binary.api.url_base,
-    )
-
-    fetch_binary = FetchBinary(poda)
-    downloaded_binaries: dict[Path, HKBinaryPathHandler] = (
-        fetch_binary.download_binaries(
-            packet=packet,
-            start_date=start_date,
-            end_date=end_date,
-            use_ert=use_ert,
-        )
+    return download_and_publish_binaries(
+        fetch,
+        app_settings,
+        packet=packet,
+        start_date=start_date,
+        end_date=end_date,
+        use_ert=use_ert,
+        fetch_mode=fetch_mode,
     )
-
-    if not downloaded_binaries:
-        logger.info(
-            f"No data downloaded for packet {packet_name} from {start_date} to {end_date}."
-        )
-    else:
-        logger.debug(
-            f"Downloaded {len(downloaded_binaries)} files:\n{', '.join(str(f) for f in downloaded_binaries.keys())}"
-        )
-
-    output_binaries: dict[Path, HKBinaryPathHandler] = dict()
-
-    if app_settings.fetch_binary.publish_to_data_store:
-        datastore_manager = DatastoreFileManager.CreateByMode(
-            app_settings,
-            use_database=(fetch_mode == FetchMode.DownloadAndUpdateProgress),
-        )
-
-        for file, path_handler in downloaded_binaries.items():
-            (output_file, output_handler, _) = datastore_manager.add_file(
-                file, path_handler
-            )
-            output_binaries[output_file] = output_handler
-    else:
-        logger.info("Files not published to data store based on config.")
-        output_binaries = downloaded_binaries
-
-    return output_binaries
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated
@@ -84,6 +85,12 @@ def fetch_science(
             help="Whether to block or allow overwriting an existing datastore file that has the same version but different content.",
         ),
     ] = DatastoreSaveOption.FILE_OVERWRITES_BLOCKED,
+    skip_existing_files: Annotated[
+        bool,
+        typer.Option(
+            help="Do not download files already in the datastore with the same version. Their content is not compared with the SDC, so overwrites are not detected.",
+        ),
+    ] = False,
 ) -> dict[Path, SciencePathHandler]:
     """Download science data from the SDC."""
 
@@ -104,7 +111,48 @@ def fetch_science(
         level, modes, sensors, reference_frames
     )
 
-    fetch_science = FetchScience(data_access)
+    published_science: dict[Path, tuple[Path, SciencePathHandler]] = dict()
+    publish_downloaded_file: Callable[[Path, SciencePathHandler], None] | None = None
+    find_existing_files: (
+        Callable[[list[SciencePathHandler]], list[Path | None]] | None
+    ) = None
+
+    if app_settings.fetch_science.publish_to_data_store:
+        datastore_manager = DatastoreFileManager.CreateByMode(
+            app_settings,
+            use_database=(fetch_mode == FetchMode.DownloadAndUpdateProgress),
+        )
+
+        def publish_downloaded_file(file: Path, path_handler: SciencePathHandler):
+            if overwrite_option == DatastoreSaveOption.FILE_OVERWRITES_ALLOWED:
+                path_handler.allow_overwrite = True
+                # version_is_locked deliberately kept True — SDC science file versions must
+                # never be reassigned, only the file bytes are overwritten in place.
+
+            (output_file, output_handler, _) = datastore_manager.add_file(
+                file, path_handler
+            )
+            published_science[file] = (output_file, output_handler)
+
+            # Clean up work folder files as have been published to datastore
+            logger.debug(f"Removing temporary file {file} from work folder.")
+            file.unlink(missing_ok=True)
+
+        # Files already in the datastore at the same version are not downloaded
+        # again, unless they are to be overwritten.
+        if (
+            skip_existing_files
+            and overwrite_option == DatastoreSaveOption.FILE_OVERWRITES_BLOCKED
+        ):
+            find_existing_files = datastore_manager.find_existing_files
+
+    fetch_science = FetchScience(
+        data_access,
+        max_concurrent_downloads=app_settings.fetch_science.max_concurrent_downloads,
+        retries=app_settings.fetch_science.download_retries,
+    )
+
+    # downloaded files are published as they complete, in order of ingestion
     downloaded_science: dict[Path, SciencePathHandler] = fetch_science.download_science(
         level=level,
         reference_frames=reference_frames,
@@ -116,6 +164,8 @@ def fetch_science(
         max_downloads=max_downloads,
         skip_items_count=skip_items_count,
         version_str_or_latest=version_str_or_latest,
+        on_downloaded=publish_downloaded_file,
+        find_existing_files=find_existing_files,
     )
 
     if not downloaded_science:
@@ -127,34 +177,15 @@ def fetch_science(
             f"Downloaded {len(downloaded_science)} files:\n{', '.join(str(f) for f in downloaded_science.keys())}"
         )
 
-    output_science: dict[Path, SciencePathHandler] = dict()
-
-    if app_settings.fetch_science.publish_to_data_store:
-        if overwrite_option == DatastoreSaveOption.FILE_OVERWRITES_ALLOWED:
-            for path_handler in downloaded_science.values():
-                path_handler.allow_overwrite = True
-                # version_is_locked deliberately kept True — SDC science file versions must
-                # never be reassigned, only the file bytes are overwritten in place.
-
-        datastore_manager = DatastoreFileManager.CreateByMode(
-            app_settings,
-            use_database=(fetch_mode == FetchMode.DownloadAndUpdateProgress),
-        )
-
-        for file, path_handler in downloaded_science.items():
-            (output_file, output_handler, _) = datastore_manager.add_file(
-                file, path_handler
-            )
-            output_science[output_file] = output_handler
-
-            # Clean up work folder files as have been copied to datastore
-            logger.debug(f"Removing temporary file {file} from work folder.")
-            file.unlink(missing_ok=False)
-    else:
+    if not app_settings.fetch_science.publish_to_data_store:
         logger.info("Files not published to data store based on config.")
-        output_science = downloaded_science
+        return downloaded_science
 
-    return output_science
+    # files already in the datastore are returned as they are
+    return dict(
+        published_science.get(file, (file, path_handler))
+        for file, path_handler in downloaded_science.items()
+    )
 
 
 def _validate_and_complete_parameters(
@@ -73,19 +73,19 @@ def process(
         work_files.append(file)
 
     # Process files.
-    file_processor: FileProcessor = dispatch(work_files, work_folder, datastore_finder)
+    file_processor: FileProcessor = dispatch(
+        work_files, work_folder, datastore_finder, app_settings.process
+    )
     file_processor.initialize(app_settings.packet_definition)
 
     processed_files: dict[Path, IFilePathHandler] = file_processor.process(work_files)
 
     # Copy files to the output directory.
-    copied_files: list[tuple[Path, IFilePathHandler]] = []
-
-    for processed_file, path_handler in processed_files.items():
-        (copied_file, path_handler, _) = datastore_manager.add_file(
-            processed_file, path_handler
+    copied_files: list[tuple[Path, IFilePathHandler]] = [
+        (copied_file, path_handler)
+        for (copied_file, path_handler, _) in datastore_manager.add_files(
+            list(processed_files.items())
         )
-
-        copied_files.append((copied_file, path_handler))
+    ]
 
     return copied_files
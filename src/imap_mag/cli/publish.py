@@ -5,9 +5,10 @@ from typing import Annotated
 import typer
 
 from imap_mag.cli.cliUtils import initialiseLoggingForCommand
-from imap_mag.client.SDCDataAccess import SDCDataAccess, SDCUploadError
+from imap_mag.client.SDCDataAccess import SDCDataAccess
 from imap_mag.config import AppSettings
 from imap_mag.io.FileFinder import FileFinder
+from imap_mag.upload.PublishToSDC import PublishToSDC
 
 logger = logging.getLogger(__name__)
 
@@ -48,22 +49,20 @@ def publish(
         f"Found {len(resolved_files)} files for publish: {', '.join(str(f) for f in resolved_files)}"
     )
 
-    # Publish file to SDC.
-    failed: int = 0
+    # Publish files to SDC, skipping any already published from this work folder.
     data_access = SDCDataAccess(
         auth_code=app_settings.publish.api.auth_code,
         data_dir=work_folder,
         sdc_url=app_settings.publish.api.url_base,
     )
+    publish_to_sdc = PublishToSDC(
+        data_access,
+        max_concurrent_uploads=app_settings.publish.max_concurrent_uploads,
+        retries=app_settings.publish.upload_retries,
+        state_file=work_folder / PublishToSDC.STATE_FILE_NAME,
+    )
 
-    for file in resolved_files:
-        try:
-            data_access.upload(file.as_posix())
-        except SDCUploadError as e:
-            failed += 1
-            logger.warning(
-                f"Failed to publish file {file}: {e}. Continuing with next file."
-            )
+    failed: int = len(publish_to_sdc.upload_files(resolved_files))
 
     if failed > 0:
         logger.error(
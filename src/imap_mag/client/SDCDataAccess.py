@@ -53,6 +53,28 @@ class SDCDataAccess:
 
         return (science_file.filename, science_file.construct_path())
 
+    @staticmethod
+    def is_transient_error(error: BaseException) -> bool:
+        """Connection errors, timeouts, rate limiting and server errors are transient.
+
+        The underlying `requests` error is found through the chain of causes, as
+        `imap-data-access` and `upload` wrap it in their own errors.
+        """
+
+        cause: BaseException | None = error
+
+        while cause is not None and not isinstance(
+            cause, requests.exceptions.RequestException
+        ):
+            cause = cause.__cause__
+
+        if isinstance(cause, requests.exceptions.HTTPError):
+            return cause.response is not None and (
+                cause.response.status_code == 429 or cause.response.status_code >= 500
+            )
+
+        return isinstance(cause, requests.exceptions.RequestException)
+
     def upload(self, filename: str) -> None:
         logger.debug(f"Uploading {filename} to imap-data-access.")
 
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import threading
 import urllib.parse
 from datetime import datetime
 from pathlib import Path
@@ -15,18 +16,31 @@ logger = logging.getLogger(__name__)
 class WebPODA:
     """Class for downloading raw packets from WebPODA."""
 
+    # Size of each chunk written to disk while streaming a download.
+    CHUNK_SIZE: int = 1024 * 1024
+
     __auth_code: SecretStr
     __output_dir: Path
     __webpoda_url: str
+    __sessions: threading.local
 
     def __init__(
-        self, auth_code: SecretStr | None, output_dir: Path, webpoda_url: str
+        self,
+        auth_code: SecretStr | None,
+        output_dir: Path,
+        webpoda_url: str,
     ) -> None:
-        """Initialize WebPODA interface."""
+        """Initialize WebPODA interface.
+
+        Requests made from the same thread share a session, so connections to
+        WebPODA are kept alive between downloads. Each thread has its own session,
+        as `requests.Session` is not thread-safe.
+        """
 
         self.__auth_code = auth_code or SecretStr("")
         self.__output_dir = output_dir
         self.__webpoda_url = webpoda_url
+        self.__sessions = threading.local()
 
     def download(
         self,
@@ -38,10 +52,10 @@ class WebPODA:
     ) -> Path:
         """Download packet data from WebPODA."""
 
-        file_path: Path = (
-            self.__output_dir
-            / f"{packet}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.bin"
+        file_path: Path = self.get_download_path(
+            packet=packet, start_date=start_date, end_date=end_date
         )
+        partial_file_path: Path = file_path.with_suffix(".part")
 
         logger.info(
             f"Downloading {packet} from {start_date} to {end_date} into {file_path}."
@@ -50,20 +64,52 @@ class WebPODA:
         if not self.__output_dir.exists():
             os.makedirs(self.__output_dir)
 
-        packet_response: requests.Response = self.__download_from_webpoda(
-            packet,
-            "bin",
-            start_date,
-            end_date,
-            ert,
-            "project(packet)",
-        )
-
-        with open(file_path, "wb") as f:
-            f.write(packet_response.content)
+        size = 0
+
+        # Stream the response to disk in chunks, so that large downloads are
+        # never held in memory.
+        with (
+            self.__download_from_webpoda(
+                packet,
+                "bin",
+                start_date,
+                end_date,
+                ert,
+                "project(packet)",
+            ) as packet_response,
+            open(partial_file_path, "wb") as f,
+        ):
+            for chunk in packet_response.iter_content(chunk_size=self.CHUNK_SIZE):
+                f.write(chunk)
+                size += len(chunk)
+
+        # Only complete downloads appear under the final file name.
+        partial_file_path.replace(file_path)
+
+        logger.debug(f"Downloaded {size} bytes.")
 
         return file_path
 
+    def get_download_path(
+        self,
+        *,
+        packet: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Path:
+        """Retrieve the path packet data for the given dates is downloaded to."""
+
+        date_format: str = (
+            "%Y%m%d"
+            if start_date.time() == end_date.time() == datetime.min.time()
+            else "%Y%m%dT%H%M%S"
+        )
+
+        return (
+            self.__output_dir
+            / f"{packet}_{start_date.strftime(date_format)}_{end_date.strftime(date_format)}.bin"
+        )
+
     def get_max_ert(
         self,
         *,
@@ -76,24 +122,32 @@ class WebPODA:
             f"Downloading ERT information for {packet} from {start_date} to {end_date}."
         )
 
-        ert_response: requests.Response = self.__download_from_webpoda(
+        # ERTs are formatted as fixed-width ISO strings, so the latest ERT is
+        # also the largest string, and only that one needs to be parsed.
+        max_ert_value: bytes | None = None
+
+        with self.__download_from_webpoda(
             packet,
             "csv",
             start_date,
             end_date,
             ert,
             "project(ert)&formatTime(\"yyyy-MM-dd'T'HH:mm:ss\")",
-        )
+        ) as ert_response:
+            lines = ert_response.iter_lines()
+            next(lines, None)  # skip header
 
-        ert_info = ert_response.content.decode("utf-8")
-        lines = ert_info.strip().splitlines()[1:]
+            for line in lines:
+                line = line.strip()
 
-        if not lines:
+                if line and (max_ert_value is None or line > max_ert_value):
+                    max_ert_value = line
+
+        if max_ert_value is None:
             logger.debug("No ERT data found.")
             max_ert = None
         else:
-            datetimes = [datetime.fromisoformat(line) for line in lines]
-            max_ert = max(datetimes)
+            max_ert = datetime.fromisoformat(max_ert_value.decode("utf-8"))
 
             logger.debug(f"Max ERT: {max_ert}")
 
@@ -133,9 +187,10 @@ class WebPODA:
         logger.debug(f"Downloading from: {url}")
 
         try:
-            response: requests.Response = requests.get(
+            response: requests.Response = self.__get_session().get(
                 url,
                 headers=headers,
+                stream=True,
             )
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
@@ -143,3 +198,14 @@ class WebPODA:
             raise
 
         return response
+
+    def __get_session(self) -> requests.Session:
+        """Session for the current thread."""
+
+        session: requests.Session | None = getattr(self.__sessions, "session", None)
+
+        if session is None:
+            session = requests.Session()
+            self.__sessions.session = session
+
+        return session
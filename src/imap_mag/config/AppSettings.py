@@ -25,7 +25,9 @@ from imap_mag.config.FetchConfig import (
 )
 from imap_mag.config.NestedAliasEnvSettingsSource import NestedAliasEnvSettingsSource
 from imap_mag.config.PostgresUploadConfig import PostgresUploadConfig
+from imap_mag.config.ProcessConfig import ProcessConfig
 from imap_mag.config.PublishConfig import PublishConfig
+from imap_mag.config.PublishStrategy import PublishStrategy
 from imap_mag.config.QuicklookConfig import QuicklookConfig
 from imap_mag.config.UploadConfig import UploadConfig
 
@@ -53,8 +55,13 @@ class AppSettings(BaseSettings):
     data_store: Path
     packet_definition: Path
     disk_usage_threshold: float = 0.95
+    publish_strategy: PublishStrategy = PublishStrategy.Copy
     version_major: int = 1
 
+    # Look up versioned files in the database files table before searching the
+    # datastore. Only used by commands that have a database configured.
+    find_files_in_database: bool = False
+
     # SPICE kernel types to include when generating a metakernel. Shared by the
     # calibration applicator and the scripted L2 calibration.
     metakernel_file_types: list[str] = DEFAULT_METAKERNEL_FILE_TYPES
@@ -70,7 +77,7 @@ class AppSettings(BaseSettings):
     plot_ialirt: QuicklookConfig
     apply: CommandConfig
     calibrate: CalibrationCommandConfig = CalibrationCommandConfig()
-    process: CommandConfig
+    process: ProcessConfig
     publish: PublishConfig
     upload: UploadConfig
     postgres_upload: PostgresUploadConfig
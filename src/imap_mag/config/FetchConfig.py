@@ -1,3 +1,7 @@
+from datetime import timedelta
+
+from pydantic import Field
+
 from imap_mag.config.ApiSource import (
     IALiRTApiSource,
     SdcApiSource,
@@ -12,6 +16,21 @@ class FetchBinaryConfig(CommandConfig):
     api: WebPodaApiSource
     publish_to_data_store: bool = True
 
+    # Maximum number of packets downloaded from WebPODA at the same time when
+    # polling HK. Keep low to respect WebPODA rate limits.
+    max_concurrent_downloads: int = Field(default=1, ge=1)
+
+    # Windows longer than this are downloaded from WebPODA in consecutive
+    # slices (e.g. P1D or PT6H), so that a failed download can be resumed.
+    # None downloads the whole window in one request.
+    download_slice_duration: timedelta | None = None
+    max_concurrent_slice_downloads: int = Field(default=1, ge=1)
+
+    # ERT slices left over from a failed download are reused only if they were
+    # downloaded at least this long after the end of their window.
+    download_slice_settling_time: timedelta = timedelta(hours=1)
+    download_retries: int = Field(default=0, ge=0)
+
 
 class FetchIALiRTConfig(CommandConfig):
     api: IALiRTApiSource
@@ -22,6 +41,11 @@ class FetchScienceConfig(CommandConfig):
     api: SdcApiSource
     publish_to_data_store: bool = True
 
+    # Maximum number of CDF files downloaded from the SDC at the same time.
+    # Downloads failing with transient errors are retried individually.
+    max_concurrent_downloads: int = Field(default=1, ge=1)
+    download_retries: int = Field(default=0, ge=0)
+
 
 class FetchSpiceConfig(CommandConfig):
     api: SdcApiSource
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class HKOutputFormat(StrEnum):
+    CSV = "csv"
+    Parquet = "parquet"
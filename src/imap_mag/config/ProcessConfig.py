@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from pydantic import Field
+
+from imap_mag.config.CommandConfig import CommandConfig
+from imap_mag.config.HKOutputFormat import HKOutputFormat
+
+
+class ProcessConfig(CommandConfig):
+    # Folder for the incremental HK merge cache. If not set, each HK day file is
+    # rebuilt by re-decoding all L0 files for that day in the datastore.
+    hk_merge_cache: Path | None = None
+
+    # Number of worker processes used to decode HK files, one task per file and
+    # subsystem. 1 decodes in the current process; None uses all CPUs.
+    hk_decode_workers: int | None = Field(default=1, ge=1)
+
+    # File format of decoded HK day files. Parquet files are smaller and can be
+    # read without parsing, but are not human-readable.
+    hk_output_format: HKOutputFormat = HKOutputFormat.CSV
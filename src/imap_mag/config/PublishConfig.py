@@ -1,6 +1,13 @@
+from pydantic import Field
+
 from imap_mag.config.ApiSource import SdcApiSource
 from imap_mag.config.CommandConfig import CommandConfig
 
 
 class PublishConfig(CommandConfig):
     api: SdcApiSource
+
+    # Maximum number of files uploaded to the SDC at the same time.
+    # Uploads failing with transient errors are retried individually.
+    max_concurrent_uploads: int = Field(default=1, ge=1)
+    upload_retries: int = Field(default=0, ge=0)
@@ -0,0 +1,13 @@
+from enum import StrEnum
+
+
+class PublishStrategy(StrEnum):
+    """How files are published into the datastore."""
+
+    # Copy the file through user space.
+    Copy = "copy"
+    # Clone the file (reflink or in-kernel copy) if supported, or copy it otherwise.
+    Clone = "clone"
+    # Move the file if on the same file system, or clone it otherwise.
+    # The source file is removed.
+    Move = "move"
@@ -9,8 +9,11 @@ from imap_mag.config.CommandConfig import CommandConfig
 from imap_mag.config.DatastoreSaveOption import DatastoreSaveOption
 from imap_mag.config.FetchConfig import FetchBinaryConfig, FetchScienceConfig
 from imap_mag.config.FetchMode import FetchMode
+from imap_mag.config.HKOutputFormat import HKOutputFormat
 from imap_mag.config.NestedAliasEnvSettingsSource import NestedAliasEnvSettingsSource
+from imap_mag.config.ProcessConfig import ProcessConfig
 from imap_mag.config.PublishConfig import PublishConfig
+from imap_mag.config.PublishStrategy import PublishStrategy
 from imap_mag.config.SaveMode import SaveMode
 from mag_toolkit.calibration.CalibrationConfig import (
     CalibrationConfig,
@@ -30,8 +33,11 @@ __all__ = [
     "FetchMode",
     "FetchScienceConfig",
     "GradiometryConfig",
+    "HKOutputFormat",
     "NestedAliasEnvSettingsSource",
+    "ProcessConfig",
     "PublishConfig",
+    "PublishStrategy",
     "SaveMode",
     "ScriptedL2CalibrationConfig",
     "SdcApiSource",
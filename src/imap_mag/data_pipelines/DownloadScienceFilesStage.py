@@ -0,0 +1,136 @@
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+from imap_mag.client.SDCDataAccess import SDCDataAccess
+from imap_mag.config.AppSettings import AppSettings
+from imap_mag.data_pipelines import Record, Stage
+from imap_mag.data_pipelines.Record import ScienceFileRecord
+from imap_mag.download.FetchScience import FetchScience
+from imap_mag.io.file import SciencePathHandler
+from imap_mag.util import MAGSensor, ReferenceFrame, ScienceLevel, ScienceMode
+
+
+class DownloadScienceFilesStage(Stage):
+    """Downloads science files from the SDC and passes each one on in order of
+    ingestion date, as soon as it and all files ingested before it are available.
+
+    Downloads run in the background and feed a bounded queue, so that later stages
+    work on downloaded files while the next ones are still downloading, without
+    downloads getting too far ahead of them. Files that `find_existing_files` (if
+    given) finds already exist are not downloaded, and are passed on as published.
+    """
+
+    MAX_QUEUED_FILES: int = 10
+
+    def __init__(
+        self,
+        client: SDCDataAccess,
+        settings: AppSettings,
+        level: ScienceLevel,
+        modes: list[ScienceMode] | None = None,
+        sensors: list[MAGSensor] | None = None,
+        reference_frames: list[ReferenceFrame] | None = None,
+        use_ingestion_date: bool = False,
+        version_str_or_latest: str | None = None,
+        max_downloads: int | None = None,
+        find_existing_files: Callable[[list[SciencePathHandler]], list[Path | None]]
+        | None = None,
+    ):
+        super().__init__()
+        self.client = client
+        self.settings = settings
+        self.level = level
+        self.modes = modes
+        self.sensors = sensors
+        self.reference_frames = reference_frames
+        self.use_ingestion_date = use_ingestion_date
+        self.version_str_or_latest = version_str_or_latest
+        self.max_downloads = max_downloads
+        self.find_existing_files = find_existing_files
+
+    async def process(self, item: Record, context: dict, **kwargs):
+        if not item or not item.start_date or not item.end_date:
+            raise ValueError(
+                "DownloadScienceFilesStage requires a Record with start_date and end_date"
+            )
+
+        fetch_science = FetchScience(
+            self.client,
+            max_concurrent_downloads=self.settings.fetch_science.max_concurrent_downloads,
+            retries=self.settings.fetch_science.download_retries,
+        )
+
+        loop = asyncio.get_running_loop()
+        files: asyncio.Queue[ScienceFileRecord | None] = asyncio.Queue(
+            maxsize=self.MAX_QUEUED_FILES
+        )
+
+        # puts from the download thread that are waiting for room in the queue, so
+        # that they can be cancelled if files are no longer being taken from it
+        waiting_puts: set[asyncio.Task] = set()
+        stopped = False
+
+        async def put_in_queue(record: ScienceFileRecord | None) -> None:
+            if stopped:
+                raise asyncio.CancelledError("Science file downloads stopped.")
+
+            task = asyncio.current_task()
+            assert task is not None
+
+            waiting_puts.add(task)
+            try:
+                await files.put(record)
+            finally:
+                waiting_puts.discard(task)
+
+        def put(record: ScienceFileRecord | None) -> None:
+            # blocks the download thread until there is room in the queue
+            asyncio.run_coroutine_threadsafe(put_in_queue(record), loop).result()
+
+        def download() -> dict[Path, SciencePathHandler]:
+            try:
+                return fetch_science.download_science(
+                    level=self.level,
+                    start_date=item.start_date,
+                    end_date=item.end_date,
+                    reference_frames=self.reference_frames,
+                    modes=self.modes,
+                    sensors=self.sensors,
+                    use_ingestion_date=self.use_ingestion_date,
+                    max_downloads=self.max_downloads,
+                    version_str_or_latest=self.version_str_or_latest,
+                    on_downloaded=lambda file, path_handler: put(
+                        ScienceFileRecord(file, path_handler)
+                    ),
+                    find_existing_files=self.find_existing_files,
+                    on_existing=lambda file, path_handler: put(
+                        ScienceFileRecord(file, path_handler, is_published=True)
+                    ),
+                )
+            finally:
+                put(None)
+
+        download_task = asyncio.ensure_future(asyncio.to_thread(download))
+
+        try:
+            while (record := await files.get()) is not None:
+                await self.publish_next(record, context, **kwargs)
+        except BaseException:
+            # stop downloading by cancelling any waiting and further puts, and wait
+            # for the downloads in progress to finish
+            stopped = True
+            for waiting_put in waiting_puts:
+                waiting_put.cancel()
+
+            await asyncio.gather(download_task, return_exceptions=True)
+            raise
+
+        downloaded = await download_task
+
+        self.logger.info(f"Downloaded {len(downloaded)} science files.")
+
+        if self.max_downloads is not None and len(downloaded) >= self.max_downloads:
+            self.logger.warning(
+                f"Downloaded {self.max_downloads} or more files in this run. Stopping to avoid excessive downloads."
+            )
@@ -1,3 +1,5 @@
+import asyncio
+from datetime import datetime
 from pathlib import Path
 
 from imap_mag.config.AppSettings import AppSettings
@@ -5,6 +7,7 @@ from imap_mag.data_pipelines import FileRecord, Record, Stage
 from imap_mag.db import Database
 from imap_mag.io import FilePathHandlerSelector
 from imap_mag.io.DatastoreFileManager import DatastoreFileManager
+from imap_mag.io.file import IFilePathHandler
 
 
 class PublishFileToDatastoreStage(Stage):
@@ -25,6 +28,7 @@ class PublishFileToDatastoreStage(Stage):
             database=self.database,
         )
         self.files_saved = 0
+        self.pending_files: list[tuple[Path, IFilePathHandler, datetime, dict]] = []
 
     async def process(self, item: Record, context: dict, **kwargs):
 
@@ -53,12 +57,29 @@ class PublishFileToDatastoreStage(Stage):
                 f"Could not determine content date for file {file_path}, cannot publish to datastore"
             )
 
-        saved_path, _, _ = self.datastore_manager.add_file(file_path, path_handler)
-
-        self.files_saved += 1
-        await self.publish_next(FileRecord(saved_path, content_date), context, **kwargs)
+        # files are published together once all items have been received
+        self.pending_files.append((file_path, path_handler, content_date, kwargs))
 
     async def stage_completed(self, context: dict):
+        if self.enabled and self.pending_files and not self.is_completed:
+            pending_files, self.pending_files = self.pending_files, []
+
+            saved_files = await asyncio.to_thread(
+                self.datastore_manager.add_files,
+                [
+                    (file_path, path_handler)
+                    for file_path, path_handler, _, _ in pending_files
+                ],
+            )
+            self.files_saved += len(saved_files)
+
+            for (saved_path, _, _), (_, _, content_date, kwargs) in zip(
+                saved_files, pending_files, strict=True
+            ):
+                await self.publish_next(
+                    FileRecord(saved_path, content_date), context, **kwargs
+                )
+
         if self.enabled and self.files_saved > 0:
             self.logger.info(
                 f"Publish files complete, {self.files_saved} files saved to datastore."
@@ -0,0 +1,118 @@
+import asyncio
+from collections import deque
+from pathlib import Path
+
+from imap_mag.data_pipelines import PROGRESS_DATE_CONTEXT_KEY, FileRecord, Record, Stage
+from imap_mag.data_pipelines.Record import ScienceFileRecord
+from imap_mag.io import IDatastoreFileManager
+
+
+class PublishScienceFilesStage(Stage):
+    """Publishes downloaded science files to the datastore concurrently, passing them
+    on in the order they were received, with their ingestion date as progress.
+
+    As files are passed on in order, progress saved by a later stage is a
+    watermark: all files received before the one it was saved for have been
+    published, even if a later file fails.
+
+    Files for the same destination folder are published one at a time, in the
+    order they were received, as versions are assigned from the files already in
+    that folder (see `IDatastoreFileManager.add_files`).
+    """
+
+    def __init__(
+        self,
+        datastore_manager: IDatastoreFileManager | None,
+        allow_overwrite: bool = False,
+        max_concurrent_publishes: int = IDatastoreFileManager.MAX_PUBLISH_WORKERS,
+    ):
+        super().__init__()
+        self.datastore_manager = datastore_manager
+        self.allow_overwrite = allow_overwrite
+        self.max_concurrent_publishes = max(1, max_concurrent_publishes)
+
+        self.files_saved = 0
+        self.folder_locks: dict[str, asyncio.Lock] = dict()
+        self.pending_files: deque[
+            tuple[ScienceFileRecord, asyncio.Future[Path], dict]
+        ] = deque()
+
+    async def process(self, item: Record, context: dict, **kwargs):
+        if not isinstance(item, ScienceFileRecord):
+            raise ValueError(
+                "PublishScienceFilesStage expects items to be ScienceFileRecords"
+            )
+
+        self.pending_files.append(
+            (item, asyncio.ensure_future(self.__publish(item)), kwargs)
+        )
+
+        await self.__publish_next_completed(context, wait_for_all=False)
+
+    async def stage_completed(self, context: dict):
+        if not self.is_completed:
+            await self.__publish_next_completed(context, wait_for_all=True)
+
+        if self.files_saved > 0:
+            self.logger.info(
+                f"Publish files complete, {self.files_saved} files saved to datastore."
+            )
+
+        await super().stage_completed(context)
+
+    async def __publish(self, record: ScienceFileRecord) -> Path:
+        if record.is_published or self.datastore_manager is None:
+            return record.file_path
+
+        path_handler = record.path_handler
+
+        if self.allow_overwrite:
+            path_handler.allow_overwrite = True
+            # version_is_locked deliberately kept True — SDC science file versions must
+            # never be reassigned, only the file bytes are overwritten in place.
+
+        folder_lock = self.folder_locks.setdefault(
+            path_handler.get_folder_structure(), asyncio.Lock()
+        )
+
+        async with folder_lock:
+            (output_file, _, _) = await asyncio.to_thread(
+                self.datastore_manager.add_file, record.file_path, path_handler
+            )
+        self.files_saved += 1
+
+        # Clean up work folder files as have been published to datastore
+        self.logger.debug(
+            f"Removing temporary file {record.file_path} from work folder."
+        )
+        record.file_path.unlink(missing_ok=True)
+
+        return output_file
+
+    async def __publish_next_completed(self, context: dict, wait_for_all: bool):
+        """Pass on published files in order, waiting for the oldest file while too
+        many are being published."""
+
+        try:
+            while self.pending_files and (
+                wait_for_all
+                or self.pending_files[0][1].done()
+                or len(self.pending_files) >= self.max_concurrent_publishes
+            ):
+                (record, publish, kwargs) = self.pending_files.popleft()
+                output_file = await publish
+
+                if record.ingestion_date is not None:
+                    context[PROGRESS_DATE_CONTEXT_KEY] = record.ingestion_date
+
+                await self.publish_next(
+                    FileRecord(output_file, record.content_date), context, **kwargs
+                )
+        except BaseException:
+            # wait for the other files being published before failing
+            await asyncio.gather(
+                *(publish for _, publish, _ in self.pending_files),
+                return_exceptions=True,
+            )
+            self.pending_files.clear()
+            raise
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from imap_mag.io.file import SciencePathHandler
+
 
 @dataclass
 class Record:
@@ -31,3 +33,17 @@ class FileRecord(Record):
     def __init__(self, file_path: Path, content_date: datetime):
         super().__init__(value=file_path.name, content_date=content_date)
         self.file_path = file_path
+
+
+class ScienceFileRecord(FileRecord):
+    def __init__(
+        self,
+        file_path: Path,
+        path_handler: SciencePathHandler,
+        is_published: bool = False,
+    ):
+        assert path_handler.content_date is not None
+        super().__init__(file_path, path_handler.content_date)
+        self.path_handler = path_handler
+        self.ingestion_date = path_handler.ingestion_date
+        self.is_published = is_published
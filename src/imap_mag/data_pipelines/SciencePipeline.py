@@ -0,0 +1,112 @@
+from imap_mag.cli.fetch.science import _validate_and_complete_parameters
+from imap_mag.client.SDCDataAccess import SDCDataAccess
+from imap_mag.config.AppSettings import AppSettings
+from imap_mag.config.DatastoreSaveOption import DatastoreSaveOption
+from imap_mag.data_pipelines import (
+    AutomaticRunParameters,
+    FetchByDatesRunParameters,
+    Pipeline,
+)
+from imap_mag.data_pipelines.DownloadScienceFilesStage import (
+    DownloadScienceFilesStage,
+)
+from imap_mag.data_pipelines.GetProcessingDatesStage import (
+    DateResolutionMode,
+    GetProcessingDatesStage,
+)
+from imap_mag.data_pipelines.PublishScienceFilesStage import PublishScienceFilesStage
+from imap_mag.data_pipelines.SaveProcessingDatesStage import SaveProcessingDatesStage
+from imap_mag.db import Database
+from imap_mag.io import DatastoreFileManager, IDatastoreFileManager
+from imap_mag.util import MAGSensor, ReferenceFrame, ScienceLevel, ScienceMode
+from imap_mag.util.DatetimeProvider import DatetimeProvider
+
+
+class SciencePipeline(Pipeline):
+    """Download science files from the SDC, publish them to the datastore and
+    update workflow progress, one file at a time rather than in batches."""
+
+    def __init__(
+        self,
+        database: Database | None,
+        settings: AppSettings,
+        client: SDCDataAccess,
+        progress_item_id: str,
+        level: ScienceLevel,
+        modes: list[ScienceMode] | None = None,
+        sensors: list[MAGSensor] | None = None,
+        reference_frames: list[ReferenceFrame] | None = None,
+        use_ingestion_date: bool = False,
+        update_progress: bool = True,
+        version_str_or_latest: str | None = None,
+        overwrite_option: DatastoreSaveOption = DatastoreSaveOption.FILE_OVERWRITES_BLOCKED,
+        skip_existing_files: bool = False,
+        max_downloads: int | None = None,
+        datetime_provider: DatetimeProvider = DatetimeProvider(),
+    ):
+        super().__init__(settings=settings, datetime_provider=datetime_provider)
+
+        self.initial_context = {"progress_item_name": progress_item_id}
+        self._database = database
+        self._client = client
+        self._level = level
+        (self._modes, self._sensors, self._reference_frames) = (
+            _validate_and_complete_parameters(level, modes, sensors, reference_frames)
+        )
+        self._use_ingestion_date = use_ingestion_date
+        self._update_progress = update_progress
+        self._version_str_or_latest = version_str_or_latest
+        self._overwrite_option = overwrite_option
+        self._skip_existing_files = skip_existing_files
+        self._max_downloads = max_downloads
+
+    def build(self, run_params: AutomaticRunParameters | FetchByDatesRunParameters):
+        datastore_manager: IDatastoreFileManager | None = None
+
+        if self._settings.fetch_science.publish_to_data_store:
+            datastore_manager = DatastoreFileManager.CreateByMode(
+                self._settings,
+                use_database=self._database is not None,
+                database=self._database,
+            )
+
+        allow_overwrite = (
+            self._overwrite_option == DatastoreSaveOption.FILE_OVERWRITES_ALLOWED
+        )
+
+        # progress is only read and saved when it is to be updated
+        progress_database = self._database if self._update_progress else None
+
+        super().build(
+            run_parameters=run_params,
+            stages=[
+                GetProcessingDatesStage(
+                    database=progress_database,
+                    date_resolution_mode=DateResolutionMode.EXACT_DATETIME,
+                    datetime_provider=self._datetime_provider,
+                ),
+                DownloadScienceFilesStage(
+                    client=self._client,
+                    settings=self._settings,
+                    level=self._level,
+                    modes=self._modes,
+                    sensors=self._sensors,
+                    reference_frames=self._reference_frames,
+                    use_ingestion_date=self._use_ingestion_date,
+                    version_str_or_latest=self._version_str_or_latest,
+                    max_downloads=self._max_downloads,
+                    # files already in the datastore at the same version are not
+                    # downloaded again, unless they are to be overwritten
+                    find_existing_files=datastore_manager.find_existing_files
+                    if datastore_manager is not None
+                    and self._skip_existing_files
+                    and not allow_overwrite
+                    else None,
+                ),
+                PublishScienceFilesStage(
+                    datastore_manager=datastore_manager,
+                    allow_overwrite=allow_overwrite,
+                ),
+                SaveProcessingDatesStage(database=progress_database),
+            ],
+        )
@@ -2,10 +2,11 @@ import functools
 import logging
 import os
 import threading
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import PurePosixPath
 from typing import ClassVar
 
-from sqlalchemy import create_engine, or_, select
+from sqlalchemy import create_engine, insert, or_, select
 from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -19,7 +20,12 @@ class Database:
 
     _engine_cache: ClassVar[dict[str, Engine]] = {}
     _engine_lock: ClassVar[threading.Lock] = threading.Lock()
-    __active_session: Session | None
+
+    UPSERT_BATCH_SIZE: ClassVar[int] = 1000
+
+    # The session of the innermost database operation running on each thread, so
+    # that threads sharing a Database each use their own session.
+    __thread_state: ClassVar[threading.local] = threading.local()
 
     def __init__(self, db_url=None):
         env_url = self.get_environment_url()
@@ -53,8 +59,9 @@ class Database:
             @functools.wraps(func)
             def inner_wrapper(self, *args, **kwargs):
                 session = self.session(**session_kwargs)
+                previous_session = getattr(Database.__thread_state, "session", None)
                 try:
-                    self.__active_session = session
+                    Database.__thread_state.session = session
                     value = func(self, *args, **kwargs)
 
                     if not readonly:
@@ -69,46 +76,98 @@ class Database:
                     raise e
                 finally:
                     session.close()
-                    self.__active_session = None
+                    Database.__thread_state.session = previous_session
 
             return inner_wrapper
 
         return outer_wrapper
 
     def __get_active_session(self) -> Session:
-        if self.__active_session is None:
+        session: Session | None = getattr(Database.__thread_state, "session", None)
+
+        if session is None:
             raise ValueError(
                 "No active session. Use decorator @__session_manager to create session."
             )
 
-        return self.__active_session
+        return session
 
     def upsert_file(self, file: File) -> None:
         """Insert a file into the database."""
         self.upsert_files([file])
 
+    def upsert_files(self, files: list[File], batch_size: int | None = None) -> None:
+        """Insert or update files in the database, committing in batches.
+
+        Existing records are fetched with one query per batch, and only updated if
+        `File.merge_record` reports a change. New records are inserted in bulk, and
+        their ids and server defaults are set on the given `File` objects, which
+        stay detached from any session.
+        """
+
+        batch_size = batch_size or self.UPSERT_BATCH_SIZE
+
+        for start in range(0, len(files), batch_size):
+            self.__upsert_files_batch(files[start : start + batch_size])
+
     @__session_manager()
-    def upsert_files(self, files: list[File]) -> None:
+    def __upsert_files_batch(self, files: list[File]) -> None:
         session = self.__get_active_session()
-        for file in files:
-            # check file does not already exist if this is a new file record (id is none)
-            if file.id is None or file.id == 0:
-                existing_file = (
-                    session.query(File)
-                    .filter_by(name=file.name, path=file.path)
-                    .first()
+
+        # find existing records for new file records (id is none) in one query
+        new_paths = {file.path for file in files if file.id is None or file.id == 0}
+        existing_files: dict[str, File] = dict()
+
+        if new_paths:
+            existing_files = {
+                file.path: file
+                for file in session.scalars(
+                    select(File).where(File.path.in_(new_paths))
                 )
-                if existing_file is not None:
-                    if not existing_file.merge_record(file):
-                        continue
+            }
 
-                    # otherwise we update the existing database record instead of adding a new one
-                    file = existing_file
+        files_to_insert: dict[str, File] = dict()
 
-                session.add(file)
+        for file in files:
+            if file.id is None or file.id == 0:
+                existing_file = existing_files.get(file.path) or files_to_insert.get(
+                    file.path
+                )
+                if existing_file is not None and existing_file.name == file.name:
+                    # update the existing database record instead of adding a new one
+                    existing_file.merge_record(file)
+                else:
+                    files_to_insert[file.path] = file
             else:
                 session.merge(file)
 
+        # insert new records in bulk, rather than through the unit of work
+        # and copy generated ids and server defaults back to the inserted files
+        columns = File.__table__.columns
+        files_by_columns: dict[tuple[str, ...], list[tuple[File, dict]]] = dict()
+
+        for file in files_to_insert.values():
+            row = {
+                column.key: value
+                for column in columns
+                if (value := getattr(file, column.key)) is not None
+            }
+            files_by_columns.setdefault(tuple(row.keys()), []).append((file, row))
+
+        for files_and_rows in files_by_columns.values():
+            inserted = session.execute(
+                insert(File).returning(*columns, sort_by_parameter_order=True),
+                [row for (_, row) in files_and_rows],
+            )
+
+            for (file, _), inserted_row in zip(files_and_rows, inserted, strict=True):
+                for column in columns:
+                    setattr(file, column.key, inserted_row._mapping[column])
+
+        logger.debug(
+            f"Upserted {len(files)} files, of which {len(files_to_insert)} are new."
+        )
+
     @__session_manager(expire_on_commit=False)
     def get_files(self, *args, **kwargs) -> list[File]:
         session = self.__get_active_session()
@@ -197,6 +256,12 @@ class Database:
         with self.session() as session:
             return list(session.execute(statement).scalars().all())
 
+    def get_active_file_sizes(self) -> dict[str, int]:
+        """Get the size of all files that have not been deleted, by path."""
+        statement = select(File.path, File.size).where(File.deletion_date.is_(None))
+        with self.session() as session:
+            return {path: size for path, size in session.execute(statement)}
+
     def get_files_by_path_pattern(self, pattern: str) -> list[File]:
         """Get all active files matching a path pattern (SQL LIKE pattern)."""
         statement = select(File).where(
@@ -206,6 +271,59 @@ class Database:
         with self.session() as session:
             return list(session.execute(statement).scalars().all())
 
+    def get_active_files_in_folder(self, folder: str) -> list[File]:
+        """Get all active files directly inside a datastore folder, from the highest to the lowest version."""
+
+        folder = folder.rstrip("/")
+
+        statement = (
+            select(File)
+            .where(
+                File.deletion_date.is_(None),
+                File.path.startswith(f"{folder}/", autoescape=True),
+            )
+            .order_by(File.version_major.desc(), File.version.desc())
+        )
+
+        logger.debug(f"Executing SQL statement: {statement}")
+
+        with self.session() as session:
+            files = list(session.execute(statement).scalars().all())
+
+        # Exclude files in subfolders.
+        return [
+            file
+            for file in files
+            if PurePosixPath(file.path).parent.as_posix() == folder
+        ]
+
+    def get_active_files_by_descriptor(
+        self,
+        descriptor: str,
+        content_date: datetime,
+        version_major: int | None = None,
+    ) -> list[File]:
+        """Get all active files of a type on the day of `content_date`, from the highest to the lowest version."""
+
+        day = content_date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        statement = select(File).where(
+            File.deletion_date.is_(None),
+            File.descriptor == descriptor,
+            File.content_date >= day,
+            File.content_date < day + timedelta(days=1),
+        )
+
+        if version_major is not None:
+            statement = statement.where(File.version_major == version_major)
+
+        statement = statement.order_by(File.version_major.desc(), File.version.desc())
+
+        logger.debug(f"Executing SQL statement: {statement}")
+
+        with self.session() as session:
+            return list(session.execute(statement).scalars().all())
+
     def get_active_files_matching_patterns(self, patterns: list[str]) -> list[File]:
         """Get all active files matching any of the given fnmatch patterns.
 
@@ -1,12 +1,17 @@
 """Program to retrieve and process MAG binary files."""
 
 import logging
-from datetime import date, datetime, timedelta
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
+import requests
+
 from imap_mag.client.WebPODA import WebPODA
 from imap_mag.io.file import HKBinaryPathHandler
 from imap_mag.util import CCSDSBinaryPacketFile, HKPacket
+from imap_mag.util.retry import call_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -15,14 +20,36 @@ class FetchBinary:
     """Manage WebPODA data."""
 
     __web_poda: WebPODA
+    __slice_duration: timedelta | None
+    __max_concurrent_slices: int
+    __slice_settling_time: timedelta
+    __retries: int
+    __retry_delay_seconds: float
 
     def __init__(
         self,
         web_poda: WebPODA,
+        slice_duration: timedelta | None = None,
+        max_concurrent_slices: int = 1,
+        slice_settling_time: timedelta = timedelta(hours=1),
+        retries: int = 0,
+        retry_delay_seconds: float = 5,
     ) -> None:
-        """Initialize WebPODA interface."""
+        """Initialize WebPODA interface.
+
+        Windows longer than `slice_duration` are downloaded as consecutive
+        slices, up to `max_concurrent_slices` at a time, each retried up to
+        `retries` times. ERT slices left over from a failed download are only
+        reused if they were downloaded at least `slice_settling_time` after the
+        end of their window, so that packets still in transit are not missed.
+        """
 
         self.__web_poda = web_poda
+        self.__slice_duration = slice_duration
+        self.__max_concurrent_slices = max_concurrent_slices
+        self.__slice_settling_time = slice_settling_time
+        self.__retries = retries
+        self.__retry_delay_seconds = retry_delay_seconds
 
     def download_binaries(
         self,
@@ -44,13 +71,23 @@ class FetchBinary:
         elif end_date.time() == datetime.min.time():
             end_date = end_date + timedelta(days=1)
 
-        # Download data as a whole.
-        file = self.__web_poda.download(
-            packet=packet.packet_name,
-            start_date=start_date,
-            end_date=end_date,
-            ert=use_ert,
-        )
+        if (self.__slice_duration is None) or (
+            end_date - start_date <= self.__slice_duration
+        ):
+            # Download data as a whole.
+            file = self.__download_with_retry(
+                packet=packet.packet_name,
+                start_date=start_date,
+                end_date=end_date,
+                ert=use_ert,
+            )
+        else:
+            file = self.__download_in_slices(
+                packet=packet.packet_name,
+                start_date=start_date,
+                end_date=end_date,
+                ert=use_ert,
+            )
 
         if file.stat().st_size == 0:
             logger.debug(f"Downloaded file {file} is empty and will not be used.")
@@ -92,3 +129,98 @@ class FetchBinary:
             )
 
         return downloaded
+
+    def __download_in_slices(
+        self,
+        *,
+        packet: str,
+        start_date: datetime,
+        end_date: datetime,
+        ert: bool,
+    ) -> Path:
+        """Download data in consecutive time slices and stitch them together.
+
+        Slices are concatenated in time order, so the packets in the stitched
+        file are in the same order as in a single download of the whole window.
+        When downloading by ERT, slices left in the work folder by a previous,
+        failed download are reused if they were downloaded long enough after the
+        end of their window for all data received in that window to have reached
+        WebPODA. Data for a window of measurement time can still arrive later, so
+        slices are always downloaded again otherwise.
+        """
+
+        assert self.__slice_duration is not None
+
+        slices: list[tuple[datetime, datetime]] = []
+        slice_start = start_date
+
+        while slice_start < end_date:
+            slice_end = min(slice_start + self.__slice_duration, end_date)
+            slices.append((slice_start, slice_end))
+            slice_start = slice_end
+
+        logger.info(
+            f"Downloading {packet} from {start_date} to {end_date} in {len(slices)} slices."
+        )
+
+        def download_slice(slice_dates: tuple[datetime, datetime]) -> Path:
+            (slice_start, slice_end) = slice_dates
+
+            slice_file = self.__web_poda.get_download_path(
+                packet=packet, start_date=slice_start, end_date=slice_end
+            )
+
+            if (
+                ert
+                and slice_file.exists()
+                and datetime.fromtimestamp(slice_file.stat().st_mtime, UTC).replace(
+                    tzinfo=None
+                )
+                > slice_end + self.__slice_settling_time
+            ):
+                logger.debug(f"Reusing previously downloaded slice {slice_file}.")
+                return slice_file
+
+            return self.__download_with_retry(
+                packet=packet, start_date=slice_start, end_date=slice_end, ert=ert
+            )
+
+        with ThreadPoolExecutor(max_workers=self.__max_concurrent_slices) as executor:
+            slice_files: list[Path] = list(executor.map(download_slice, slices))
+
+        file = self.__web_poda.get_download_path(
+            packet=packet, start_date=start_date, end_date=end_date
+        )
+
+        with open(file, "wb") as f:
+            for slice_file in slice_files:
+                with open(slice_file, "rb") as s:
+                    shutil.copyfileobj(s, f)
+
+        for slice_file in slice_files:
+            slice_file.unlink()
+
+        return file
+
+    def __download_with_retry(
+        self,
+        *,
+        packet: str,
+        start_date: datetime,
+        end_date: datetime,
+        ert: bool,
+    ) -> Path:
+        """Download data from WebPODA, retrying on request errors."""
+
+        return call_with_retry(
+            lambda: self.__web_poda.download(
+                packet=packet,
+                start_date=start_date,
+                end_date=end_date,
+                ert=ert,
+            ),
+            retries=self.__retries,
+            delay_seconds=self.__retry_delay_seconds,
+            is_retryable=lambda e: isinstance(e, requests.exceptions.RequestException),
+            description=f"Download of {packet} from {start_date} to {end_date}",
+        )
@@ -13,6 +13,7 @@ from imap_mag.io import FileFinder
 from imap_mag.io.file import IALiRTPathHandler
 from imap_mag.process import get_packet_definition_folder
 from imap_mag.util.constants import CONSTANTS
+from imap_mag.util.tabularFile import read_tabular_file
 
 logger = logging.getLogger(__name__)
 
@@ -158,7 +159,7 @@ class FetchIALiRT:
                     logger.debug(
                         f"File for {content_date.strftime('%Y-%m-%d')} already exists: {file_path.as_posix()}. Appending new data."
                     )
-                    existing_data = pd.read_csv(file_path)
+                    existing_data = read_tabular_file(file_path)
                 else:
                     logger.debug(
                         f"Creating new file for {content_date.strftime('%Y-%m-%d')}."
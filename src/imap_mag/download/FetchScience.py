@@ -1,12 +1,16 @@
 """Program to retrieve and process MAG CDF files."""
 
 import logging
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from imap_mag.client.SDCDataAccess import SDCDataAccess
 from imap_mag.io.file import SciencePathHandler
 from imap_mag.util import MAGSensor, ReferenceFrame, ScienceLevel, ScienceMode
+from imap_mag.util.retry import call_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +18,30 @@ logger = logging.getLogger(__name__)
 class FetchScience:
     """Download MAG science data from the SDC."""
 
+    MAX_CONCURRENT_QUERIES: int = 10
+
     __data_access: SDCDataAccess
+    __max_concurrent_downloads: int
+    __retries: int
+    __retry_delay_seconds: float
 
     def __init__(
         self,
         data_access: SDCDataAccess,
+        max_concurrent_downloads: int = 1,
+        retries: int = 0,
+        retry_delay_seconds: float = 5,
     ) -> None:
+        """Initialize SDC interface.
+
+        Files are downloaded up to `max_concurrent_downloads` at a time, each
+        retried up to `retries` times on transient errors.
+        """
+
         self.__data_access = data_access
+        self.__max_concurrent_downloads = max_concurrent_downloads
+        self.__retries = retries
+        self.__retry_delay_seconds = retry_delay_seconds
 
     def download_science(
         self,
@@ -35,11 +56,24 @@ class FetchScience:
         skip_items_count: int = 0,
         # vMMM.mmmm or the deprecated minor-only vXXX or latest
         version_str_or_latest: str | None = None,
+        on_downloaded: Callable[[Path, SciencePathHandler], None] | None = None,
+        find_existing_files: Callable[[list[SciencePathHandler]], list[Path | None]]
+        | None = None,
+        on_existing: Callable[[Path, SciencePathHandler], None] | None = None,
     ) -> dict[Path, SciencePathHandler]:
-        """Retrieve SDC data."""
+        """Retrieve SDC data.
+
+        Files for all descriptors are downloaded concurrently, but handled in order
+        of ingestion date: each downloaded file is passed to `on_downloaded` (if
+        given) once it and all files ingested before it have been downloaded.
+
+        Files that `find_existing_files` (if given) finds already exist are not
+        downloaded, and are returned at their existing path instead, and passed to
+        `on_existing` (if given) in the same order. They still count towards
+        `max_downloads`, so that batches skip the same items.
+        """
 
         downloaded: dict[Path, SciencePathHandler] = dict()
-        max_downloads_reached = False
 
         if max_downloads is not None and max_downloads <= 0:
             raise ValueError("max_downloads must be greater than zero or None")
@@ -52,77 +86,181 @@ class FetchScience:
             "ingestion_end_date" if use_ingestion_date else "end_date": end_date,
         }
 
-        for descriptor in self.get_descriptors(
-            level=level, modes=modes, sensors=sensors, reference_frames=reference_frames
-        ):
-            if max_downloads_reached:
-                break
-
-            file_details = self.__data_access.query_sdc_files(
-                level=level.value,
-                descriptor=descriptor,
-                extension="cdf",
-                version=version_str_or_latest,
-                **dates,  # type: ignore
-            )
+        def max_downloads_reached() -> bool:
+            return max_downloads is not None and len(downloaded) >= max_downloads
+
+        descriptors = self.get_descriptors(
+            level=level,
+            modes=modes,
+            sensors=sensors,
+            reference_frames=reference_frames,
+        )
+
+        # query all descriptors concurrently
+        with ThreadPoolExecutor(
+            max_workers=min(len(descriptors), self.MAX_CONCURRENT_QUERIES)
+        ) as query_executor:
+            queries: list[Future[list[dict[str, str]] | None]] = [
+                query_executor.submit(
+                    self.__data_access.query_sdc_files,
+                    level=level.value,
+                    descriptor=descriptor,
+                    extension="cdf",
+                    version=version_str_or_latest,
+                    **dates,  # type: ignore
+                )
+                for descriptor in descriptors
+            ]
+            file_details: list[dict[str, str]] = [
+                file for query in queries for file in (query.result() or [])
+            ]
+
+        # sort by ingestion date across all descriptors to ensure we process in
+        # chronological order
+        file_details.sort(
+            key=lambda x: datetime.strptime(x["ingestion_date"], "%Y%m%d %H:%M:%S")
+        )
 
-            # sort by ingestion date to ensure we process in cronological order
-            file_details = sorted(
-                file_details,
-                key=lambda x: datetime.strptime(x["ingestion_date"], "%Y%m%d %H:%M:%S"),
+        for file in file_details[:skip_items_count]:
+            logger.debug(
+                f"Skipping file {file['file_path']} as part of skip_items_count."
             )
 
-            for file in file_details if file_details else []:
-                if skip_items_count > 0:
-                    skip_items_count -= 1
-                    logger.debug(
-                        f"Skipping file {file['file_path']} as part of skip_items_count."
+        files_to_download = file_details[skip_items_count:]
+        path_handlers = [
+            self.__create_path_handler(level, file) for file in files_to_download
+        ]
+        existing_files: list[Path | None] = (
+            find_existing_files(path_handlers)
+            if find_existing_files and path_handlers
+            else [None] * len(path_handlers)
+        )
+
+        next_files = iter(
+            zip(files_to_download, path_handlers, existing_files, strict=True)
+        )
+        pending: deque[
+            tuple[
+                dict[str, str],
+                SciencePathHandler,
+                Path | None,
+                Future[Path] | None,
+            ]
+        ] = deque()
+
+        with ThreadPoolExecutor(
+            max_workers=self.__max_concurrent_downloads
+        ) as executor:
+
+            def download_next_files() -> None:
+                # only download as many files ahead as could still be needed
+                max_pending = self.__max_concurrent_downloads
+
+                if max_downloads is not None:
+                    max_pending = min(max_pending, max_downloads - len(downloaded))
+
+                while len(pending) < max_pending:
+                    next_file = next(next_files, None)
+
+                    if next_file is None:
+                        break
+
+                    (file, path_handler, existing_file) = next_file
+                    pending.append(
+                        (
+                            file,
+                            path_handler,
+                            existing_file,
+                            executor.submit(
+                                self.__download_with_retry, file["file_path"]
+                            )
+                            if existing_file is None
+                            else None,
+                        )
+                    )
+
+            download_next_files()
+
+            while pending:
+                file, path_handler, existing_file, future = pending.popleft()
+
+                if existing_file is not None:
+                    logger.info(
+                        f"File {file['file_path']} already exists at {existing_file}. Skipping download."
                     )
-                    continue
+                    downloaded[existing_file] = path_handler
+
+                    if on_existing is not None:
+                        on_existing(existing_file, path_handler)
+                else:
+                    assert future is not None
+                    downloaded_file = future.result()
 
-                downloaded_file = self.__data_access.download(file["file_path"])
+                    if downloaded_file.stat().st_size == 0:
+                        logger.debug(
+                            f"Downloaded file {downloaded_file} is empty and will not be used."
+                        )
+                        download_next_files()
+                        continue
 
-                if downloaded_file.stat().st_size > 0:
                     logger.info(
                         f"Downloaded file from SDC Data Access: {downloaded_file}"
                     )
+                    downloaded[downloaded_file] = path_handler
 
-                    version_str = file["version"].lstrip("v")
-                    if "." in version_str:
-                        parts = version_str.split(".", 1)
-                        version_major = int(parts[0])
-                        version = int(parts[1])
-                    else:
-                        version_major = 1  # legacy: treat as major 1
-                        version = int(version_str)
-                    downloaded[downloaded_file] = SciencePathHandler(
-                        level=level.value,
-                        descriptor=file["descriptor"],
-                        content_date=datetime.strptime(file["start_date"], "%Y%m%d"),
-                        ingestion_date=datetime.strptime(
-                            file["ingestion_date"], "%Y%m%d %H:%M:%S"
-                        ),
-                        version=version,
-                        version_major=version_major,
-                        has_major_version=("." in file["version"].lstrip("v")),
-                        extension="cdf",
-                        version_is_locked=True,  # lock version for files downloaded from SDC as they should not be changed
-                    )
-                    max_downloads_reached = (
-                        max_downloads is not None and len(downloaded) >= max_downloads
-                    )
-                    if max_downloads_reached:
-                        logger.info(
-                            f"Reached current batch limit of downloads ({max_downloads})"
-                        )
-                        break
-                else:
-                    logger.debug(
-                        f"Downloaded file {downloaded_file} is empty and will not be used."
+                    if on_downloaded is not None:
+                        on_downloaded(downloaded_file, path_handler)
+
+                if max_downloads_reached():
+                    logger.info(
+                        f"Reached current batch limit of downloads ({max_downloads})"
                     )
+                    break
+
+                download_next_files()
+
+            for _, _, _, future in pending:
+                if future is not None:
+                    future.cancel()
 
         return downloaded
 
+    @staticmethod
+    def __create_path_handler(
+        level: ScienceLevel, file: dict[str, str]
+    ) -> SciencePathHandler:
+        version_str = file["version"].lstrip("v")
+        if "." in version_str:
+            parts = version_str.split(".", 1)
+            version_major = int(parts[0])
+            version = int(parts[1])
+        else:
+            version_major = 1  # legacy: treat as major 1
+            version = int(version_str)
+
+        return SciencePathHandler(
+            level=level.value,
+            descriptor=file["descriptor"],
+            content_date=datetime.strptime(file["start_date"], "%Y%m%d"),
+            ingestion_date=datetime.strptime(file["ingestion_date"], "%Y%m%d %H:%M:%S"),
+            version=version,
+            version_major=version_major,
+            has_major_version=("." in file["version"].lstrip("v")),
+            extension="cdf",
+            version_is_locked=True,  # lock version for files downloaded from SDC as they should not be changed
+        )
+
+    def __download_with_retry(self, file_path: str) -> Path:
+        """Download a file from the SDC, retrying on transient errors."""
+
+        return call_with_retry(
+            lambda: self.__data_access.download(file_path),
+            retries=self.__retries,
+            delay_seconds=self.__retry_delay_seconds,
+            is_retryable=SDCDataAccess.is_transient_error,
+            description=f"Download of {file_path}",
+        )
+
     def get_descriptors(
         self,
         level: ScienceLevel | None,
@@ -1,11 +1,13 @@
 import logging
+import os
 import re
 import shutil
+import typing
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
 from pathlib import Path
 
-from sqlalchemy.sql import text
-
 from imap_db.model import File
 from imap_mag.config.AppSettings import AppSettings
 from imap_mag.db import Database
@@ -70,27 +72,271 @@ class DBIndexedDatastoreFileManager(IDatastoreFileManager):
         else:
             actual_source = original_file
 
-        (destination_file, path_handler, overwritten) = self.__file_manager.add_file(
-            actual_source, path_handler
+        backups: dict[Path, Path] = self.__back_up_destinations([path_handler])
+
+        try:
+            (destination_file, path_handler, overwritten) = (
+                self.__file_manager.add_file(actual_source, path_handler)
+            )
+
+            # Add file to database
+            if skip_database_insertion and not overwritten:
+                logger.info(
+                    f"File {destination_file} already exists in database with same hash. Skipping database update."
+                )
+            else:
+                logger.info(f"Upserting {destination_file} into database.")
+
+                try:
+                    new_file = self.__create_file_record(destination_file, path_handler)
+                    self.__database.upsert_file(new_file)
+                except Exception as e:
+                    logger.error(
+                        f"Error inserting {destination_file} into database: {e}"
+                    )
+                    self.__roll_back([(original_file, destination_file)], backups)
+                    raise e
+        finally:
+            self.__remove_backups(backups)
+
+        return (destination_file, path_handler, overwritten)
+
+    def add_files(
+        self,
+        files: list[tuple[Path, T]],
+        max_workers: int = IDatastoreFileManager.MAX_PUBLISH_WORKERS,
+    ) -> list[tuple[Path, T, bool]]:
+        """Add several files to output location and database, all or nothing.
+
+        Versions for the whole batch are resolved against one database query per
+        destination folder, files are published concurrently, and all database
+        records are written in a single transaction. If any file cannot be
+        published, or the records cannot be written, the newly published files are
+        removed again, any files they overwrote are restored, and the error is raised.
+        """
+
+        if not files:
+            return []
+
+        folder_files: dict[str, list[File]] = dict()
+        conflicting_files: list[File] = []
+        sources: list[tuple[Path, T]] = []
+        skip_database_insertion: list[bool] = []
+
+        for original_file, path_handler in files:
+            if not original_file.exists():
+                logger.error(f"File {original_file} does not exist.")
+                raise FileNotFoundError(f"File {original_file} does not exist.")
+
+            folder = path_handler.get_folder_structure()
+
+            if path_handler.supports_sequencing() and folder not in folder_files:
+                folder_files[folder] = self.__database.get_active_files_in_folder(
+                    folder
+                )
+
+            skip: bool = self.__get_next_available_version(
+                original_file,
+                path_handler,
+                folder_files.get(folder),
+                conflicting_files,
+            )
+
+            if not skip and path_handler.supports_sequencing():
+                # later files in the batch must see this version as taken, and not
+                # any versions it overrides
+                folder_files[folder] = [
+                    file for file in folder_files[folder] if file.deletion_date is None
+                ]
+                folder_files[folder].append(
+                    self.__create_pending_record(original_file, path_handler)
+                )
+
+            sources.append(
+                (
+                    original_file
+                    if skip
+                    else path_handler.prepare_for_version(original_file),
+                    path_handler,
+                )
+            )
+            skip_database_insertion.append(skip)
+
+        # files about to be overwritten are kept until the batch is recorded
+        backups: dict[Path, Path] = self.__back_up_destinations(
+            [path_handler for _, path_handler in sources]
         )
 
-        # Add file to database
-        if skip_database_insertion and not overwritten:
-            logger.info(
-                f"File {destination_file} already exists in database with same hash. Skipping database update."
+        try:
+            results = self.__publish_and_record_files(
+                files,
+                sources,
+                skip_database_insertion,
+                conflicting_files,
+                backups,
+                max_workers,
             )
-        else:
-            logger.info(f"Upserting {destination_file} into database.")
+        finally:
+            self.__remove_backups(backups)
+
+        for conflict in conflicting_files:
+            conflict.get_full_path(self.__settings).unlink(missing_ok=True)
+
+        return results
 
+    def __publish_and_record_files(
+        self,
+        files: list[tuple[Path, T]],
+        sources: list[tuple[Path, T]],
+        skip_database_insertion: list[bool],
+        conflicting_files: list[File],
+        backups: dict[Path, Path],
+        max_workers: int,
+    ) -> list[tuple[Path, T, bool]]:
+        """Publish the files with resolved versions, and write their records, rolling
+        back all published files if either fails."""
+
+        results = self._add_files_concurrently(
+            sources, self.__file_manager.add_file, max_workers
+        )
+
+        published: list[tuple[Path, Path]] = [
+            (original_file, result[0])
+            for (original_file, _), result, skip in zip(
+                files, results, skip_database_insertion, strict=True
+            )
+            if not isinstance(result, Exception) and (not skip or result[2])
+        ]
+        errors = [result for result in results if isinstance(result, Exception)]
+
+        if errors:
+            logger.error(
+                f"Failed to publish {len(errors)} of {len(files)} files. Removing the {len(published)} files already published."
+            )
+            self.__roll_back(published, backups)
+            raise errors[0]
+
+        files_to_insert: list[tuple[Path, IFilePathHandler]] = []
+
+        for (destination_file, path_handler, overwritten), skip in zip(
+            typing.cast(list[tuple[Path, T, bool]], results),
+            skip_database_insertion,
+            strict=True,
+        ):
+            if skip and not overwritten:
+                logger.info(
+                    f"File {destination_file} already exists in database with same hash. Skipping database update."
+                )
+            else:
+                logger.info(f"Upserting {destination_file} into database.")
+                files_to_insert.append((destination_file, path_handler))
+
+        records: list[File] = []
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                records = list(
+                    executor.map(
+                        lambda file_and_handler: self.__create_file_record(
+                            *file_and_handler
+                        ),
+                        files_to_insert,
+                    )
+                )
+
+            records.extend(conflicting_files)
+
+            if records:
+                self.__database.upsert_files(records, batch_size=len(records))
+        except Exception as e:
+            logger.error(f"Error inserting {len(records)} files into database: {e}")
+            self.__roll_back(published, backups)
+            raise e
+
+        return typing.cast(list[tuple[Path, T, bool]], results)
+
+    def __back_up_destinations(self, path_handlers: list[T]) -> dict[Path, Path]:
+        """Keep a hidden copy of each existing file at the destination of a path
+        handler, so that it can be restored if the file is overwritten and then
+        removed again. Returns the backup of each destination."""
+
+        backups: dict[Path, Path] = dict()
+
+        for path_handler in path_handlers:
+            destination_file = path_handler.get_full_path(self.__settings.data_store)
+
+            if destination_file in backups or not destination_file.exists():
+                continue
+
+            backup = (
+                destination_file.parent
+                / f".{destination_file.name}.{uuid.uuid4().hex}.bak"
+            )
             try:
-                new_file = self.__create_file_record(destination_file, path_handler)
-                self.__database.upsert_file(new_file)
-            except Exception as e:
-                logger.error(f"Error inserting {destination_file} into database: {e}")
-                destination_file.unlink()
-                raise e
+                os.link(destination_file, backup)
+            except OSError:
+                shutil.copy2(destination_file, backup)
 
-        return (destination_file, path_handler, overwritten)
+            backups[destination_file] = backup
+
+        return backups
+
+    @staticmethod
+    def __remove_backups(backups: dict[Path, Path]) -> None:
+        for backup in backups.values():
+            backup.unlink(missing_ok=True)
+
+    def __roll_back(
+        self, published: list[tuple[Path, Path]], backups: dict[Path, Path]
+    ) -> None:
+        """Remove published files, and restore the files they overwrote."""
+
+        for original_file, destination_file in published:
+            self.__unpublish_file(original_file, destination_file)
+
+        for destination_file, backup in backups.items():
+            logger.debug(f"Restoring {destination_file} as it was before publishing.")
+            os.replace(backup, destination_file)
+
+    @staticmethod
+    def __unpublish_file(original_file: Path, destination_file: Path) -> None:
+        """Remove a file published into the datastore, restoring it if it was moved."""
+
+        if original_file.exists():
+            destination_file.unlink()
+        else:
+            # the file was moved into the datastore, so move it back
+            shutil.move(destination_file, original_file)
+
+    def find_existing_files(self, path_handlers: list[T]) -> list[Path | None]:
+        """For each path handler, the path of the file already in the datastore and
+        active in the database at its path, or None if there is no such file.
+
+        All files are looked up in the database with one query."""
+
+        paths: list[str] = [
+            path_handler.get_full_path().as_posix() for path_handler in path_handlers
+        ]
+        active_paths: set[str] = (
+            {
+                file.path
+                for file in self.__database.get_files(
+                    File.path.in_(set(paths)), File.deletion_date.is_(None)
+                )
+            }
+            if paths
+            else set()
+        )
+
+        existing_files: list[Path | None] = []
+
+        for path, path_handler in zip(paths, path_handlers, strict=True):
+            file = path_handler.get_full_path(self.__settings.data_store)
+            existing_files.append(
+                file if path in active_paths and file.exists() else None
+            )
+
+        return existing_files
 
     def archive_file(
         self,
@@ -198,6 +444,109 @@ class DBIndexedDatastoreFileManager(IDatastoreFileManager):
         self.__database.upsert_file(new_file)
         return IndexResult.INDEXED
 
+    def index_existing_files(
+        self,
+        files: list[tuple[Path, IFilePathHandler]],
+        max_workers: int = 1,
+        batch_size: int = 1000,
+    ) -> dict[Path, IndexResult]:
+        """Index already-present datastore files into the database, in batches.
+
+        Same as `index_existing_file`, except that existing records are fetched
+        with one query per batch, new files are hashed in parallel, and records are
+        written in bulk. Active records whose size differs from the file on disk
+        are updated.
+
+        Returns:
+            The result of indexing each file.
+        """
+
+        results: dict[Path, IndexResult] = dict()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for start in range(0, len(files), batch_size):
+                results.update(
+                    self.__index_existing_files_batch(
+                        files[start : start + batch_size], executor
+                    )
+                )
+
+        return results
+
+    def __index_existing_files_batch(
+        self,
+        files: list[tuple[Path, IFilePathHandler]],
+        executor: ThreadPoolExecutor,
+    ) -> dict[Path, IndexResult]:
+        relative_paths: dict[Path, str] = {
+            file: File.get_datastore_relative_path(file, self.__settings)
+            for file, _ in files
+        }
+
+        existing_files: dict[str, File] = dict()
+        for file_record in self.__database.get_files(
+            File.path.in_(set(relative_paths.values()))
+        ):
+            # prefer active records over deleted ones
+            if (
+                file_record.path not in existing_files
+                or file_record.deletion_date is None
+            ):
+                existing_files[file_record.path] = file_record
+
+        results: dict[Path, IndexResult] = dict()
+        records_to_upsert: list[File] = []
+        files_to_create: list[tuple[Path, IFilePathHandler]] = []
+
+        for file, path_handler in files:
+            relative_path = relative_paths[file]
+            file_record = existing_files.get(relative_path)
+
+            if file_record is None or (
+                file_record.deletion_date is None
+                and file_record.size != file.stat().st_size
+            ):
+                logger.info(f"Indexing {relative_path} into database.")
+                files_to_create.append((file, path_handler))
+                results[file] = IndexResult.INDEXED
+                continue
+
+            new_meta = path_handler.get_metadata() or {}
+            file_record.file_meta = {
+                **(file_record.file_meta or {}),
+                **new_meta,
+            }
+
+            if file_record.deletion_date is not None:
+                logger.info(f"Restoring deleted database record for {relative_path}.")
+                file_record.deletion_date = None
+                records_to_upsert.append(file_record)
+                results[file] = IndexResult.RESTORED
+            else:
+                if new_meta:
+                    logger.info(
+                        f"Updating metadata for {relative_path} in database with new metadata: {new_meta}"
+                    )
+                    records_to_upsert.append(file_record)
+                else:
+                    logger.debug(
+                        f"File {relative_path} already indexed in database. Skipping."
+                    )
+                results[file] = IndexResult.SKIPPED
+
+        # hashing is the slow part of creating a record, so do it in parallel
+        records_to_upsert.extend(
+            executor.map(
+                lambda file_and_handler: self.__create_file_record(*file_and_handler),
+                files_to_create,
+            )
+        )
+
+        if records_to_upsert:
+            self.__database.upsert_files(records_to_upsert)
+
+        return results
+
     def delete_file(self, file: File) -> None:
         """
         Delete a file and mark it as deleted in the database.
@@ -255,38 +604,55 @@ class DBIndexedDatastoreFileManager(IDatastoreFileManager):
 
         return new_file
 
+    def __create_pending_record(
+        self, original_file: Path, path_handler: SequenceablePathHandler
+    ) -> File:
+        """Placeholder record for a file about to be added, for resolving the versions
+        of other files in the same batch."""
+
+        destination = path_handler.get_full_path(self.__settings.data_store)
+
+        return File(
+            name=destination.name,
+            path=File.get_datastore_relative_path(
+                destination, self.__settings, warn=False
+            ),
+            version=path_handler.get_sequence(),
+            version_major=getattr(path_handler, "version_major", 0),
+            hash=path_handler.get_content_identity(original_file),
+        )
+
     def __get_matching_database_files(
-        self, path_handler: SequenceablePathHandler
+        self,
+        path_handler: SequenceablePathHandler,
+        folder_files: list[File] | None = None,
     ) -> list[File]:
-        """Get all files in the database with the same name and path."""
+        """Get all active files in the database in the same folder and with the same unsequenced name.
 
-        matching_regex: re.Pattern = path_handler.get_unsequenced_pattern()
-        matching_string: str = re.sub(
-            r"\(\?P<[^>]+>([^)]+)\)", r"\1", matching_regex.pattern
-        )
+        Files already fetched for the folder can be given in `folder_files`."""
 
-        logger.debug(
-            f"Searching for files in database with name matching {matching_string}."
-        )
+        matching_regex: re.Pattern = path_handler.get_unsequenced_pattern()
+        folder: str = path_handler.get_folder_structure()
 
-        database_files: list[File] = self.__database.get_files(
-            text("name ~ :matcher").bindparams(matcher=matching_string),
-        )
-        database_files = [
-            file
-            for file in database_files
-            if path_handler.get_folder_structure() in file.path
-            and file.deletion_date is None
-        ]
+        if folder_files is None:
+            logger.debug(
+                f"Searching for files in database in {folder} with name matching {matching_regex.pattern}."
+            )
+            folder_files = self.__database.get_active_files_in_folder(folder)
 
-        return database_files
+        return [file for file in folder_files if matching_regex.search(file.name)]
 
     def __get_next_available_version(
         self,
         original_file: Path,
         path_handler: IFilePathHandler,
+        folder_files: list[File] | None = None,
+        conflicting_files: list[File] | None = None,
     ) -> bool:
-        """Find a viable version for a file, returning True if the file already exists unchanged."""
+        """Find a viable version for a file, returning True if the file already exists unchanged.
+
+        If `conflicting_files` is given, records soft-deleted by a version override are
+        added to it, rather than saved and their files deleted straight away."""
 
         IDENTICAL_FILE_ALREADY_EXISTS = True
         FILE_IS_NEW = False
@@ -299,7 +665,9 @@ class DBIndexedDatastoreFileManager(IDatastoreFileManager):
         else:
             assert isinstance(path_handler, SequenceablePathHandler)
 
-        database_files: list[File] = self.__get_matching_database_files(path_handler)
+        database_files: list[File] = self.__get_matching_database_files(
+            path_handler, folder_files
+        )
 
         if not database_files:
             logger.debug(
@@ -389,6 +757,9 @@ class DBIndexedDatastoreFileManager(IDatastoreFileManager):
                     f"{conflict.path} (same minor version {forced_minor})."
                 )
                 conflict.set_deleted()
+                if conflicting_files is not None:
+                    conflicting_files.append(conflict)
+                    continue
                 self.__database.upsert_file(conflict)
                 if conflict_path.exists():
                     conflict_path.unlink()
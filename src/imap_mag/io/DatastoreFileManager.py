@@ -1,13 +1,17 @@
+import copy
 import logging
-import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from imap_mag.config.PublishStrategy import PublishStrategy
 from imap_mag.db.Database import Database
+from imap_mag.io.DatastoreIndex import DatastoreIndex
 from imap_mag.io.file.IFilePathHandler import IFilePathHandler
 from imap_mag.io.file.SequenceablePathHandler import SequenceablePathHandler
 from imap_mag.io.IDatastoreFileManager import IDatastoreFileManager, T
-from imap_mag.util.diskSpace import check_disk_space
+from imap_mag.util import FileHash
+from imap_mag.util.diskSpace import DiskSpaceMonitor
+from imap_mag.util.publishFile import publish_file
 
 if TYPE_CHECKING:
     from imap_mag.config.AppSettings import AppSettings
@@ -20,13 +24,18 @@ class DatastoreFileManager(IDatastoreFileManager):
 
     location: Path
     disk_usage_threshold: float
+    publish_strategy: PublishStrategy
+    disk_space: DiskSpaceMonitor
 
     def __init__(self, settings: "AppSettings") -> None:
         self.location = settings.data_store
         self.disk_usage_threshold = settings.disk_usage_threshold
+        self.publish_strategy = settings.publish_strategy
+        self.disk_space = DiskSpaceMonitor(self.location, self.disk_usage_threshold)
+        self.__index = DatastoreIndex()
 
-    def _check_disk_space(self) -> None:
-        check_disk_space(self.location, self.disk_usage_threshold)
+    def _check_disk_space(self, bytes_to_write: int = 0) -> None:
+        self.disk_space.check(bytes_to_write)
 
     def add_file(self, original_file: Path, path_handler: T) -> tuple[Path, T, bool]:
         """Add file to output location.
@@ -36,7 +45,7 @@ class DatastoreFileManager(IDatastoreFileManager):
             logger.error(f"File {original_file} does not exist.")
             raise FileNotFoundError(f"File {original_file} does not exist.")
 
-        self._check_disk_space()
+        self._check_disk_space(original_file.stat().st_size)
 
         if not self.location.exists():
             logger.debug(f"Output location does not exist. Creating {self.location}.")
@@ -69,15 +78,45 @@ class DatastoreFileManager(IDatastoreFileManager):
         # Allow the handler to rewrite the source (e.g. update version references in JSON).
         source_file_after_reversioning = path_handler.prepare_for_version(original_file)
         destination_overwritten = destination_file.exists()
+
+        # The source hash, if already known, carries over to a renamed or cloned
+        # file, so that neither file needs to be read again.
+        source_hash = FileHash.get_cached(source_file_after_reversioning)
         try:
+            # A rewritten source is temporary, so can always be moved.
+            strategy = (
+                PublishStrategy.Move
+                if source_file_after_reversioning != original_file
+                else self.publish_strategy
+            )
+            method, copied_hash = publish_file(
+                source_file_after_reversioning,
+                destination_file,
+                move=strategy == PublishStrategy.Move,
+                clone=strategy == PublishStrategy.Clone,
+            )
+            self.__index.invalidate(destination_file.parent)
+
             logger.info(
-                f"Copying {original_file} to {destination_file.absolute()}. ({'overwriting' if destination_overwritten else 'new'})"
+                f"Published {original_file} to {destination_file.absolute()} using {method}. ({'overwriting' if destination_overwritten else 'new'})"
             )
-            destination = shutil.copy2(source_file_after_reversioning, destination_file)
-            logger.debug(f"Copied to {destination}.")
+
+            if method != "rename":
+                self.disk_space.record_write(destination_file.stat().st_size)
+
             self.verify_file_delivered_to_datastore(
-                original_file, source_file_after_reversioning, destination_file
+                original_file,
+                source_file_after_reversioning,
+                destination_file,
+                copied_hash,
             )
+
+            published_hash = copied_hash or source_hash
+            if published_hash is not None:
+                FileHash.remember(destination_file, published_hash)
+
+            if strategy == PublishStrategy.Move and method != "rename":
+                source_file_after_reversioning.unlink()
         finally:
             if (
                 source_file_after_reversioning != original_file
@@ -87,19 +126,39 @@ class DatastoreFileManager(IDatastoreFileManager):
 
         return (destination_file, path_handler, destination_overwritten)
 
+    def find_existing_files(self, path_handlers: list[T]) -> list[Path | None]:
+        existing_files: list[Path | None] = []
+
+        for path_handler in path_handlers:
+            file = path_handler.get_full_path(self.location)
+            existing_files.append(
+                file if file in self.__index.list_files(file.parent) else None
+            )
+
+        return existing_files
+
     def verify_file_delivered_to_datastore(
-        self, original_file, source_file_after_reversioning, destination_file
+        self,
+        original_file: Path,
+        source_file_after_reversioning: Path,
+        destination_file: Path,
+        copied_hash: str | None,
     ):
+        """Check the published file exists and, if copied, that the hash of the data
+        written matches the source.
+
+        Cloned and renamed files are not read again, as the file system guarantees
+        their content.
+        """
         if not destination_file.exists():
             raise FileNotFoundError(
                 f"File {destination_file} does not exist after copy from {original_file}."
             )
 
-        def generate_hash(file: Path) -> str:
-            return IFilePathHandler.default_file_hash(file)
-
-        if generate_hash(destination_file) != generate_hash(
-            source_file_after_reversioning
+        if (
+            copied_hash is not None
+            and copied_hash
+            != IFilePathHandler.default_file_hash(source_file_after_reversioning)
         ):
             logger.error(
                 f"File {destination_file} content differs from reversioned {source_file_after_reversioning} (and maybe source {original_file})."
@@ -146,24 +205,59 @@ class DatastoreFileManager(IDatastoreFileManager):
             )
             return False
 
-        while True:
-            if destination_file.exists():
-                orig_identity = path_handler.get_content_identity(original_file)
-                dest_identity = path_handler.get_content_identity(destination_file)
-                if orig_identity == dest_identity:
+        # Parse the versions of the existing files in the destination folder once,
+        # from its listing, and only consider versions from the current one up.
+        start_sequence = path_handler.get_sequence()
+        existing_files: dict[int, Path] = {
+            sequence: file
+            for (file, sequence) in self.__find_existing_versions(
+                path_handler, destination_file.parent
+            )
+            if sequence >= start_sequence
+        }
+
+        # Files identified by their own content cannot match if their sizes differ.
+        compare_sizes = (
+            type(path_handler).get_content_identity
+            is IFilePathHandler.get_content_identity
+        )
+        original_size = original_file.stat().st_size
+        orig_identity: str | None = None
+
+        for sequence, existing_file in sorted(existing_files.items()):
+            if not compare_sizes or existing_file.stat().st_size == original_size:
+                orig_identity = orig_identity or path_handler.get_content_identity(
+                    original_file
+                )
+                if path_handler.get_content_identity(existing_file) == orig_identity:
+                    if sequence != path_handler.get_sequence():
+                        path_handler.set_sequence(sequence)
+
                     return True
 
-                logger.debug(
-                    f"File {destination_file} already exists and is different. Increasing version to {path_handler.get_sequence() + 1}."
+            logger.debug(
+                f"File {existing_file} already exists and is different. Increasing version to {sequence + 1}."
+            )
+
+        # Skip straight past the latest existing version.
+        if existing_files:
+            path_handler.set_sequence(max(existing_files) + 1)
+            destination_file = path_handler.get_full_path(self.location)
+
+            if destination_file in existing_files.values():
+                logger.error(
+                    f"File {destination_file} already exists and is different. Cannot increase version."
                 )
-            elif path_handler.is_version_blocked_by_sibling(
-                path_handler.get_sequence(), self.location, original_file
-            ):
-                logger.debug(
-                    f"Version {path_handler.get_sequence()} blocked by sibling conflict for {destination_file}. Increasing version."
+                raise FileExistsError(
+                    f"File {destination_file} already exists and is different. Cannot increase version."
                 )
-            else:
-                return False
+
+        while path_handler.is_version_blocked_by_sibling(
+            path_handler.get_sequence(), self.location, original_file
+        ):
+            logger.debug(
+                f"Version {path_handler.get_sequence()} blocked by sibling conflict for {destination_file}. Increasing version."
+            )
 
             path_handler.increase_sequence()
             updated_file = path_handler.get_full_path(self.location)
@@ -179,6 +273,30 @@ class DatastoreFileManager(IDatastoreFileManager):
 
             destination_file = updated_file
 
+        return False
+
+    def __find_existing_versions(
+        self, path_handler: SequenceablePathHandler, folder: Path
+    ) -> list[tuple[Path, int]]:
+        """Files in the folder that are versions of the path handler's file, with
+        their sequence."""
+
+        sequence_name = path_handler.get_sequence_variable_name()
+        candidate_handler = copy.copy(path_handler)
+
+        existing_versions: list[tuple[Path, int]] = []
+
+        for file, sequence in self.__index.find_sequences(
+            folder, path_handler.get_unsequenced_pattern(), sequence_name
+        ):
+            # The pattern may also match other files, e.g. of other major versions.
+            setattr(candidate_handler, sequence_name, sequence)
+
+            if candidate_handler.get_full_path(self.location) == Path(file):
+                existing_versions.append((Path(file), sequence))
+
+        return existing_versions
+
     @classmethod
     def CreateByMode(
         cls,
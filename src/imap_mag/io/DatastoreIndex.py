@@ -0,0 +1,163 @@
+import fnmatch
+import glob
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _FolderListing:
+    """Entries of a single folder, as of its modification time."""
+
+    mtime_ns: int
+    listed_ns: int
+    names: list[str]
+    file_names: list[str]
+    sequences: dict[tuple[str, str], list[tuple[str, int]]] = field(
+        default_factory=dict
+    )
+
+
+class DatastoreIndex:
+    """In-memory index of datastore folder listings.
+
+    Each folder is listed once, and its listing (and any filenames parsed from it)
+    is reused until the folder's modification time changes. Adding, removing or
+    renaming a file in a folder updates its modification time, so the index never
+    returns stale listings, even when shared between several `FileFinder`s.
+
+    Folders modified within `RACY_INTERVAL_NS` of being listed are listed again
+    on the next lookup, as file systems (especially network ones) may not update
+    the modification time for changes made in quick succession.
+    """
+
+    RACY_INTERVAL_NS: int = 2_000_000_000
+
+    def __init__(self) -> None:
+        self.__listings: dict[Path, _FolderListing] = dict()
+        self.__lock = threading.Lock()
+
+    def list_files(self, folder: Path) -> list[Path]:
+        """Sorted paths of all files in the folder."""
+
+        listing = self.__get_listing(folder)
+        return [folder / name for name in listing.file_names] if listing else []
+
+    def find_sequences(
+        self, folder: Path, pattern: re.Pattern, sequence_name: str
+    ) -> list[tuple[str, int]]:
+        """Paths in the folder matching `pattern`, with the value of the
+        `sequence_name` group in each, sorted from highest to lowest sequence."""
+
+        listing = self.__get_listing(folder)
+
+        if listing is None:
+            return []
+
+        key = (pattern.pattern, sequence_name)
+
+        with self.__lock:
+            sequences = listing.sequences.get(key)
+
+        if sequences is None:
+            folder_prefix = folder.as_posix() + "/"
+            sequences = [
+                (path, int(match.group(sequence_name)))
+                for path in (folder_prefix + name for name in listing.names)
+                if (match := pattern.search(path))
+            ]
+            sequences.sort(key=lambda x: x[1], reverse=True)
+
+            with self.__lock:
+                listing.sequences[key] = sequences
+
+        return list(sequences)
+
+    def glob(self, root: Path, relative_pattern: str) -> list[Path]:
+        """Sorted paths of files under `root` matching `relative_pattern`.
+
+        Only the final path component may contain wildcards for the listing to
+        be cached; other patterns are globbed directly.
+        """
+
+        relative_path = Path(relative_pattern)
+
+        if glob.has_magic(relative_path.parent.as_posix()):
+            return sorted(
+                path for path in root.glob(relative_pattern) if path.is_file()
+            )
+
+        folder = root / relative_path.parent
+        listing = self.__get_listing(folder)
+
+        if listing is None:
+            return []
+
+        return [
+            folder / name
+            for name in listing.file_names
+            if fnmatch.fnmatchcase(name, relative_path.name)
+        ]
+
+    def invalidate(self, folder: Path | None = None) -> None:
+        """Drop the cached listing of a folder, or of all folders."""
+
+        with self.__lock:
+            if folder is None:
+                self.__listings.clear()
+            else:
+                self.__listings.pop(folder, None)
+
+    def __get_listing(self, folder: Path) -> _FolderListing | None:
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            self.invalidate(folder)
+            return None
+
+        with self.__lock:
+            listing = self.__listings.get(folder)
+
+        if (
+            listing is not None
+            and listing.mtime_ns == mtime_ns
+            and listing.listed_ns - mtime_ns > self.RACY_INTERVAL_NS
+        ):
+            return listing
+
+        listed_ns = time.time_ns()
+        names: list[str] = []
+        file_names: list[str] = []
+
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+
+                names.append(entry.name)
+
+                if entry.is_file():
+                    file_names.append(entry.name)
+
+        names.sort()
+        file_names.sort()
+
+        logger.debug(f"Listed {len(names)} entries in {folder.as_posix()}.")
+
+        listing = _FolderListing(
+            mtime_ns=mtime_ns,
+            listed_ns=listed_ns,
+            names=names,
+            file_names=file_names,
+        )
+
+        with self.__lock:
+            self.__listings[folder] = listing
+
+        return listing
@@ -1,12 +1,13 @@
 import fnmatch
-import glob
 import logging
 import re
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Literal, overload
 
+from imap_db.model import File
 from imap_mag.db.Database import Database
+from imap_mag.io.DatastoreIndex import DatastoreIndex
 from imap_mag.io.file import (
     CalibrationLayerPathHandler,
     IFilePathHandler,
@@ -28,16 +29,30 @@ class FileFinder:
     _data_store: Path
     _work_folder: Path | None
     _database: Database | None
+    _index: DatastoreIndex
+    _search_database: bool
 
     def __init__(
         self,
         data_store: Path,
         work_folder: Path | None = None,
         database: Database | None = None,
+        index: DatastoreIndex | None = None,
+        search_database: bool = False,
     ) -> None:
         self._data_store = data_store
         self._work_folder = work_folder
         self._database = database
+        self._index = index or DatastoreIndex()
+
+        # Look up versioned and science files in the database first, and only
+        # search the datastore if the database has no match.
+        self._search_database = search_database and (database is not None)
+
+    @property
+    def index(self) -> DatastoreIndex:
+        """Index of folder listings, which can be shared with other finders."""
+        return self._index
 
     def find_parts_by_handler(
         self,
@@ -240,32 +255,52 @@ class FileFinder:
 
         for level in levels_to_search:
             date_dir = science_dir / level / date.strftime("%Y") / date.strftime("%m")
-            if not date_dir.exists():
-                continue
+
+            def find_candidates(files: list[Path]) -> list[tuple[str, int]]:
+                candidates: list[tuple[str, int]] = []
+                for f in files:
+                    if f.suffix != ".cdf" or date_str not in f.name:
+                        continue
+
+                    handler = SciencePathHandler.from_filename(f.name)
+                    if (
+                        handler
+                        and handler.get_mode() == mode
+                        and handler.get_sensor() == sensor
+                    ):
+                        candidates.append((f.name, handler.version))
+
+                if version_major is not None:
+                    candidates = [
+                        (name, ver)
+                        for name, ver in candidates
+                        if (h := SciencePathHandler.from_filename(name)) is not None
+                        and h.version_major == version_major
+                    ]
+
+                candidates.sort(key=lambda x: x[1], reverse=True)
+                return candidates
 
             candidates: list[tuple[str, int]] = []
-            for f in sorted(date_dir.iterdir()):
-                if not f.is_file() or f.suffix != ".cdf" or date_str not in f.name:
-                    continue
-
-                handler = SciencePathHandler.from_filename(f.name)
-                if (
-                    handler
-                    and handler.get_mode() == mode
-                    and handler.get_sensor() == sensor
-                ):
-                    candidates.append((f.name, handler.version))
-
-            if version_major is not None:
-                candidates = [
-                    (name, ver)
-                    for name, ver in candidates
-                    if (h := SciencePathHandler.from_filename(name)) is not None
-                    and h.version_major == version_major
-                ]
+
+            database_files = self.__find_files_in_database(
+                date_dir,
+                descriptor=f"imap_mag_{level}_{mode.short_name}-{sensor.value}",
+                content_date=date,
+                version_major=version_major,
+            )
+            if database_files:
+                candidates = find_candidates(database_files)
+
+            if candidates and not self.__exists_in_datastore(
+                date_dir / candidates[0][0]
+            ):
+                candidates = []
+
+            if not candidates:
+                candidates = find_candidates(self._index.list_files(date_dir))
 
             if candidates:
-                candidates.sort(key=lambda x: x[1], reverse=True)
                 logger.info(
                     f"Discovered science file {candidates[0][0]} for {sensor.value} date {date.strftime('%Y-%m-%d')} mode {mode.value} at level {level}"
                 )
@@ -392,10 +427,7 @@ class FileFinder:
         glob_pattern = self._COVERAGE_PLACEHOLDER_RE.sub("*", relative_pattern)
 
         candidates: list[tuple[Path, datetime, datetime, int]] = []
-        for path in sorted(self._data_store.glob(glob_pattern)):
-            if not path.is_file():
-                continue
-
+        for path in self._index.glob(self._data_store, glob_pattern):
             match = pattern.match(path.name)
             if not match:
                 continue
@@ -538,9 +570,7 @@ class FileFinder:
         return re.compile("^" + "".join(regex_parts) + "$")
 
     def _glob_files(self, glob_pattern: str) -> list[Path]:
-        return sorted(
-            path for path in self._data_store.glob(glob_pattern) if path.is_file()
-        )
+        return self._index.glob(self._data_store, glob_pattern)
 
     def __find_files_and_sequences(
         self,
@@ -553,20 +583,43 @@ class FileFinder:
         folder = self._data_store / path_handler.get_folder_structure()
         sequence_name = path_handler.get_sequence_variable_name()
 
-        all_matching_files = [
-            (filename, int(pattern.search(filename).group(sequence_name)))  # type: ignore
-            for filename in glob.glob(folder.as_posix() + "/*")
-            if pattern.search(filename)
-        ]
+        def filter_by_fnmatch(
+            files: list[tuple[str, int]],
+        ) -> list[tuple[str, int]]:
+            if fnmatch_pattern is None:
+                return files
 
-        if fnmatch_pattern is not None:
-            all_matching_files = [
+            return [
                 (filename, seq)
-                for filename, seq in all_matching_files
+                for filename, seq in files
                 if fnmatch.fnmatch(Path(filename).name, fnmatch_pattern)
             ]
 
-        all_matching_files.sort(key=lambda x: x[1], reverse=True)
+        all_matching_files: list[tuple[str, int]] = []
+
+        database_files = self.__find_files_in_database(
+            folder,
+            descriptor=self.__get_database_descriptor(path_handler),
+            content_date=path_handler.get_content_date_for_indexing(),
+        )
+        if database_files:
+            all_matching_files = [
+                (path.as_posix(), int(match.group(sequence_name)))
+                for path in database_files
+                if (match := pattern.search(path.as_posix()))
+            ]
+            all_matching_files.sort(key=lambda x: x[1], reverse=True)
+            all_matching_files = filter_by_fnmatch(all_matching_files)
+
+        if all_matching_files and not self.__exists_in_datastore(
+            Path(all_matching_files[0][0])
+        ):
+            all_matching_files = []
+
+        if not all_matching_files:
+            all_matching_files = filter_by_fnmatch(
+                self._index.find_sequences(folder, pattern, sequence_name)
+            )
 
         if len(all_matching_files) == 0:
             if throw_if_not_found:
@@ -590,6 +643,85 @@ class FileFinder:
 
         return all_matching_files
 
+    def __find_files_in_database(
+        self,
+        folder: Path,
+        descriptor: str | None = None,
+        content_date: datetime | None = None,
+        version_major: int | None = None,
+    ) -> list[Path] | None:
+        """Find active files in a datastore folder from the database, if enabled.
+
+        Files of a known type and day are looked up by descriptor and content
+        date, otherwise all files in the folder are listed. Returns None if the
+        folder has changed since the files were last indexed, as the datastore
+        needs to be searched instead.
+        """
+
+        if not self._search_database:
+            return None
+
+        assert self._database is not None
+
+        relative_folder = folder.relative_to(self._data_store).as_posix()
+
+        if descriptor is not None and content_date is not None:
+            files = [
+                file
+                for file in self._database.get_active_files_by_descriptor(
+                    descriptor, content_date, version_major=version_major
+                )
+                if Path(file.path).parent.as_posix() == relative_folder
+            ]
+        else:
+            files = self._database.get_active_files_in_folder(relative_folder)
+
+        if not files or not folder.is_dir():
+            return None
+
+        # Folder modification times have at least a second resolution, but
+        # database timestamps may not.
+        folder_modified_date = datetime.fromtimestamp(
+            int(folder.stat().st_mtime), UTC
+        ).replace(tzinfo=None)
+        last_indexed_date = max(file.last_modified_date for file in files)
+
+        if folder_modified_date > last_indexed_date:
+            logger.info(
+                f"Folder {folder.as_posix()} changed after its files were last indexed in the database. Searching datastore instead."
+            )
+            return None
+
+        logger.debug(f"Found {len(files)} files in database for {folder.as_posix()}.")
+
+        return [self._data_store / file.path for file in files]
+
+    @staticmethod
+    def __get_database_descriptor(
+        path_handler: SequenceablePathHandler,
+    ) -> str | None:
+        """Descriptor of the files matching a path handler, as indexed in the database."""
+
+        try:
+            filename = path_handler.get_filename()
+        except ValueError:
+            return None
+
+        if "*" in filename:
+            return None
+
+        return File.get_descriptor_from_filename(filename)
+
+    @staticmethod
+    def __exists_in_datastore(file: Path) -> bool:
+        if file.exists():
+            return True
+
+        logger.warning(
+            f"File {file.as_posix()} is in the database but not in the datastore. Searching datastore instead."
+        )
+        return False
+
     @overload
     def find_by_name_or_path(
         self, file_name_or_path: "str | Path", throw_if_not_found: Literal[True] = True
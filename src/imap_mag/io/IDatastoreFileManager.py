@@ -1,5 +1,7 @@
 import abc
 import typing
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from imap_mag.io.file.IFilePathHandler import IFilePathHandler
@@ -10,6 +12,73 @@ T = typing.TypeVar("T", bound="IFilePathHandler")
 class IDatastoreFileManager(abc.ABC):
     """Interface for output managers."""
 
+    MAX_PUBLISH_WORKERS: int = 4
+
     @abc.abstractmethod
     def add_file(self, original_file: Path, path_handler: T) -> tuple[Path, T, bool]:
         """Add file to output location. Returns the destination file path, the path handler used to generate it, and a bool indicating if an overwrite occurred."""
+
+    @abc.abstractmethod
+    def find_existing_files(self, path_handlers: list[T]) -> list[Path | None]:
+        """For each path handler, the path of the file already in the datastore at
+        its path, or None if there is no such file."""
+
+    def add_files(
+        self,
+        files: list[tuple[Path, T]],
+        max_workers: int = MAX_PUBLISH_WORKERS,
+    ) -> list[tuple[Path, T, bool]]:
+        """Add several files to output location, publishing them concurrently.
+
+        Files for the same destination folder are added one after the other, in
+        order, so that their versions are resolved against each other. Returns the
+        result of `add_file` for each file, in the same order as `files`.
+
+        This is not atomic: all files are attempted, and the first error, if any, is
+        then raised, leaving any files added successfully in place.
+        """
+
+        results = self._add_files_concurrently(files, self.add_file, max_workers)
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+        return typing.cast(list[tuple[Path, T, bool]], results)
+
+    @staticmethod
+    def _add_files_concurrently(
+        files: list[tuple[Path, T]],
+        add_file: Callable[[Path, T], tuple[Path, T, bool]],
+        max_workers: int,
+    ) -> list[tuple[Path, T, bool] | Exception]:
+        """Call `add_file` for each file, concurrently across destination folders.
+
+        Returns the result of each call, or the exception it raised, in the same
+        order as `files`.
+        """
+
+        folders: dict[str, list[int]] = dict()
+
+        for index, (_, path_handler) in enumerate(files):
+            folders.setdefault(path_handler.get_folder_structure(), []).append(index)
+
+        results: list[tuple[Path, T, bool] | Exception] = [None] * len(files)  # type: ignore[list-item]
+
+        def add_files_in_folder(indices: list[int]) -> None:
+            for index in indices:
+                try:
+                    results[index] = add_file(*files[index])
+                except Exception as e:
+                    results[index] = e
+
+        workers = max(1, min(max_workers, len(folders)))
+
+        if workers == 1:
+            for indices in folders.values():
+                add_files_in_folder(indices)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(add_files_in_folder, folders.values()))
+
+        return results
@@ -1,4 +1,5 @@
 from imap_mag.io.DatastoreFileManager import DatastoreFileManager
+from imap_mag.io.DatastoreIndex import DatastoreIndex
 from imap_mag.io.DBIndexedDatastoreFileManager import DBIndexedDatastoreFileManager
 from imap_mag.io.FileFinder import FileFinder
 from imap_mag.io.FilePathHandlerSelector import (
@@ -10,6 +11,7 @@ from imap_mag.io.IDatastoreFileManager import IDatastoreFileManager
 __all__ = [
     "DBIndexedDatastoreFileManager",
     "DatastoreFileManager",
+    "DatastoreIndex",
     "FileFinder",
     "FilePathHandlerSelector",
     "IDatastoreFileManager",
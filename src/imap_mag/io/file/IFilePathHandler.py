@@ -1,11 +1,12 @@
 import abc
-import hashlib
 import logging
 import typing
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from imap_mag.util.FileHash import FileHash
+
 logger = logging.getLogger(__name__)
 
 T = typing.TypeVar("T", bound="IFilePathHandler")
@@ -59,7 +60,7 @@ class IFilePathHandler(abc.ABC):
 
     @classmethod
     def default_file_hash(cls, source_file):
-        return hashlib.md5(source_file.read_bytes()).hexdigest()
+        return FileHash.hash(Path(source_file))
 
     def get_content_identity(
         self, file_path_override: Path | None = None, parent_folder: Path = Path()
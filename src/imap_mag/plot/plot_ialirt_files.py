@@ -11,6 +11,7 @@ from imap_mag.db import Database
 from imap_mag.io.file import IALiRTQuicklookPathHandler
 from imap_mag.util import DatetimeProvider
 from imap_mag.util.constants import CONSTANTS
+from imap_mag.util.tabularFile import read_tabular_file
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +71,7 @@ def _load_csv_files(files: list[Path]) -> pd.DataFrame:
     data = pd.DataFrame()
 
     for file in files:
-        file_data: pd.DataFrame = pd.read_csv(
+        file_data: pd.DataFrame = read_tabular_file(
             file, parse_dates=["time_utc"], index_col="time_utc"
         )
         data = pd.concat([data, file_data])
@@ -0,0 +1,528 @@
+import logging
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar
+
+import numpy as np
+import numpy.typing as npt
+import space_packet_parser as spp
+from space_packet_parser import common
+from space_packet_parser.exceptions import (
+    ComparisonError,
+    UnrecognizedPacketTypeError,
+)
+from space_packet_parser.xtce import (
+    comparisons,
+    containers,
+    encodings,
+    parameter_types,
+    parameters,
+)
+
+from imap_mag.util.PacketIndex import CCSDS_HEADER_LENGTH_BYTES, PacketIndex
+
+logger = logging.getLogger(__name__)
+
+# Number of leading fields that ``SpacePacket.header`` treats as the CCSDS header.
+_CCSDS_HEADER_FIELD_COUNT = 7
+
+# Header parameters whose value is the same for every packet in a group of
+# packets with the same ApID and length, and can therefore be used to resolve
+# restriction criteria and dynamic field sizes at compile time.
+_APID_PARAMETER = "PKT_APID"
+_LENGTH_PARAMETER = "PKT_LEN"
+
+# Packet name prefix of XTCE parameter names, e.g., "MAG_HSK_PW." in "MAG_HSK_PW.PCB_T".
+_PACKET_NAME_PREFIX = re.compile(r"^\w+?_\w+?\.")
+
+# Calibrators only reference the raw value being calibrated, not other fields.
+_EMPTY_PACKET = spp.SpacePacket()
+
+
+class UnsupportedLayoutError(Exception):
+    """Raised when a packet layout cannot be decoded in bulk."""
+
+
+@dataclass(frozen=True)
+class FieldLayout:
+    """Location and conversion of a single field within a packet."""
+
+    name: str
+    bit_offset: int
+    bit_length: int
+    kind: str  # one of "int", "float", "binary", "enum"
+    signed: bool = False
+    calibrated_encoding: encodings.NumericDataEncoding | None = None
+    enumeration: dict[int, str] | None = None
+
+
+@dataclass(frozen=True)
+class PacketLayout:
+    """Fixed layout of all fields in a packet of a given ApID and length."""
+
+    apid: int
+    packet_length: int
+    fields: tuple[FieldLayout, ...]
+
+
+def normalise_field_name(name: str) -> str:
+    """Strip the packet name prefix from an XTCE parameter name."""
+    return _PACKET_NAME_PREFIX.sub("", name.lower())
+
+
+def _flatten_entries(
+    container: containers.SequenceContainer,
+) -> list[parameters.Parameter]:
+    """Flatten (possibly nested) container entries into a list of parameters."""
+
+    flattened: list[parameters.Parameter] = []
+
+    for entry in container.entry_list:
+        if isinstance(entry, containers.SequenceContainer):
+            flattened.extend(_flatten_entries(entry))
+        else:
+            flattened.append(entry)
+
+    return flattened
+
+
+def _get_field_size(
+    encoding: encodings.DataEncoding, known_values: dict[str, int]
+) -> int:
+    """Get the size in bits of a field, resolving references to known header values."""
+
+    if isinstance(encoding, encodings.NumericDataEncoding):
+        return encoding.size_in_bits
+
+    if isinstance(encoding, encodings.BinaryDataEncoding):
+        if encoding.fixed_size_in_bits is not None:
+            size = encoding.fixed_size_in_bits
+        elif encoding.size_reference_parameter in known_values:
+            size = known_values[encoding.size_reference_parameter]
+        else:
+            raise UnsupportedLayoutError(
+                f"Binary field size depends on {encoding.size_reference_parameter}."
+            )
+
+        if encoding.linear_adjuster is not None:
+            size = encoding.linear_adjuster(size)
+
+        return int(size)
+
+    raise UnsupportedLayoutError(f"Unsupported encoding {type(encoding).__name__}.")
+
+
+def _check_calibrators(
+    encoding: encodings.NumericDataEncoding, parameter_name: str
+) -> bool:
+    """Check whether calibrators only depend on the raw value of the parameter itself.
+
+    Returns:
+        True if the parameter has any calibrator.
+    """
+
+    for context_calibrator in encoding.context_calibrators or []:
+        for criterion in context_calibrator.match_criteria:
+            if not (
+                isinstance(criterion, comparisons.Comparison)
+                and criterion.referenced_parameter == parameter_name
+                and not criterion.use_calibrated_value
+            ):
+                raise UnsupportedLayoutError(
+                    f"Context calibrator criteria for {parameter_name} depend on other parameters."
+                )
+
+    return bool(encoding.context_calibrators) or encoding.default_calibrator is not None
+
+
+def _compile_field(
+    parameter: parameters.Parameter, bit_offset: int, known_values: dict[str, int]
+) -> FieldLayout:
+    """Compile a single XTCE parameter into a field layout."""
+
+    parameter_type = parameter.parameter_type
+    encoding = parameter_type.encoding
+    name = normalise_field_name(parameter.name)
+
+    bit_length = _get_field_size(encoding, known_values)
+
+    is_calibrated = False
+
+    if isinstance(encoding, encodings.NumericDataEncoding):
+        if encoding.byte_order != "mostSignificantByteFirst":
+            raise UnsupportedLayoutError(
+                f"Unsupported byte order for {parameter.name}."
+            )
+
+        is_calibrated = _check_calibrators(encoding, parameter.name)
+
+    match parameter_type:
+        case parameter_types.EnumeratedParameterType() if isinstance(
+            encoding, encodings.IntegerDataEncoding
+        ):
+            return FieldLayout(
+                name=name,
+                bit_offset=bit_offset,
+                bit_length=bit_length,
+                kind="enum",
+                signed=encoding.encoding != "unsigned",
+                enumeration=dict(parameter_type.enumeration),
+            )
+        case (
+            parameter_types.IntegerParameterType()
+            | parameter_types.FloatParameterType()
+        ) if isinstance(encoding, encodings.IntegerDataEncoding):
+            return FieldLayout(
+                name=name,
+                bit_offset=bit_offset,
+                bit_length=bit_length,
+                kind="int",
+                signed=encoding.encoding != "unsigned",
+                calibrated_encoding=encoding if is_calibrated else None,
+            )
+        case (
+            parameter_types.IntegerParameterType()
+            | parameter_types.FloatParameterType()
+        ) if (
+            isinstance(encoding, encodings.FloatDataEncoding)
+            and encoding.encoding in ("IEEE754", "IEEE754_1985")
+            and not is_calibrated
+        ):
+            return FieldLayout(
+                name=name,
+                bit_offset=bit_offset,
+                bit_length=bit_length,
+                kind="float",
+            )
+        case parameter_types.BinaryParameterType():
+            return FieldLayout(
+                name=name,
+                bit_offset=bit_offset,
+                bit_length=bit_length,
+                kind="binary",
+            )
+        case _:
+            raise UnsupportedLayoutError(
+                f"Unsupported parameter type {type(parameter_type).__name__} for {parameter.name}."
+            )
+
+
+def compile_packet_layout(
+    definition: spp.xtce.definitions.XtcePacketDefinition,
+    apid: int,
+    packet_length: int,
+) -> PacketLayout:
+    """Compile the field layout of packets with the given ApID and length (in bytes).
+
+    Follows the same container inheritance as ``XtcePacketDefinition.parse_bytes``,
+    but only resolves restriction criteria on the ApID, which is constant for a
+    group of packets.
+
+    Raises:
+        UnrecognizedPacketTypeError: if the definition does not describe the ApID.
+        UnsupportedLayoutError: if the layout varies from packet to packet.
+    """
+
+    known_values: dict[str, int] = {
+        _APID_PARAMETER: apid,
+        _LENGTH_PARAMETER: packet_length - CCSDS_HEADER_LENGTH_BYTES - 1,
+    }
+    criteria_packet = spp.SpacePacket(
+        {key: common.IntParameter(value) for key, value in known_values.items()}
+    )
+
+    fields: list[FieldLayout] = []
+    bit_offset = 0
+
+    current_container = definition.containers[definition.root_container_name]
+
+    while True:
+        for parameter in _flatten_entries(current_container):
+            field = _compile_field(parameter, bit_offset, known_values)
+            fields.append(field)
+            bit_offset += field.bit_length
+
+        try:
+            valid_inheritors = [
+                inheritor_name
+                for inheritor_name in current_container.inheritors
+                if all(
+                    rc.evaluate(criteria_packet)
+                    for rc in definition.containers[inheritor_name].restriction_criteria
+                )
+            ]
+        except (KeyError, ValueError, ComparisonError) as e:
+            raise UnsupportedLayoutError(
+                f"Restriction criteria in {current_container.name} depend on packet content."
+            ) from e
+
+        if len(valid_inheritors) == 1:
+            current_container = definition.containers[valid_inheritors[0]]
+            continue
+
+        if len(valid_inheritors) == 0:
+            if current_container.abstract:
+                raise UnrecognizedPacketTypeError(
+                    f"ApID {apid} is not described by the packet definition."
+                )
+            break
+
+        raise UnsupportedLayoutError(
+            f"Multiple valid inheritors, {valid_inheritors} are possible for {current_container.name}."
+        )
+
+    # As with ``parse_bytes``, trailing (padding) bits are ignored.
+    if bit_offset > packet_length * 8:
+        raise UnsupportedLayoutError(
+            f"Layout for ApID {apid} has {bit_offset} bits, but packet has {packet_length * 8} bits."
+        )
+
+    if len({field.name for field in fields}) != len(fields):
+        raise UnsupportedLayoutError(
+            f"Duplicate field names in layout for ApID {apid}."
+        )
+
+    return PacketLayout(apid=apid, packet_length=packet_length, fields=tuple(fields))
+
+
+def _extract_bits(
+    rows: npt.NDArray[np.uint8], bit_offset: int, bit_length: int
+) -> npt.NDArray:
+    """Extract a big-endian bit field from every row of a 2D byte array.
+
+    Fields spanning up to 8 bytes are returned as ``uint64``, wider fields as an
+    ``object`` array of Python integers.
+    """
+
+    start_byte = bit_offset // 8
+    leading_bits = bit_offset % 8
+    n_bytes = (leading_bits + bit_length + 7) // 8
+    trailing_bits = n_bytes * 8 - leading_bits - bit_length
+
+    if n_bytes > 8:
+        chunk = rows[:, start_byte : start_byte + n_bytes]
+        mask = (1 << bit_length) - 1
+
+        wide_values = np.empty(rows.shape[0], dtype=object)
+        wide_values[:] = [
+            (int.from_bytes(row.tobytes(), byteorder="big") >> trailing_bits) & mask
+            for row in chunk
+        ]
+
+        return wide_values
+
+    values = np.zeros(rows.shape[0], dtype=np.uint64)
+
+    for i in range(n_bytes):
+        values = (values << np.uint64(8)) | rows[:, start_byte + i]
+
+    values >>= np.uint64(trailing_bits)
+
+    if bit_length < 64:
+        values &= np.uint64((1 << bit_length) - 1)
+
+    return values
+
+
+def _to_integers(values: npt.NDArray, bit_length: int, signed: bool) -> npt.NDArray:
+    """Convert raw bit fields to integers, with the same dtype as a list of Python ints."""
+
+    if values.dtype == object or bit_length >= 64:
+        python_values = [int(v) for v in values]
+
+        if signed:
+            sign_bit = 1 << (bit_length - 1)
+            python_values = [
+                v - (1 << bit_length) if v & sign_bit else v for v in python_values
+            ]
+
+        return np.asarray(python_values)
+
+    integers = values.astype(np.int64)
+
+    if signed:
+        integers = np.where(
+            integers >= (1 << (bit_length - 1)), integers - (1 << bit_length), integers
+        )
+
+    return integers
+
+
+def _to_floats(
+    values: npt.NDArray[np.uint64], bit_length: int
+) -> npt.NDArray[np.float64]:
+    """Reinterpret raw IEEE 754 bit fields as floats."""
+
+    match bit_length:
+        case 16:
+            return values.astype(np.uint16).view(np.float16).astype(np.float64)
+        case 32:
+            return values.astype(np.uint32).view(np.float32).astype(np.float64)
+        case 64:
+            return values.view(np.float64)
+        case _:
+            raise UnsupportedLayoutError(f"Unsupported float size {bit_length}.")
+
+
+def _calibrate_value(
+    encoding: encodings.NumericDataEncoding, raw_value: int
+) -> int | float:
+    """Calibrate a raw value as ``NumericDataEncoding.parse_value`` does."""
+
+    for context_calibrator in encoding.context_calibrators or []:
+        if all(
+            criterion.evaluate(_EMPTY_PACKET, raw_value)
+            for criterion in context_calibrator.match_criteria
+        ):
+            return float(context_calibrator.calibrate(raw_value))
+
+    if encoding.default_calibrator is not None:
+        return float(encoding.default_calibrator.calibrate(raw_value))
+
+    return raw_value
+
+
+def _map_unique(values: npt.NDArray, function) -> npt.NDArray:
+    """Apply a scalar function to each unique value, and broadcast the results back.
+
+    Calibrators and enumerations are evaluated with the same code used to parse
+    single packets, so results are identical, but only once per distinct raw value.
+    """
+
+    unique_values, inverse = np.unique(values, return_inverse=True)
+
+    return np.asarray([function(int(v)) for v in unique_values])[inverse]
+
+
+def _decode_field(rows: npt.NDArray[np.uint8], field: FieldLayout) -> npt.NDArray:
+    """Decode a single field from every row of a 2D byte array."""
+
+    values = _extract_bits(rows, field.bit_offset, field.bit_length)
+
+    match field.kind:
+        case "float":
+            return _to_floats(values, field.bit_length)
+        case "binary":
+            return _to_integers(values, field.bit_length, signed=False)
+        case "int":
+            integers = _to_integers(values, field.bit_length, field.signed)
+
+            if field.calibrated_encoding is None:
+                return integers
+
+            encoding = field.calibrated_encoding
+            return _map_unique(integers, lambda raw: _calibrate_value(encoding, raw))
+        case "enum":
+            assert field.enumeration is not None
+
+            enumeration = field.enumeration
+            integers = _to_integers(values, field.bit_length, field.signed)
+
+            try:
+                return _map_unique(integers, lambda raw: enumeration[raw])
+            except KeyError as e:
+                raise UnsupportedLayoutError(
+                    f"Value {e} not found in enumeration of {field.name}."
+                ) from e
+        case _:
+            raise UnsupportedLayoutError(f"Unknown field kind {field.kind}.")
+
+
+class HKBulkDecoder:
+    """Decommutate fixed-layout HK packets into typed column arrays.
+
+    Packets are grouped by ApID and each group is decoded with a field layout
+    compiled once per XTCE definition, ApID and packet length. Groups whose
+    layout varies from packet to packet cannot be decoded in bulk, and are
+    returned as ``None`` so that they can be parsed packet by packet instead.
+    """
+
+    __layout_cache: ClassVar[
+        dict[
+            tuple[str, int, int],
+            PacketLayout | UnrecognizedPacketTypeError | UnsupportedLayoutError,
+        ]
+    ] = {}
+
+    def __init__(
+        self,
+        xtce_path: Path,
+        definition: spp.xtce.definitions.XtcePacketDefinition,
+    ) -> None:
+        self.__xtce_path = str(xtce_path)
+        self.__definition = definition
+
+    def get_layout(self, apid: int, packet_length: int) -> PacketLayout:
+        """Get the (cached) layout for packets of the given ApID and length."""
+
+        key = (self.__xtce_path, apid, packet_length)
+
+        if key not in self.__layout_cache:
+            try:
+                self.__layout_cache[key] = compile_packet_layout(
+                    self.__definition, apid, packet_length
+                )
+            except (UnrecognizedPacketTypeError, UnsupportedLayoutError) as e:
+                self.__layout_cache[key] = e
+
+        layout = self.__layout_cache[key]
+
+        if isinstance(layout, Exception):
+            raise layout
+
+        return layout
+
+    def decode(
+        self, data: npt.NDArray[np.uint8], index: PacketIndex
+    ) -> dict[int, dict[str, npt.NDArray] | None]:
+        """Decode indexed packets into columns, keyed by ApID then field name.
+
+        ApIDs not described by the XTCE definition are skipped. ApIDs that cannot
+        be decoded in bulk map to ``None``.
+        """
+
+        columns_by_apid: dict[int, dict[str, npt.NDArray] | None] = {}
+
+        for apid, group in index.group_by_apid().items():
+            packet_lengths = np.unique(group.lengths)
+
+            if len(packet_lengths) != 1:
+                logger.debug(
+                    f"ApID {apid} has variable packet lengths; decoding packet by packet."
+                )
+                columns_by_apid[apid] = None
+                continue
+
+            packet_length = int(packet_lengths[0])
+
+            try:
+                layout = self.get_layout(apid, packet_length)
+
+                rows = np.asarray(data)[
+                    group.offsets[:, np.newaxis] + np.arange(packet_length)
+                ]
+                columns = {
+                    field.name: _decode_field(rows, field) for field in layout.fields
+                }
+            except UnrecognizedPacketTypeError as e:
+                logger.warning(
+                    f"Skipping {len(group.offsets)} packets with unrecognized ApID {apid}: {e}"
+                )
+                continue
+            except UnsupportedLayoutError as e:
+                logger.debug(
+                    f"ApID {apid} cannot be decoded in bulk ({e}); decoding packet by packet."
+                )
+                columns_by_apid[apid] = None
+                continue
+
+            # Match the order of fields in ``SpacePacket.user_data | SpacePacket.header``.
+            names = list(columns.keys())
+            columns_by_apid[apid] = {
+                name: columns[name]
+                for name in names[_CCSDS_HEADER_FIELD_COUNT:]
+                + names[:_CCSDS_HEADER_FIELD_COUNT]
+            }
+
+        return columns_by_apid
@@ -0,0 +1,87 @@
+import json
+import logging
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HKMergeCacheEntry:
+    """Decoded HK data for an ApID and day, and the L0 files it was decoded from."""
+
+    data: pd.DataFrame
+    l0_hashes: set[str]
+
+
+class HKMergeCache:
+    """
+    Cache of decoded HK data per packet and day.
+
+    Allows new HK data to be merged with previously decoded data without
+    re-decoding all L0 files for the day. Entries are only valid for the XTCE
+    definition they were decoded with.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        self.__folder = folder
+
+    def load(
+        self, packet_name: str, day: date, xtce_hash: str
+    ) -> HKMergeCacheEntry | None:
+        """Load cached data, if it exists and was decoded with the given XTCE definition."""
+
+        data_file, manifest_file = self.__get_paths(packet_name, day)
+
+        if not (data_file.exists() and manifest_file.exists()):
+            logger.debug(
+                f"No cached data for {packet_name} on {day.strftime('%Y-%m-%d')}."
+            )
+            return None
+
+        manifest: dict = json.loads(manifest_file.read_text())
+
+        if manifest.get("xtce_hash") != xtce_hash:
+            logger.info(
+                f"Cached data for {packet_name} on {day.strftime('%Y-%m-%d')} was decoded with a different XTCE definition and will not be used."
+            )
+            return None
+
+        return HKMergeCacheEntry(
+            data=pd.read_pickle(data_file),
+            l0_hashes=set(manifest.get("l0_hashes", [])),
+        )
+
+    def save(
+        self,
+        packet_name: str,
+        day: date,
+        xtce_hash: str,
+        entry: HKMergeCacheEntry,
+    ) -> None:
+        """Save decoded data for a packet and day, replacing any existing entry."""
+
+        data_file, manifest_file = self.__get_paths(packet_name, day)
+        data_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Remove the manifest first, so that a partially written entry is never used.
+        manifest_file.unlink(missing_ok=True)
+
+        entry.data.to_pickle(data_file)
+        manifest_file.write_text(
+            json.dumps(
+                {"xtce_hash": xtce_hash, "l0_hashes": sorted(entry.l0_hashes)},
+                indent=2,
+            )
+        )
+
+        logger.debug(
+            f"Cached {len(entry.data)} rows for {packet_name} on {day.strftime('%Y-%m-%d')} in {data_file}."
+        )
+
+    def __get_paths(self, packet_name: str, day: date) -> tuple[Path, Path]:
+        base_path = self.__folder / packet_name / day.strftime("%Y%m%d")
+        return base_path.with_suffix(".pkl"), base_path.with_suffix(".json")
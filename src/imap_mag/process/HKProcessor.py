@@ -1,22 +1,27 @@
 import collections
 import logging
-import re
 from collections.abc import Generator
+from concurrent.futures import Future, ProcessPoolExecutor
 from copy import deepcopy
 from datetime import date, datetime
 from functools import cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import space_packet_parser as spp
 import xarray as xr
 from rich.progress import track
 from space_packet_parser.exceptions import UnrecognizedPacketTypeError
 
+from imap_mag.config.HKOutputFormat import HKOutputFormat
+from imap_mag.config.ProcessConfig import ProcessConfig
 from imap_mag.io import FileFinder
 from imap_mag.io.file import HKBinaryPathHandler, HKDecodedPathHandler, IFilePathHandler
 from imap_mag.process.FileProcessor import FileProcessor
 from imap_mag.process.get_packet_definition_folder import get_packet_definition_folder
+from imap_mag.process.HKBulkDecoder import HKBulkDecoder, normalise_field_name
+from imap_mag.process.HKMergeCache import HKMergeCache, HKMergeCacheEntry
 from imap_mag.process.HKProcessSettings import HKProcessSettings
 from imap_mag.util import (
     CONSTANTS,
@@ -41,12 +46,127 @@ def _load_xtce_cached(xtce_path: str) -> spp.xtce.definitions.XtcePacketDefiniti
     return spp.load_xtce(xtce_path)
 
 
+@cache
+def _load_field_names_cached(xtce_path: str) -> dict[str, str]:
+    """Map the parameter names of an XTCE definition to the column names used in HK files."""
+    return {
+        name: normalise_field_name(name)
+        for name in _load_xtce_cached(xtce_path).parameters
+    }
+
+
+@cache
+def _hash_file_cached(file: str) -> str:
+    """Hash a (static) file once per process."""
+    return IFilePathHandler.default_file_hash(Path(file))
+
+
+def _initialize_decode_worker(packet_definition_paths: list[Path]) -> None:
+    """Preload the XTCE definitions in a decode worker process."""
+    for packet_definition_path in packet_definition_paths:
+        _load_field_names_cached(str(packet_definition_path))
+
+
+def _decommutate_subsystem(
+    packet_file: CCSDSBinaryPacketFile, packet_definition_path: Path
+) -> dict[int, dict]:
+    """Decommutate the packets of a single subsystem in a binary file."""
+
+    logger.debug(f"Processing {packet_file.file!s} with {packet_definition_path}.")
+
+    data_dict: dict[int, dict] = dict()
+
+    # Decode fixed-layout packets in bulk, and fall back to parsing
+    # packet by packet for ApIDs whose layout varies between packets.
+    bulk_decoder = HKBulkDecoder(
+        packet_definition_path,
+        _load_xtce_cached(str(packet_definition_path)),
+    )
+    fallback_apids: set[int] = set()
+
+    for apid, columns in bulk_decoder.decode(
+        packet_file.read_bytes(), packet_file.get_packet_index()
+    ).items():
+        if columns is None:
+            fallback_apids.add(apid)
+            data_dict.setdefault(apid, collections.defaultdict(list))
+        else:
+            data_dict[apid] = columns
+
+    if not fallback_apids:
+        return data_dict
+
+    logger.info(
+        f"Decoding ApIDs {', '.join(str(apid) for apid in sorted(fallback_apids))} in {packet_file.file!s} packet by packet."
+    )
+
+    field_names: dict[str, str] = _load_field_names_cached(str(packet_definition_path))
+
+    for packet, apid in HKProcessor._packet_generator(
+        packet_file=packet_file,
+        xtce_packet_definition=packet_definition_path,
+        apids=fallback_apids,
+    ):
+        packet_content = packet.user_data | packet.header
+
+        for key, value in packet_content.items():
+            if value is None:
+                value = value.raw_value
+            elif hasattr(value, "decode"):
+                value = int.from_bytes(value, byteorder="big")
+
+            packet_field_name = field_names.get(key) or normalise_field_name(key)
+
+            data_dict[apid][packet_field_name].append(value)
+
+    return data_dict
+
+
+def _convert_to_datasets(data_dict: dict[int, dict]) -> dict[int, xr.Dataset]:
+    """Convert decommutated data to xarray datasets, indexed by epoch."""
+
+    dataset_dict: dict[int, xr.Dataset] = {}
+
+    for apid, data in data_dict.items():
+        if not data:
+            continue
+
+        time_key = next(iter(data.keys()))
+        time_data = TimeConversion.convert_met_to_j2000ns(data[time_key])
+
+        ds = xr.Dataset(
+            {key: ("epoch", value) for key, value in data.items()},
+            coords={"epoch": time_data},
+        )
+        ds = ds.sortby("epoch")
+
+        dataset_dict[apid] = ds
+
+    return dataset_dict
+
+
 class HKProcessor(FileProcessor):
     __xtcePacketDefinitionFolder: Path
 
-    def __init__(self, work_folder: Path, datastore_finder: FileFinder) -> None:
+    def __init__(
+        self,
+        work_folder: Path,
+        datastore_finder: FileFinder,
+        process_config: ProcessConfig | None = None,
+    ) -> None:
         self.__work_folder = work_folder
         self.__datastore_finder = datastore_finder
+        self.__merge_cache: HKMergeCache | None = (
+            HKMergeCache(process_config.hk_merge_cache)
+            if process_config and process_config.hk_merge_cache
+            else None
+        )
+        self.__decode_workers: int | None = (
+            process_config.hk_decode_workers if process_config else 1
+        )
+        self.__output_format: HKOutputFormat = (
+            process_config.hk_output_format if process_config else HKOutputFormat.CSV
+        )
 
     def is_supported(self, file: Path) -> bool:
         return file.suffix in [".pkts", ".bin"]
@@ -56,20 +176,23 @@ class HKProcessor(FileProcessor):
             packet_definition
         )
 
+    @staticmethod
     def _packet_generator(
-        self,
-        packet_file: str | Path,
+        packet_file: CCSDSBinaryPacketFile,
         xtce_packet_definition: str | Path,
+        apids: set[int] | None = None,
     ) -> Generator[tuple[spp.SpacePacket, int], None, None]:
         """
         Parse packets from a packet file.
 
         Parameters
         ----------
-        packet_file : str | Path
-            Path to data packet path with filename.
+        packet_file : CCSDSBinaryPacketFile
+            Packet file, whose packet index is used to locate packets.
         xtce_packet_definition : str | Path
             Path to XTCE file with filename.
+        apids : set[int] | None
+            If provided, only packets with these ApIDs are parsed.
 
         Yields
         ------
@@ -79,17 +202,26 @@ class HKProcessor(FileProcessor):
         # Set up the parser from the input packet definition (cached across calls).
         packet_definition = _load_xtce_cached(str(xtce_packet_definition))
 
-        with open(packet_file, "rb") as binary_data:
-            for binary_packet in spp.ccsds_generator(binary_data):
-                try:
-                    packet = packet_definition.parse_bytes(binary_packet)
-                except UnrecognizedPacketTypeError as e:
-                    # NOTE: Not all of our definitions have all of the APIDs
-                    #       we may encounter, so we only want to process ones
-                    #       we can actually parse.
-                    logger.warning(e)
-                    continue
-                yield packet, binary_packet.apid
+        data = packet_file.read_bytes()
+        index = packet_file.get_packet_index()
+
+        for offset, length, apid in zip(
+            index.offsets.tolist(), index.lengths.tolist(), index.apids.tolist()
+        ):
+            if (apids is not None) and (apid not in apids):
+                continue
+
+            try:
+                packet = packet_definition.parse_bytes(
+                    data[offset : offset + length].tobytes()
+                )
+            except UnrecognizedPacketTypeError as e:
+                # NOTE: Not all of our definitions have all of the APIDs
+                #       we may encounter, so we only want to process ones
+                #       we can actually parse.
+                logger.warning(e)
+                continue
+            yield packet, apid
 
     @staticmethod
     def _add_or_concat_dataframe(
@@ -113,8 +245,16 @@ class HKProcessor(FileProcessor):
             files, raise_on_error=raise_on_error
         )
 
+        # Identify input files by content, so that they are recognized once they
+        # have been added to the datastore.
+        input_hashes: set[str] = (
+            {IFilePathHandler.default_file_hash(file) for file in files}
+            if self.__merge_cache
+            else set()
+        )
+
         # Load data for each ApID.
-        datastore_data = self.__load_datastore_data(input_data)
+        datastore_data, l0_hashes = self.__load_datastore_data(input_data, input_hashes)
 
         # The new (input) data is added last, such that it overrides existing data with same
         # APID-SHCOARSE-SEQCNT triplet, in case any new data is received.
@@ -138,25 +278,25 @@ class HKProcessor(FileProcessor):
                     packet_name
                 ),
                 content_date=None,
-                extension="csv",
+                extension=self.__output_format.value,
             )
 
             # Split data by day.
-            dates: list[date] = TimeConversion.convert_j2000ns_to_date(
-                data.index.values
+            day_codes = TimeConversion.convert_j2000ns_to_day_code(
+                data.index.values, utc=True
             )
             logger.info(
                 f"Splitting data for ApID {apid} ({packet_name}) into separate files for each day:\n"
-                f"{', '.join(d.strftime('%Y%m%d') for d in sorted(set(dates)))}"
+                f"{', '.join(TimeConversion.convert_day_code_to_date(d).strftime('%Y%m%d') for d in np.unique(day_codes))}"
             )
 
-            for day_info, daily_data in data.groupby(dates):
-                day: date = day_info[0] if isinstance(day_info, tuple) else day_info  # type: ignore
+            for day_code, daily_data in data.groupby(day_codes):
+                day: date = TimeConversion.convert_day_code_to_date(day_code)  # type: ignore
 
                 # Add a new column for the date in ISO format
                 daily_data["time_met_iso"] = pd.Series(
                     data=TimeConversion.convert_j2000ns_to_isostring(
-                        daily_data.index.values
+                        daily_data.index.values, utc=True
                     ),
                     index=daily_data.index,
                     dtype=str,
@@ -176,19 +316,46 @@ class HKProcessor(FileProcessor):
                 )
                 processed_files[path] = handler
 
+                if self.__merge_cache:
+                    self.__merge_cache.save(
+                        packet_name,
+                        day,
+                        self.__get_xtce_hash(packet),
+                        HKMergeCacheEntry(
+                            data=daily_data.drop(
+                                columns=["time_met_iso", "epoch_iso"]
+                            ).set_index(CONSTANTS.CCSDS_FIELD.EPOCH),
+                            l0_hashes=l0_hashes.get((apid, day), set()) | input_hashes,
+                        ),
+                    )
+
         return processed_files
 
     def __load_datastore_data(
-        self, input_data: dict[int, pd.DataFrame], raise_on_error: bool = False
-    ) -> dict[int, pd.DataFrame]:
-        """Load existing data from the datastore for each ApID and day."""
+        self,
+        input_data: dict[int, pd.DataFrame],
+        input_hashes: set[str],
+        raise_on_error: bool = False,
+    ) -> tuple[dict[int, pd.DataFrame], dict[tuple[int, date], set[str]]]:
+        """
+        Load existing data from the datastore for each ApID and day.
+
+        Also returns the hashes of the L0 files in the datastore for each ApID and day.
+        These are only computed when the merge cache is enabled.
+        """
 
         datastore_data: dict[int, pd.DataFrame] = dict()
+        l0_hashes: dict[tuple[int, date], set[str]] = dict()
         days_by_apid: dict[int, set[date]] = {}
 
         for apid, data in input_data.items():
             days_by_apid.setdefault(apid, set()).update(
-                TimeConversion.convert_j2000ns_to_date(data.index.values)
+                TimeConversion.convert_day_code_to_date(day_code)
+                for day_code in np.unique(
+                    TimeConversion.convert_j2000ns_to_day_code(
+                        data.index.values, utc=True
+                    )
+                )
             )
 
         for apid, days in days_by_apid.items():
@@ -214,6 +381,36 @@ class HKProcessor(FileProcessor):
                     l0_path_handler, throw_if_not_found=False
                 )
 
+                if self.__merge_cache:
+                    day_hashes: dict[Path, str] = {
+                        file: IFilePathHandler.default_file_hash(file)
+                        for file in day_files
+                    }
+                    l0_hashes[(apid, day)] = set(day_hashes.values())
+
+                    cached_entry: HKMergeCacheEntry | None = self.__merge_cache.load(
+                        packet_name, day, self.__get_xtce_hash(packet)
+                    )
+
+                    # The cache can only be used if all the data in it is still available,
+                    # otherwise the day is rebuilt from the datastore.
+                    if cached_entry and cached_entry.l0_hashes.issubset(
+                        l0_hashes[(apid, day)] | input_hashes
+                    ):
+                        datastore_data[apid] = self._add_or_concat_dataframe(
+                            datastore_data, apid, cached_entry.data
+                        )
+
+                        day_files = [
+                            file
+                            for file, file_hash in day_hashes.items()
+                            if file_hash not in (cached_entry.l0_hashes | input_hashes)
+                        ]
+
+                        logger.info(
+                            f"Merging {len(day_files)} new files for {packet_name} on {day.strftime('%Y-%m-%d')} with cached data."
+                        )
+
                 if not day_files:
                     logger.debug(
                         f"No existing files found for {packet_name} on {day.strftime('%Y-%m-%d')} in datastore."
@@ -233,7 +430,13 @@ class HKProcessor(FileProcessor):
                     datastore_data, apid, day_data[apid]
                 )
 
-        return datastore_data
+        return datastore_data, l0_hashes
+
+    def __get_xtce_hash(self, packet: HKPacket) -> str:
+        """Get the hash of the XTCE definition used to decode the packet."""
+        return _hash_file_cached(
+            str(self.__xtcePacketDefinitionFolder / packet.instrument.tlm_db_file)
+        )
 
     def __load_and_decommutate_files(
         self, files: list[Path], raise_on_error: bool = False
@@ -242,15 +445,7 @@ class HKProcessor(FileProcessor):
 
         dataframe_by_apid: dict[int, pd.DataFrame] = dict()
 
-        for file in track(files, description="Decommutating HK files..."):
-            try:
-                results: dict[int, xr.Dataset] = self.__decommutate_packets(file)
-            except Exception as e:
-                logger.error(f"Failed to decommutate packets from {file}", exc_info=e)
-                if raise_on_error:
-                    raise e
-                continue
-
+        for file, results in self.__decommutate_files(files, raise_on_error):
             logger.info(
                 f"Found {len(results.keys())} ApIDs ({', '.join(str(key) for key in results.keys())}) in {file}."
             )
@@ -262,78 +457,138 @@ class HKProcessor(FileProcessor):
 
         return dataframe_by_apid
 
-    def __decommutate_packets(self, file: Path) -> dict[int, xr.Dataset]:
-        """Decommutate packets from a binary file by using the XTCE definitions."""
+    def __decommutate_files(
+        self, files: list[Path], raise_on_error: bool
+    ) -> list[tuple[Path, dict[int, xr.Dataset]]]:
+        """
+        Decommutate packets from binary files, in the order the files are given.
 
-        dataset_dict: dict[int, xr.Dataset] = {}
+        Each file and subsystem is decoded as a separate task, which are run in a
+        process pool if more than one decode worker is configured.
+        """
 
-        # Extract data from binary file.
-        data_dict: dict[int, dict] = dict()
+        decoded_files: list[tuple[Path, dict[int, xr.Dataset]]] = []
+        tasks: list[tuple[Path, CCSDSBinaryPacketFile, list[Path]]] = []
 
-        apids: set[int] = CCSDSBinaryPacketFile(file).get_apids()
-        apids = self.__filter_unknown_apids(apids)
+        for file in files:
+            try:
+                packet_file = CCSDSBinaryPacketFile(file)
+                packet_definition_paths = self.__get_packet_definitions(packet_file)
+            except Exception as e:
+                logger.error(f"Failed to decommutate packets from {file}", exc_info=e)
+                if raise_on_error:
+                    raise e
+                continue
 
-        subsystems: set[Subsystem] = {
-            HKPacket.from_apid(apid).instrument for apid in apids
-        }
+            tasks.append((file, packet_file, packet_definition_paths))
 
-        logger.info(
-            f"Found {len(subsystems)} subsystems in {file!s}: {', '.join(s.name for s in subsystems)}"
-        )
+        if self.__decode_workers == 1:
+            for file, packet_file, packet_definition_paths in track(
+                tasks, description="Decommutating HK files..."
+            ):
+                try:
+                    data_dict: dict[int, dict] = dict()
+
+                    for packet_definition_path in packet_definition_paths:
+                        data_dict.update(
+                            _decommutate_subsystem(packet_file, packet_definition_path)
+                        )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to decommutate packets from {file}", exc_info=e
+                    )
+                    if raise_on_error:
+                        raise e
+                    continue
 
-        for subsystem in subsystems:
-            logger.debug(f"Processing subsystem: {subsystem.name}")
+                decoded_files.append((file, _convert_to_datasets(data_dict)))
 
-            packet_definition_path = (
-                self.__xtcePacketDefinitionFolder / subsystem.tlm_db_file
-            )
+            return decoded_files
 
-            if not packet_definition_path.exists():
-                raise FileNotFoundError(
-                    f"Packet definition file not found for subsystem {subsystem.name} at expected path: {packet_definition_path}"
+        all_packet_definition_paths: list[Path] = sorted(
+            {path for _, _, paths in tasks for path in paths}
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=self.__decode_workers,
+            initializer=_initialize_decode_worker,
+            initargs=(all_packet_definition_paths,),
+        ) as executor:
+            futures_by_file: list[tuple[Path, list[Future[dict[int, dict]]]]] = [
+                (
+                    file,
+                    [
+                        executor.submit(
+                            _decommutate_subsystem, packet_file, packet_definition_path
+                        )
+                        for packet_definition_path in packet_definition_paths
+                    ],
                 )
+                for file, packet_file, packet_definition_paths in tasks
+            ]
 
-            for packet, apid in self._packet_generator(
-                packet_file=file, xtce_packet_definition=packet_definition_path
+            # Merge results in the order the files and subsystems were submitted,
+            # regardless of the order in which they complete.
+            for file, futures in track(
+                futures_by_file, description="Decommutating HK files..."
             ):
-                data_dict.setdefault(apid, collections.defaultdict(list))
+                try:
+                    data_dict = dict()
 
-                packet_content = packet.user_data | packet.header
+                    for future in futures:
+                        data_dict.update(future.result())
+                except Exception as e:
+                    logger.error(
+                        f"Failed to decommutate packets from {file}", exc_info=e
+                    )
+                    if raise_on_error:
+                        executor.shutdown(cancel_futures=True)
+                        raise e
+                    continue
 
-                for key, value in packet_content.items():
-                    if value is None:
-                        value = value.raw_value
-                    elif hasattr(value, "decode"):
-                        value = int.from_bytes(value, byteorder="big")
+                decoded_files.append((file, _convert_to_datasets(data_dict)))
 
-                    match_packet_name_prefix_regex = r"^\w+?_\w+?\."
-                    packet_field_name = re.sub(
-                        match_packet_name_prefix_regex, "", key.lower()
-                    )
+        return decoded_files
+
+    def __get_packet_definitions(
+        self, packet_file: CCSDSBinaryPacketFile
+    ) -> list[Path]:
+        """Get the XTCE definitions needed to decode the packets in a file, one per subsystem."""
+
+        apids: set[int] = packet_file.get_apids()
+        apids = self.__filter_unknown_apids(apids)
+
+        subsystems: list[Subsystem] = [
+            subsystem
+            for subsystem in Subsystem
+            if any(HKPacket.from_apid(apid).instrument == subsystem for apid in apids)
+        ]
 
-                    data_dict[apid][packet_field_name].append(value)
+        logger.info(
+            f"Found {len(subsystems)} subsystems in {packet_file.file!s}: {', '.join(s.name for s in subsystems)}"
+        )
 
-            # Convert data to xarray datasets.
-            for apid, data in data_dict.items():
-                time_key = next(iter(data.keys()))
-                time_data = TimeConversion.convert_met_to_j2000ns(data[time_key])
+        packet_definition_paths: list[Path] = []
+
+        for subsystem in subsystems:
+            packet_definition_path = (
+                self.__xtcePacketDefinitionFolder / subsystem.tlm_db_file
+            )
 
-                ds = xr.Dataset(
-                    {key: ("epoch", value) for key, value in data.items()},
-                    coords={"epoch": time_data},
+            if not packet_definition_path.exists():
+                raise FileNotFoundError(
+                    f"Packet definition file not found for subsystem {subsystem.name} at expected path: {packet_definition_path}"
                 )
-                ds = ds.sortby("epoch")
 
-                dataset_dict[apid] = ds
+            packet_definition_paths.append(packet_definition_path)
 
-        return dataset_dict
+        return packet_definition_paths
 
     def __filter_unknown_apids(self, apids: set[int]) -> set[int]:
         """Filter out unknown ApIDs."""
 
-        non_mag_apids: set[int] = {
-            apid for apid in apids if apid not in HKPacket.apids()
-        }
+        known_apids: set[int] = set(HKPacket.apids())
+        non_mag_apids: set[int] = {apid for apid in apids if apid not in known_apids}
 
         if non_mag_apids:
             logger.warning(
@@ -351,14 +606,14 @@ class HKProcessor(FileProcessor):
         path_handler: HKDecodedPathHandler,
         process_settings: HKProcessSettings,
     ) -> tuple[Path, HKDecodedPathHandler]:
-        """Save data by day to a CSV file in the work folder."""
+        """Save data by day to a CSV or Parquet file in the work folder."""
 
         logger.debug(f"Generating file for {day.strftime('%Y-%m-%d')}.")
 
         path_handler.content_date = datetime.combine(day, datetime.min.time())
         file_path = self.__work_folder / path_handler.get_filename()
 
-        # Save to CSV.
+        # Save to file.
         daily_data.drop_duplicates(
             subset=process_settings.drop_duplicate_variables,
             keep="last",
@@ -368,7 +623,11 @@ class HKProcessor(FileProcessor):
             by=process_settings.sort_variables,
             inplace=True,
         )
-        daily_data.to_csv(file_path, index=False)
+
+        if self.__output_format == HKOutputFormat.Parquet:
+            daily_data.to_parquet(file_path, index=False, compression="zstd")
+        else:
+            daily_data.to_csv(file_path, index=False)
 
         # Use a deep-copy, otherwise the same handle will be used for all files.
         return file_path, deepcopy(path_handler)
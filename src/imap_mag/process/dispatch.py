@@ -1,6 +1,7 @@
 import logging
 from pathlib import Path
 
+from imap_mag.config.ProcessConfig import ProcessConfig
 from imap_mag.io.FileFinder import FileFinder
 from imap_mag.process.FileProcessor import FileProcessor
 from imap_mag.process.HKProcessor import HKProcessor
@@ -9,7 +10,10 @@ logger = logging.getLogger(__name__)
 
 
 def dispatch(
-    file: Path | list[Path], work_folder: Path, datastore_finder: FileFinder
+    file: Path | list[Path],
+    work_folder: Path,
+    datastore_finder: FileFinder,
+    process_config: ProcessConfig | None = None,
 ) -> FileProcessor:
     """Dispatch a file or a list of files to the appropriate processor."""
 
@@ -22,7 +26,7 @@ def dispatch(
         file = file[0]
 
     for processor_type in available_processor_types:
-        processor = processor_type(work_folder, datastore_finder)
+        processor = processor_type(work_folder, datastore_finder, process_config)
 
         if processor.is_supported(file):
             logger.info(f"File {file} is supported by {processor_type.__name__}.")
@@ -0,0 +1,187 @@
+"""Program to publish files to the SDC."""
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+from imap_mag.client.SDCDataAccess import SDCDataAccess, SDCUploadError
+from imap_mag.util.FileHash import FileHash
+from imap_mag.util.retry import call_with_retry
+
+logger = logging.getLogger(__name__)
+
+
+class PublishToSDC:
+    """Upload files to the SDC."""
+
+    STATE_FILE_NAME: str = "sdc-upload-state.json"
+
+    __data_access: SDCDataAccess
+    __max_concurrent_uploads: int
+    __retries: int
+    __retry_delay_seconds: float
+    __state_file: Path | None
+    __sdc_url: str
+
+    def __init__(
+        self,
+        data_access: SDCDataAccess,
+        max_concurrent_uploads: int = 1,
+        retries: int = 0,
+        retry_delay_seconds: float = 5,
+        state_file: Path | None = None,
+    ) -> None:
+        """Initialize SDC publisher.
+
+        Files are uploaded up to `max_concurrent_uploads` at a time, each retried
+        up to `retries` times on transient errors. If `state_file` is given, it
+        records the files uploaded to each SDC, so that uploading them to the same
+        SDC again is skipped.
+        """
+
+        self.__data_access = data_access
+        self.__max_concurrent_uploads = max_concurrent_uploads
+        self.__retries = retries
+        self.__retry_delay_seconds = retry_delay_seconds
+        self.__state_file = state_file
+        self.__sdc_url = data_access.get_url_base()
+
+        self.__lock = threading.Lock()
+        self.__uploaded: dict[str, str] = self.__load_state()
+
+    def upload_files(self, files: list[Path]) -> dict[Path, SDCUploadError]:
+        """Upload files to the SDC concurrently.
+
+        Files already uploaded with the same content, according to the state file,
+        are skipped. All files are attempted, and those that failed to upload are
+        returned with their error.
+        """
+
+        failed: dict[Path, SDCUploadError] = dict()
+        pending: list[tuple[Path, str]] = []
+
+        for file in files:
+            file_hash = FileHash.hash(file)
+
+            if self.__uploaded.get(file.name) == file_hash:
+                logger.info(f"File {file} already published. Skipping.")
+            else:
+                pending.append((file, file_hash))
+
+        if len(pending) < len(files):
+            logger.info(
+                f"Skipped {len(files) - len(pending)} files already published, according to {self.__state_file}."
+            )
+
+        def upload(file: Path, file_hash: str) -> None:
+            try:
+                self.__upload_with_retry(file)
+            except SDCUploadError as e:
+                logger.warning(
+                    f"Failed to publish file {file}: {e}. Continuing with next file."
+                )
+                failed[file] = e
+                return
+
+            self.__save_state(file.name, file_hash)
+
+        with ThreadPoolExecutor(max_workers=self.__max_concurrent_uploads) as executor:
+            uploads = [
+                executor.submit(upload, file, file_hash) for file, file_hash in pending
+            ]
+
+            for future in uploads:
+                future.result()
+
+        return failed
+
+    def __upload_with_retry(self, file: Path) -> None:
+        """Upload a file to the SDC, retrying on transient errors."""
+
+        call_with_retry(
+            lambda: self.__data_access.upload(file.as_posix()),
+            retries=self.__retries,
+            delay_seconds=self.__retry_delay_seconds,
+            is_retryable=SDCDataAccess.is_transient_error,
+            description=f"Upload of {file}",
+        )
+
+    def __load_state(self) -> dict[str, str]:
+        """Files uploaded to this SDC in previous runs, by name, with the hash of
+        their content."""
+
+        if self.__state_file is None:
+            return dict()
+
+        return dict(self.__read_state().get(self.__sdc_url, dict()))
+
+    def __read_state(self) -> dict[str, dict[str, str]]:
+        """Files uploaded in previous runs, by SDC URL and then by name."""
+
+        assert self.__state_file is not None
+
+        if not self.__state_file.exists():
+            return dict()
+
+        try:
+            uploaded = json.loads(self.__state_file.read_text())["uploaded"]
+            return {url: dict(files) for url, files in uploaded.items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(
+                f"Ignoring invalid publish state file {self.__state_file}: {e}"
+            )
+            return dict()
+
+    def __save_state(self, file_name: str, file_hash: str) -> None:
+        """Record an uploaded file.
+
+        The state file is re-read and merged while holding a lock on it, so that
+        other runs publishing from the same work folder do not lose their entries,
+        and replaced atomically so that it is never left partially written.
+        """
+
+        with self.__lock:
+            self.__uploaded[file_name] = file_hash
+
+            if self.__state_file is None:
+                return
+
+            with self.__lock_state_file():
+                state = self.__read_state()
+                state.setdefault(self.__sdc_url, dict())[file_name] = file_hash
+
+                partial_file = self.__state_file.with_name(
+                    f".{self.__state_file.name}.{uuid.uuid4().hex}.part"
+                )
+                try:
+                    partial_file.write_text(
+                        json.dumps({"uploaded": state}, indent=2, sort_keys=True)
+                    )
+                    os.replace(partial_file, self.__state_file)
+                finally:
+                    partial_file.unlink(missing_ok=True)
+
+    @contextlib.contextmanager
+    def __lock_state_file(self) -> Iterator[None]:
+        """Hold an exclusive lock on the state file, shared with other processes."""
+
+        assert self.__state_file is not None
+        lock_file = self.__state_file.with_name(f".{self.__state_file.name}.lock")
+
+        with open(lock_file, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+
+            # the lock is released when the file is closed
+            yield
@@ -1,24 +1,12 @@
-import io
 import logging
-import os
 from datetime import date
 from pathlib import Path
 
-# ccsdspy logs an INFO message to its own console handler on import (before
-# our application logging is configured), and its init code resets the
-# logger's level unconditionally, so suppressing it via setLevel beforehand
-# doesn't work. Disable the logger just for the duration of the import.
-_ccsdspy_logger = logging.getLogger("ccsdspy")
-_ccsdspy_logger.disabled = True
-import ccsdspy  # noqa: E402
-from ccsdspy.utils import iter_packet_bytes  # noqa: E402
+import numpy as np
+import numpy.typing as npt
 
-_ccsdspy_logger.disabled = False
-_ccsdspy_logger.setLevel(logging.WARNING)
-
-from rich.progress import Progress  # noqa: E402
-
-from imap_mag.util.TimeConversion import TimeConversion  # noqa: E402
+from imap_mag.util.PacketIndex import PacketIndex
+from imap_mag.util.TimeConversion import TimeConversion
 
 logger = logging.getLogger(__name__)
 
@@ -29,97 +17,71 @@ class CCSDSBinaryPacketFile:
     """
 
     file: Path
-    packet_definition: ccsdspy.FixedLength
 
     def __init__(self, file: Path):
         self.file = file
-        self.packet_definition = ccsdspy.FixedLength(
-            [
-                ccsdspy.PacketField(name="SHCOARSE", data_type="uint", bit_length=32),
-            ]
-        )
+        self.__packet_index: PacketIndex | None = None
 
-    def get_apids(self) -> set[int]:
-        """Retrieve all ApIDs."""
+    def read_bytes(self) -> npt.NDArray[np.uint8]:
+        """Memory-map the file contents."""
+
+        if self.file.stat().st_size == 0:
+            return np.empty(0, dtype=np.uint8)
 
-        apids: set[int] = set()
+        return np.memmap(self.file, dtype=np.uint8, mode="r")
 
-        for packet_bytes in iter_packet_bytes(self.file, include_primary_header=True):
-            packet: dict | None = self.__load_bytes_with_definition(packet_bytes)
+    def get_packet_index(self) -> PacketIndex:
+        """Retrieve the (cached) index of all packets in the file."""
 
-            if packet is None:
-                continue
+        if self.__packet_index is None:
+            self.__packet_index = PacketIndex.from_bytes(self.read_bytes(), self.file)
 
-            apids.update(packet["CCSDS_APID"])
+        return self.__packet_index
 
-        return apids
+    def get_apids(self) -> set[int]:
+        """Retrieve all ApIDs."""
+
+        return {int(apid) for apid in np.unique(self.get_packet_index().apids)}
 
     def get_days_by_apid(self) -> dict[int, set[date]]:
         """Retrieve SCLK days for each ApID."""
 
-        days_by_apid: dict[int, set[date]] = dict()
+        index = self.get_packet_index()
+        day_codes = self.__get_day_codes(index)
 
-        size = os.path.getsize(self.file)
+        days_by_apid: dict[int, set[date]] = dict()
 
-        with Progress(refresh_per_second=1) as progress:
-            task = progress.add_task(
-                f"Retrieving ApIDs and days in {self.file}...", total=size
+        for apid, day_code in np.unique(
+            np.stack([index.apids.astype(np.int64), day_codes], axis=1), axis=0
+        ).tolist():
+            days_by_apid.setdefault(apid, set()).add(
+                TimeConversion.convert_day_code_to_date(day_code)
             )
 
-            for packet_bytes in iter_packet_bytes(
-                self.file, include_primary_header=True
-            ):
-                progress.update(task, advance=len(packet_bytes))
-                packet: dict | None = self.__load_bytes_with_definition(packet_bytes)
-
-                if packet is None:
-                    continue
-
-                for apid in packet["CCSDS_APID"]:
-                    days_by_apid.setdefault(int(apid), set()).update(
-                        TimeConversion.convert_met_to_date(packet["SHCOARSE"])
-                    )
-
         return days_by_apid
 
     def split_packets_by_day(self) -> dict[date, bytearray]:
         """Splits packets in a binary file by SCLK day."""
 
-        packets_by_day: dict[date, bytearray] = dict()
-
-        size = os.path.getsize(self.file)
-
-        with Progress(refresh_per_second=1) as progress:
-            task = progress.add_task(f"Splitting {self.file} by S/C day...", total=size)
-
-            for packet_bytes in iter_packet_bytes(
-                self.file, include_primary_header=True
-            ):
-                progress.update(task, advance=len(packet_bytes))
-                packet: dict | None = self.__load_bytes_with_definition(packet_bytes)
-
-                if packet is None:
-                    continue
+        index = self.get_packet_index()
+        day_codes = self.__get_day_codes(index)
 
-                day: list[date] = TimeConversion.convert_met_to_date(packet["SHCOARSE"])
-                packets_by_day.setdefault(day[0], bytearray()).extend(packet_bytes)
+        data = self.read_bytes()
 
-        return packets_by_day
+        return {
+            TimeConversion.convert_day_code_to_date(day_code): index.select(
+                day_codes == day_code
+            ).gather(data)
+            for day_code in dict.fromkeys(day_codes.tolist())
+        }
 
-    def __load_bytes_with_definition(self, packet_bytes: bytes) -> dict | None:
-        """Load bytes with the packet definition, handling potential errors."""
-
-        try:
-            packet = self.packet_definition.load(
-                io.BytesIO(packet_bytes), include_primary_header=True
-            )
-        except (IndexError, RuntimeError) as e:
-            logger.error(
-                f"Error decoding {len(packet_bytes)} bytes in {self.file}", exc_info=e
-            )
-            packet = None
+    @staticmethod
+    def __get_day_codes(index: PacketIndex) -> npt.NDArray[np.int64]:
+        """Convert SHCOARSE of each packet to SCLK (UTC) day code."""
 
-        return packet
+        return TimeConversion.convert_j2000ns_to_day_code(
+            TimeConversion.convert_met_to_j2000ns(index.shcoarse), utc=True
+        )
 
     @staticmethod
     def combine_days_by_apid(
@@ -0,0 +1,95 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import ClassVar
+
+logger = logging.getLogger(__name__)
+
+
+class FileHash:
+    """Hash files in chunks, caching the results for the lifetime of the process.
+
+    Hashes are cached by the file's path, size, modification time and inode, so
+    a file that has not changed is never hashed twice, while a file that has been
+    rewritten or replaced is hashed again.
+
+    Files modified within `RACY_INTERVAL_NS` of being hashed are not cached, as
+    the modification time may not change if they are rewritten straight away.
+    """
+
+    CHUNK_SIZE: int = 1024 * 1024
+    MAX_CACHE_SIZE: int = 10_000
+    RACY_INTERVAL_NS: int = 2_000_000_000
+
+    __cache: ClassVar[OrderedDict[tuple, str]] = OrderedDict()
+    __lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def hash(cls, file: Path) -> str:
+        """MD5 hex digest of the file contents."""
+
+        stat = os.stat(file)
+        file_key = cls.__get_file_key(file, stat)
+
+        with cls.__lock:
+            digest = cls.__cache.get(file_key)
+
+            if digest is not None:
+                cls.__cache.move_to_end(file_key)
+                return digest
+
+        hashed_ns = time.time_ns()
+        hasher = hashlib.md5()
+
+        with open(file, "rb") as f:
+            while chunk := f.read(cls.CHUNK_SIZE):
+                hasher.update(chunk)
+
+        logger.debug(f"Computed MD5 hash of {file}.")
+
+        digest = hasher.hexdigest()
+        cls.__add_to_cache(file_key, stat, digest, hashed_ns)
+
+        return digest
+
+    @classmethod
+    def get_cached(cls, file: Path) -> str | None:
+        """MD5 hex digest of the file contents, if already known, without reading the file."""
+
+        file_key = cls.__get_file_key(file, os.stat(file))
+
+        with cls.__lock:
+            return cls.__cache.get(file_key)
+
+    @classmethod
+    def remember(cls, file: Path, digest: str) -> None:
+        """Cache the MD5 hex digest of a file computed elsewhere, e.g. while copying it."""
+
+        stat = os.stat(file)
+        cls.__add_to_cache(cls.__get_file_key(file, stat), stat, digest, time.time_ns())
+
+    @classmethod
+    def __add_to_cache(
+        cls, file_key: tuple, stat: os.stat_result, digest: str, hashed_ns: int
+    ) -> None:
+        if hashed_ns - stat.st_mtime_ns <= cls.RACY_INTERVAL_NS:
+            return
+
+        with cls.__lock:
+            cls.__cache[file_key] = digest
+
+            while len(cls.__cache) > cls.MAX_CACHE_SIZE:
+                cls.__cache.popitem(last=False)
+
+    @staticmethod
+    def __get_file_key(file: Path, stat: os.stat_result) -> tuple:
+        return (os.path.abspath(file), stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls.__lock:
+            cls.__cache.clear()
@@ -85,15 +85,14 @@ class HKPacket(Enum):
     @classmethod
     def apids(cls) -> list[int]:
         """List all HK packet APIDs."""
-        return [hk.apid for hk in HKPacket]
+        return list(_HK_PACKETS_BY_APID.keys())
 
     @classmethod
     def from_apid(cls, apid: int) -> "HKPacket":
         """Get HKPacket from ApID."""
 
-        for hk in cls:
-            if hk.apid == apid:
-                return hk
+        if apid in _HK_PACKETS_BY_APID:
+            return _HK_PACKETS_BY_APID[apid]
 
         if apid < CONSTANTS.MAG_APID_RANGE[0] or apid > CONSTANTS.MAG_APID_RANGE[1]:
             logger.critical(
@@ -119,3 +118,7 @@ class HKPacket(Enum):
             raise ValueError(
                 f"Packet name {packet_name} does not match any known HK packet."
             ) from exception
+
+
+# Lookup of HK packets by ApID, in definition order.
+_HK_PACKETS_BY_APID: dict[int, HKPacket] = {hk.apid: hk for hk in HKPacket}
@@ -0,0 +1,136 @@
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+CCSDS_HEADER_LENGTH_BYTES = 6
+SHCOARSE_LENGTH_BYTES = 4
+
+
+@dataclass(frozen=True)
+class PacketIndex:
+    """Offsets and key header fields of the packets in a CCSDS binary buffer.
+
+    Only packets that are complete and long enough to contain SHCOARSE are
+    indexed. All arrays have one entry per packet, in buffer order.
+    """
+
+    offsets: npt.NDArray[np.int64]
+    lengths: npt.NDArray[np.int64]
+    apids: npt.NDArray[np.uint16]
+    sequence_counts: npt.NDArray[np.uint16]
+    shcoarse: npt.NDArray[np.uint32]
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @classmethod
+    def from_bytes(
+        cls, data: npt.NDArray[np.uint8], source: str | Path = ""
+    ) -> "PacketIndex":
+        """Index all packets in a buffer with a single pass over the packet headers."""
+
+        view = memoryview(data)
+        total_length = len(view)
+
+        offsets: list[int] = []
+        position = 0
+
+        while position < total_length:
+            if total_length - position < CCSDS_HEADER_LENGTH_BYTES:
+                logger.warning(
+                    f"{total_length - position} bytes left to read in {source} is not enough to read a CCSDS header."
+                )
+                break
+
+            packet_length = (
+                ((view[position + 4] << 8) | view[position + 5])
+                + 1
+                + CCSDS_HEADER_LENGTH_BYTES
+            )
+
+            if (total_length - position < packet_length) or (
+                packet_length < CCSDS_HEADER_LENGTH_BYTES + SHCOARSE_LENGTH_BYTES
+            ):
+                logger.error(
+                    f"Error decoding {min(packet_length, total_length - position)} bytes in {source}"
+                )
+            else:
+                offsets.append(position)
+
+            position += packet_length
+
+        offset_array = np.asarray(offsets, dtype=np.int64)
+        headers = (
+            np.asarray(data)[
+                offset_array[:, np.newaxis]
+                + np.arange(CCSDS_HEADER_LENGTH_BYTES + SHCOARSE_LENGTH_BYTES)
+            ]
+            .astype(np.uint32)
+            .reshape(-1, CCSDS_HEADER_LENGTH_BYTES + SHCOARSE_LENGTH_BYTES)
+        )
+
+        return cls(
+            offsets=offset_array,
+            lengths=((headers[:, 4] << 8) | headers[:, 5]).astype(np.int64)
+            + (1 + CCSDS_HEADER_LENGTH_BYTES),
+            apids=(((headers[:, 0] & 0x07) << 8) | headers[:, 1]).astype(np.uint16),
+            sequence_counts=(((headers[:, 2] & 0x3F) << 8) | headers[:, 3]).astype(
+                np.uint16
+            ),
+            shcoarse=(
+                (headers[:, 6] << 24)
+                | (headers[:, 7] << 16)
+                | (headers[:, 8] << 8)
+                | headers[:, 9]
+            ).astype(np.uint32),
+        )
+
+    def select(self, mask: npt.NDArray[np.bool_]) -> "PacketIndex":
+        """Select a subset of packets, preserving their order."""
+
+        return PacketIndex(
+            offsets=self.offsets[mask],
+            lengths=self.lengths[mask],
+            apids=self.apids[mask],
+            sequence_counts=self.sequence_counts[mask],
+            shcoarse=self.shcoarse[mask],
+        )
+
+    def group_by_apid(self) -> dict[int, "PacketIndex"]:
+        """Split the index by ApID, in order of first appearance of each ApID."""
+
+        unique_apids, first_index = np.unique(self.apids, return_index=True)
+
+        return {
+            int(apid): self.select(self.apids == apid)
+            for apid in unique_apids[np.argsort(first_index)]
+        }
+
+    def gather(self, data: npt.NDArray[np.uint8]) -> bytearray:
+        """Concatenate the bytes of the indexed packets.
+
+        Packets that are adjacent in the buffer are copied as a single slice.
+        """
+
+        if len(self) == 0:
+            return bytearray()
+
+        ends = self.offsets + self.lengths
+        run_starts = np.flatnonzero(self.offsets[1:] != ends[:-1]) + 1
+        starts = self.offsets[np.concatenate(([0], run_starts))]
+        stops = ends[np.concatenate((run_starts - 1, [len(self) - 1]))]
+
+        view = memoryview(data)
+        gathered = bytearray(int((stops - starts).sum()))
+        position = 0
+
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            gathered[position : position + stop - start] = view[start:stop]
+            position += stop - start
+
+        return gathered
@@ -1,4 +1,4 @@
-from datetime import date, datetime
+from datetime import UTC, date, datetime, timedelta
 
 import numpy as np
 import numpy.typing as npt
@@ -22,49 +22,127 @@ class TimeConversion:
         )
         return j2000_offset + time_array
 
+    @staticmethod
+    def convert_j2000ns_to_datetime64(
+        j2000ns: npt.ArrayLike,
+        utc: bool = False,
+    ) -> npt.NDArray[np.datetime64]:
+        """
+        Convert nanoseconds from J2000 to timezone-naive datetime64, with microsecond resolution.
+
+        By default, times are in the local timezone, as with `datetime.fromtimestamp`.
+        If `utc` is True, times are in UTC, regardless of the local timezone.
+        """
+        epoch_posix = (
+            CONSTANTS.J2000_EPOCH_POSIX_UTC if utc else CONSTANTS.J2000_EPOCH_POSIX
+        )
+        timestamps = (
+            np.asarray(j2000ns, dtype=float).astype(np.int64) / 1e9 + epoch_posix
+        )
+
+        # Round to microseconds the same way as `datetime.fromtimestamp`.
+        fractions, seconds = np.modf(timestamps)
+        microseconds = np.round(fractions * 1e6).astype(np.int64)
+        seconds = seconds.astype(np.int64) + np.floor_divide(microseconds, 1_000_000)
+        microseconds = np.mod(microseconds, 1_000_000)
+
+        if not utc:
+            seconds = seconds + TimeConversion.__get_local_utc_offsets(seconds)
+
+        return (seconds * 1_000_000 + microseconds).astype("datetime64[us]")
+
+    @staticmethod
+    def __get_local_utc_offsets(
+        posix_seconds: npt.NDArray[np.int64],
+    ) -> npt.NDArray[np.int64]:
+        """Get the local timezone offset from UTC, in seconds, at each POSIX time."""
+
+        # Timezone transitions happen on 15-minute boundaries, so look up the offset
+        # once per 15-minute bucket rather than once per value.
+        buckets, inverse = np.unique(posix_seconds // 900 * 900, return_inverse=True)
+        offsets = np.array(
+            [
+                (
+                    datetime.fromtimestamp(bucket)
+                    - datetime.fromtimestamp(bucket, UTC).replace(tzinfo=None)
+                )
+                // timedelta(seconds=1)
+                for bucket in buckets.tolist()
+            ],
+            dtype=np.int64,
+        )
+
+        return offsets[inverse]
+
+    @staticmethod
+    def convert_j2000ns_to_day_code(
+        j2000ns: npt.ArrayLike,
+        utc: bool = False,
+    ) -> npt.NDArray[np.int64]:
+        """Convert nanoseconds from J2000 to day codes, i.e., number of days since 1970-01-01."""
+        return (
+            TimeConversion.convert_j2000ns_to_datetime64(j2000ns, utc)
+            .astype("datetime64[D]")
+            .astype(np.int64)
+        )
+
+    @staticmethod
+    def convert_day_code_to_date(day_code: int) -> date:
+        """Convert a day code, i.e., number of days since 1970-01-01, to Python date."""
+        return date(1970, 1, 1) + timedelta(days=int(day_code))
+
+    @staticmethod
+    def convert_datetime64_to_isostring(
+        datetimes: npt.NDArray[np.datetime64],
+    ) -> npt.NDArray[np.str_]:
+        """Convert datetime64 to ISO 8601 strings, formatted as `datetime.isoformat`."""
+
+        datetimes = np.asarray(datetimes, dtype="datetime64[us]")
+        seconds = datetimes.astype("datetime64[s]")
+        microseconds = (datetimes - seconds).astype(np.int64)
+
+        iso_seconds = np.datetime_as_string(seconds, unit="s")
+        iso_microseconds = np.char.add(
+            iso_seconds, np.char.add(".", np.char.zfill(microseconds.astype(str), 6))
+        )
+
+        return np.where(microseconds != 0, iso_microseconds, iso_seconds)
+
     @staticmethod
     def convert_j2000ns_to_datetime(
         j2000ns: npt.ArrayLike,
+        utc: bool = False,
     ) -> list[datetime]:
         """Convert nanoseconds from J2000 to Python datetime."""
-        return [
-            datetime.fromtimestamp(j)
-            for j in (
-                np.asarray(j2000ns, dtype=float).astype(np.int64) / 1e9
-                + CONSTANTS.J2000_EPOCH_POSIX
-            )
-        ]
+        return TimeConversion.convert_j2000ns_to_datetime64(j2000ns, utc).tolist()
 
     @staticmethod
     def convert_j2000ns_to_isostring(
         j2000ns: npt.ArrayLike,
+        utc: bool = False,
     ) -> list[str]:
         """Convert nanoseconds from J2000 to ISO 8601 string."""
-        return [
-            datetime.fromtimestamp(j).isoformat()
-            for j in (
-                np.asarray(j2000ns, dtype=float).astype(np.int64) / 1e9
-                + CONSTANTS.J2000_EPOCH_POSIX
-            )
-        ]
+        return TimeConversion.convert_datetime64_to_isostring(
+            TimeConversion.convert_j2000ns_to_datetime64(j2000ns, utc)
+        ).tolist()
 
     @staticmethod
     def convert_j2000ns_to_date(
         j2000ns: npt.ArrayLike,
+        utc: bool = False,
     ) -> list[date]:
         """Convert nanoseconds from J2000 to Python date."""
-        return [
-            date.fromtimestamp(j)
-            for j in (
-                np.asarray(j2000ns, dtype=float).astype(np.int64) / 1e9
-                + CONSTANTS.J2000_EPOCH_POSIX
-            )
-        ]
+        return (
+            TimeConversion.convert_j2000ns_to_datetime64(j2000ns, utc)
+            .astype("datetime64[D]")
+            .tolist()
+        )
 
     @staticmethod
     def convert_met_to_date(
         met: npt.ArrayLike,
         reference_epoch: np.datetime64 = CONSTANTS.IMAP_EPOCH,
+        utc: bool = False,
     ) -> list[date]:
         """
         Convert mission elapsed time (MET) to Python date.
@@ -73,7 +151,7 @@ class TimeConversion:
         This function should NOT be used for science decoding!
         """
         j2000ns = TimeConversion.convert_met_to_j2000ns(met, reference_epoch)
-        return TimeConversion.convert_j2000ns_to_date(j2000ns)
+        return TimeConversion.convert_j2000ns_to_date(j2000ns, utc)
 
     @staticmethod
     def try_extract_iso_like_datetime(dict, key, timezone=None) -> datetime | None:
@@ -2,11 +2,13 @@ from imap_mag.util.CCSDSBinaryPacketFile import CCSDSBinaryPacketFile
 from imap_mag.util.constants import CONSTANTS
 from imap_mag.util.DatetimeProvider import DatetimeProvider
 from imap_mag.util.Environment import Environment
+from imap_mag.util.FileHash import FileHash
 from imap_mag.util.HKPacket import HKPacket
 from imap_mag.util.Humaniser import Humaniser
 from imap_mag.util.Level import HKLevel, ScienceLevel
 from imap_mag.util.MAGMode import MAGMode
 from imap_mag.util.MAGSensor import MAGSensor
+from imap_mag.util.PacketIndex import PacketIndex
 from imap_mag.util.ReferenceFrame import ReferenceFrame
 from imap_mag.util.ScienceMode import ScienceMode
 from imap_mag.util.Subsystem import Subsystem
@@ -17,11 +19,13 @@ __all__ = [
     "CCSDSBinaryPacketFile",
     "DatetimeProvider",
     "Environment",
+    "FileHash",
     "HKLevel",
     "HKPacket",
     "Humaniser",
     "MAGMode",
     "MAGSensor",
+    "PacketIndex",
     "ReferenceFrame",
     "ScienceLevel",
     "ScienceMode",
@@ -1,22 +1,125 @@
 import logging
 import shutil
+import threading
+import time
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+class DiskSpaceMonitor:
+    """Check disk usage against a threshold, without sampling the file system for
+    every write.
+
+    Disk usage is sampled at most every `SAMPLE_INTERVAL_NS`, or once
+    `SAMPLE_BYTES` have been written since the last sample. In between, bytes
+    written are deducted from the headroom measured by the last sample. A write
+    that looks like it would reach the threshold is only refused after sampling
+    again, in case space has been freed in the meantime.
+    """
+
+    SAMPLE_INTERVAL_NS: int = 30_000_000_000
+    SAMPLE_BYTES: int = 1024**3
+
+    def __init__(self, path: Path, threshold: float) -> None:
+        self.path = path
+        self.threshold = threshold
+
+        self.__lock = threading.Lock()
+        self.__total: int | None = None
+        self.__used: int = 0
+        self.__written: int = 0
+        self.__sampled_ns: int | None = None
+
+    @property
+    def headroom(self) -> int | None:
+        """Estimated bytes that can be written before the threshold is reached
+        (negative once exceeded), or None if disk usage cannot be sampled."""
+
+        with self.__lock:
+            if self.__sampled_ns is None:
+                self.__sample()
+
+            return self.__get_headroom()
+
+    def check(self, bytes_to_write: int = 0) -> None:
+        """Raise OSError if writing `bytes_to_write` would take disk usage to or over
+        the threshold."""
+
+        with self.__lock:
+            sampled = False
+
+            if self.__is_sample_stale():
+                self.__sample()
+                sampled = True
+
+            if self.__is_within_threshold(bytes_to_write):
+                return
+
+            if not sampled:
+                self.__sample()
+
+                if self.__is_within_threshold(bytes_to_write):
+                    return
+
+            assert self.__total is not None
+
+            used_fraction = (self.__used + self.__written) / self.__total
+
+            if bytes_to_write == 0 or used_fraction >= self.threshold:
+                message = f"Disk usage at {self.path} is {used_fraction:.1%}, which meets or exceeds the {self.threshold:.1%} threshold."
+            else:
+                new_used_fraction = (
+                    self.__used + self.__written + bytes_to_write
+                ) / self.__total
+                message = f"Writing {bytes_to_write:,} bytes to {self.path} would take disk usage from {used_fraction:.1%} to {new_used_fraction:.1%}, which meets or exceeds the {self.threshold:.1%} threshold."
+
+            raise OSError(f"{message} File operations are blocked to protect storage.")
+
+    def record_write(self, size: int) -> None:
+        """Deduct bytes written from the headroom."""
+
+        with self.__lock:
+            self.__written += size
+
+    def __is_sample_stale(self) -> bool:
+        return (
+            self.__sampled_ns is None
+            or time.monotonic_ns() - self.__sampled_ns >= self.SAMPLE_INTERVAL_NS
+            or self.__written >= self.SAMPLE_BYTES
+        )
+
+    def __is_within_threshold(self, bytes_to_write: int) -> bool:
+        headroom = self.__get_headroom()
+        return headroom is None or headroom > bytes_to_write
+
+    def __get_headroom(self) -> int | None:
+        if self.__total is None:
+            return None
+
+        return int(self.__total * self.threshold) - self.__used - self.__written
+
+    def __sample(self) -> None:
+        check_path = self.path
+        while not check_path.exists() and check_path != check_path.parent:
+            check_path = check_path.parent
+
+        self.__sampled_ns = time.monotonic_ns()
+        self.__written = 0
+
+        if not check_path.exists():
+            self.__total = None
+            return
+
+        usage = shutil.disk_usage(check_path)
+        self.__total = usage.total
+        self.__used = usage.used
+
+        logger.debug(
+            f"Disk usage at {self.path} is {usage.used / usage.total:.1%}, with {self.__get_headroom():,} bytes of headroom before the {self.threshold:.1%} threshold."
+        )
+
+
 def check_disk_space(path: Path, threshold: float) -> None:
     """Raise OSError if the filesystem containing path meets or exceeds the usage threshold."""
-    check_path = path
-    while not check_path.exists() and check_path != check_path.parent:
-        check_path = check_path.parent
-    if not check_path.exists():
-        return
-
-    usage = shutil.disk_usage(check_path)
-    used_fraction = usage.used / usage.total
-    if used_fraction >= threshold:
-        raise OSError(
-            f"Disk usage at {path} is {used_fraction:.1%}, which meets or exceeds the "
-            f"{threshold:.1%} threshold. File operations are blocked to protect storage."
-        )
+    DiskSpaceMonitor(path, threshold).check()
@@ -0,0 +1,93 @@
+import hashlib
+import logging
+import os
+import shutil
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Linux ioctl to share the extents of one file with another (reflink).
+FICLONE = 0x40049409
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def publish_file(
+    source: Path, destination: Path, move: bool = False, clone: bool = False
+) -> tuple[str, str | None]:
+    """Atomically publish source to destination, using the cheapest method allowed.
+
+    If `move` is set, the source is renamed if on the same file system. If `clone`
+    is set, the file is cloned if supported. Otherwise, it is copied.
+
+    Returns the method used ("rename", "reflink", "copy_file_range" or "copy") and,
+    for copies through user space, the MD5 hash of the data written.
+    """
+
+    if move and _is_same_file_system(source, destination.parent):
+        os.replace(source, destination)
+        return ("rename", None)
+
+    partial_file = destination.parent / f".{destination.name}.part"
+
+    try:
+        with open(source, "rb") as src, open(partial_file, "wb") as dst:
+            method: str | None = None
+            md5: str | None = None
+
+            if clone or move:
+                method = _try_clone(src, dst)
+
+            if method is None:
+                method = "copy"
+                md5 = _copy_and_hash(src, dst)
+
+        shutil.copystat(source, partial_file)
+        os.replace(partial_file, destination)
+    finally:
+        partial_file.unlink(missing_ok=True)
+
+    return (method, md5)
+
+
+def _is_same_file_system(source: Path, folder: Path) -> bool:
+    return os.stat(source).st_dev == os.stat(folder).st_dev
+
+
+def _try_clone(src, dst) -> str | None:
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return "reflink"
+        except OSError as e:
+            logger.debug(f"Reflink not supported: {e}")
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(src.fileno(), dst.fileno(), CHUNK_SIZE * 64):
+                pass
+            return "copy_file_range"
+        except OSError as e:
+            logger.debug(f"copy_file_range not supported: {e}")
+
+            # start again from scratch
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+
+    return None
+
+
+def _copy_and_hash(src, dst) -> str:
+    md5 = hashlib.md5()
+
+    while chunk := src.read(CHUNK_SIZE):
+        md5.update(chunk)
+        dst.write(chunk)
+
+    return md5.hexdigest()
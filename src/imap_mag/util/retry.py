@@ -0,0 +1,41 @@
+import logging
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    *,
+    retries: int,
+    delay_seconds: float,
+    is_retryable: Callable[[Exception], bool],
+    description: str,
+) -> T:
+    """Call `func`, retrying up to `retries` times if it fails with an error that
+    `is_retryable` accepts.
+
+    The delay before each retry doubles, starting from `delay_seconds`. Other
+    errors, and the error from the last attempt, are raised.
+    """
+
+    attempt = 0
+
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= retries or not is_retryable(e):
+                raise
+
+            attempt += 1
+            delay = delay_seconds * 2 ** (attempt - 1)
+
+            logger.warning(
+                f"{description} failed: {e}. Retrying in {delay:.0f}s ({attempt}/{retries})."
+            )
+            time.sleep(delay)
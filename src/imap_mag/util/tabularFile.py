@@ -0,0 +1,31 @@
+import logging
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def read_tabular_file(
+    path: Path,
+    index_col: str | None = None,
+    parse_dates: list[str] | None = None,
+) -> pd.DataFrame:
+    """Read a CSV or Parquet file into a DataFrame, based on the file extension.
+
+    Parquet files are read directly from their Arrow buffers, without parsing.
+    """
+
+    if path.suffix.lower() != ".parquet":
+        return pd.read_csv(path, index_col=index_col, parse_dates=parse_dates)
+
+    data: pd.DataFrame = pd.read_parquet(path)
+
+    for column in parse_dates or []:
+        if not pd.api.types.is_datetime64_any_dtype(data[column]):
+            data[column] = pd.to_datetime(data[column])
+
+    if index_col is not None:
+        data = data.set_index(index_col)
+
+    return data
@@ -4,10 +4,11 @@ from datetime import datetime
 from pathlib import Path
 
 from imap_mag.config.CalibrationCommandConfig import SparseDatastoreConfig
+from imap_mag.io.DatastoreIndex import DatastoreIndex
 from imap_mag.io.file import SPICEPathHandler
 from imap_mag.io.FileFinder import FileFinder
 from imap_mag.util import ScienceMode
-from imap_mag.util.diskSpace import check_disk_space
+from imap_mag.util.diskSpace import DiskSpaceMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,7 @@ class SparseDatastoreBuilder:
         source_datastore: Path,
         config: SparseDatastoreConfig,
         disk_usage_threshold: float,
+        index: DatastoreIndex | None = None,
     ):
         """Args:
         source_datastore: Root of the datastore to copy from.
@@ -39,11 +41,13 @@ class SparseDatastoreBuilder:
         disk_usage_threshold: Fraction of disk usage above which copying is
             blocked; must come from ``AppSettings.disk_usage_threshold`` so it is
             configurable, not a code default.
+        index: Folder listings to share with other finders, so that folders
+            already listed (e.g. for a previous day) are not listed again.
         """
         self.source_datastore = Path(source_datastore)
         self.config = config
         self.disk_usage_threshold = disk_usage_threshold
-        self._finder = FileFinder(self.source_datastore)
+        self._finder = FileFinder(self.source_datastore, index=index)
 
     def build(
         self,
@@ -61,7 +65,8 @@ class SparseDatastoreBuilder:
             shutil.rmtree(target_root, ignore_errors=True)
 
         # Ensure there is room in the work folder before copying anything in.
-        check_disk_space(target_root.parent, self.disk_usage_threshold)
+        disk_space = DiskSpaceMonitor(target_root.parent, self.disk_usage_threshold)
+        disk_space.check()
 
         target_root.mkdir(parents=True, exist_ok=True)
 
@@ -94,16 +99,15 @@ class SparseDatastoreBuilder:
                 f"({mode.value})."
             )
 
-            check_disk_space(target_root.parent, self.disk_usage_threshold)
             for source in matches:
                 relative = source.relative_to(self.source_datastore)
-                size = self._copy_file(source, target_root / relative)
+                size = self._copy_file(source, target_root / relative, disk_space)
                 if size:
                     copied_files += 1
                     copied_bytes += size
 
         metakernel_files, metakernel_bytes = self._copy_metakernel_and_kernels(
-            metakernel_filename, target_root
+            metakernel_filename, target_root, disk_space
         )
         copied_files += metakernel_files
         copied_bytes += metakernel_bytes
@@ -128,9 +132,17 @@ class SparseDatastoreBuilder:
             .replace("{matrix_version}", str(matrix_version))
         )
 
-    def _copy_file(self, source: Path, destination: Path) -> int:
+    def _copy_file(
+        self,
+        source: Path,
+        destination: Path,
+        disk_space: DiskSpaceMonitor | None = None,
+    ) -> int:
         """Copy ``source`` to ``destination`` if not already there, logging the
-        file and its size. Returns the number of bytes copied (0 if skipped)."""
+        file and its size. Returns the number of bytes copied (0 if skipped).
+
+        If ``disk_space`` is given, the copy is refused if it would take disk usage
+        over the threshold."""
         if destination.exists():
             # ensure files are at least the same size, otherwise overwrite
             if destination.stat().st_size == source.stat().st_size:
@@ -144,15 +156,25 @@ class SparseDatastoreBuilder:
                 )
                 destination.unlink()
 
+        if disk_space is not None:
+            disk_space.check(source.stat().st_size)
+
         destination.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(source, destination)
 
         size = destination.stat().st_size
+
+        if disk_space is not None:
+            disk_space.record_write(size)
+
         logger.debug(f"Copied {source} ({size:,} bytes) -> {destination}")
         return size
 
     def _copy_metakernel_and_kernels(
-        self, metakernel_filename: str, target_root: Path
+        self,
+        metakernel_filename: str,
+        target_root: Path,
+        disk_space: DiskSpaceMonitor | None = None,
     ) -> tuple[int, int]:
         source_mk = SPICEPathHandler.get_metakernel_path(
             self.source_datastore, metakernel_filename
@@ -162,6 +184,9 @@ class SparseDatastoreBuilder:
                 f"Metakernel {source_mk} not found while building sparse datastore."
             )
 
+        if disk_space is None:
+            disk_space = DiskSpaceMonitor(target_root.parent, self.disk_usage_threshold)
+
         files = 0
         total_bytes = 0
         for kernel_relative in SPICEPathHandler.parse_metakernel_kernels(source_mk):
@@ -170,14 +195,11 @@ class SparseDatastoreBuilder:
             source_kernel = self.source_datastore / "spice" / kernel_relative
             if source_kernel.exists():
                 size = self._copy_file(
-                    source_kernel, target_root / "spice" / kernel_relative
+                    source_kernel, target_root / "spice" / kernel_relative, disk_space
                 )
                 if size:
                     files += 1
                     total_bytes += size
-
-                if files % 4 == 0:
-                    check_disk_space(target_root.parent, self.disk_usage_threshold)
             else:
                 logger.warning(
                     f"Kernel '{kernel_relative}' referenced by {metakernel_filename} "
@@ -12,6 +12,7 @@ from mag_toolkit.calibration.CalibrationConfig import CalibrationConfig
 from mag_toolkit.calibration.CalibrationJobParameters import CalibrationJobParameters
 
 if TYPE_CHECKING:
+    from imap_mag.io.DatastoreIndex import DatastoreIndex
     from imap_mag.io.file import CalibrationLayerPathHandler
     from imap_mag.io.FileFinder import FileFinder
 
@@ -20,6 +21,7 @@ logger = logging.getLogger(__name__)
 
 class CalibrationJob(ABC):
     data_store: Path | None = None
+    datastore_index: DatastoreIndex | None = None
 
     calibration_job_parameters: CalibrationJobParameters
     work_folder: Path
@@ -97,6 +99,8 @@ class CalibrationJob(ABC):
             self.data_store = datastore
 
         if datastore_finder is not None:
+            self.datastore_index = datastore_finder.index
+
             path_handlers = self._get_path_handlers(self.calibration_job_parameters)
 
             for key in path_handlers:
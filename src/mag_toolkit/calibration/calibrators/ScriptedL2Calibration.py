@@ -213,6 +213,7 @@ class ScriptedL2CalibrationJob(CalibrationJob):
             source_datastore=self.data_store,
             config=self.app_settings.calibrate.sparse_datastore,
             disk_usage_threshold=self.app_settings.disk_usage_threshold,
+            index=self.datastore_index,
         )
         target_root = self.work_folder / SPARSE_DATASTORE_FOLDER_NAME
         logger.info(f"Building sparse local copy of datastore in {target_root}")
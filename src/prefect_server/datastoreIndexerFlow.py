@@ -1,10 +1,12 @@
 """Prefect flow for indexing existing datastore files into the database."""
 
 import logging
+from pathlib import Path
 
 from prefect import flow
 from prefect.states import Completed
 
+from imap_db.model import File
 from imap_mag.client.SDCDataAccess import SDCDataAccess
 from imap_mag.config.AppSettings import AppSettings
 from imap_mag.db import Database
@@ -12,7 +14,7 @@ from imap_mag.io.DBIndexedDatastoreFileManager import (
     DBIndexedDatastoreFileManager,
     IndexResult,
 )
-from imap_mag.io.file import SPICEPathHandler
+from imap_mag.io.file import IFilePathHandler, SPICEPathHandler
 from imap_mag.io.FilePathHandlerSelector import FilePathHandlerSelector
 from imap_mag.util import CONSTANTS, Environment
 from prefect_server.constants import PREFECT_CONSTANTS
@@ -24,7 +26,7 @@ logger = logging.getLogger(__name__)
 @flow(
     name=PREFECT_CONSTANTS.FLOW_NAMES.DATASTORE_INDEXER,
 )
-async def index_datastore_flow():
+async def index_datastore_flow(max_hash_workers: int = 4):
     """Index all files in the datastore into the database.
 
     Walks the datastore directory recursively and, for each file that has a
@@ -34,6 +36,12 @@ async def index_datastore_flow():
     - If the file is not in the database a new record is created.
     - If the file has a database record that was previously soft-deleted the
       deletion date is cleared so the record becomes active again.
+    - If the file is active in the database but its size has changed, the
+      record is updated.
+
+    Files whose path and size match an active record are skipped without
+    querying the database again, and new files are hashed in parallel using
+    `max_hash_workers` threads.
     """
     app_settings = AppSettings()  # type: ignore
     db = Database()
@@ -50,11 +58,19 @@ async def index_datastore_flow():
 
     logger.info(f"Indexing datastore at {datastore_path}")
 
-    new_spice_files = []
+    active_file_sizes = db.get_active_file_sizes()
+    logger.info(f"Found {len(active_file_sizes)} active files in database.")
+
+    files_to_index: list[tuple[Path, IFilePathHandler]] = []
     for file in sorted(datastore_path.rglob("*")):
         if not file.is_file():
             continue
 
+        relative_path = File.get_datastore_relative_path(file, app_settings, warn=False)
+        if active_file_sizes.get(relative_path) == file.stat().st_size:
+            total_skipped += 1
+            continue
+
         path_handler = FilePathHandlerSelector.find_by_path(
             file, throw_if_not_found=False
         )
@@ -64,7 +80,19 @@ async def index_datastore_flow():
             total_no_handler += 1
             continue
 
-        result = datastore_manager.index_existing_file(file, path_handler)
+        files_to_index.append((file, path_handler))
+
+    logger.info(
+        f"Skipped {total_skipped} unchanged files. Indexing {len(files_to_index)} files."
+    )
+
+    results = datastore_manager.index_existing_files(
+        files_to_index, max_workers=max_hash_workers
+    )
+
+    new_spice_files = []
+    for file, path_handler in files_to_index:
+        result = results[file]
         if result == IndexResult.INDEXED and type(path_handler) is SPICEPathHandler:
             new_spice_files.append((file, path_handler))
 
@@ -91,30 +119,39 @@ async def index_datastore_flow():
             if auth_code
             else Environment()
         ):
+            # query the metadata of all spice files from the SDC at once, and do
+            # our best to add it to the new files
+            data_access = SDCDataAccess(
+                auth_code=app_settings.fetch_spice.api.auth_code,
+                data_dir=work_folder,
+                sdc_url=app_settings.fetch_spice.api.url_base,
+            )
+            try:
+                results_by_name = {
+                    Path(result["file_name"]).name: result
+                    for result in data_access.spice_query()
+                    if result.get("file_name")
+                }
+                logger.info(f"SDC API returned {len(results_by_name)} results")
+            except Exception as e:
+                logger.warning(f"Failed to query SDC for SPICE files with error: {e}")
+                results_by_name = dict()
+
+            spice_files_with_metadata = []
             for file, path_handler in new_spice_files:
-                # if this is a spice file then do our best to query the metadata from the SDC for it
-                data_access = SDCDataAccess(
-                    auth_code=app_settings.fetch_spice.api.auth_code,
-                    data_dir=work_folder,
-                    sdc_url=app_settings.fetch_spice.api.url_base,
-                )
-                try:
-                    results = data_access.spice_query(
-                        file_name=path_handler.filename,
-                    )
-                    logger.info(f"SDC API returned {len(results)} results")
-                except Exception as e:
-                    logger.warning(f"Failed to query SDC for {file} with error: {e}")
-                    results = None
-
-                if results and len(results) > 0:
-                    path_handler.add_metadata(results[0])
+                result = results_by_name.get(file.name)
+
+                if result:
+                    path_handler.add_metadata(result)
                     logger.info(f"Added metadata for {file} from SDC")
                     logger.debug(f"Metadata for {file}: {path_handler.get_metadata()}")
-                    datastore_manager.index_existing_file(file, path_handler)
+                    spice_files_with_metadata.append((file, path_handler))
                 else:
                     logger.warning(f"Unable to add metadata for {file} from SDC")
 
+            if spice_files_with_metadata:
+                datastore_manager.index_existing_files(spice_files_with_metadata)
+
     logger.info(
         f"Datastore indexing complete: {total_indexed} indexed, "
         f"{total_skipped} skipped, {total_restored} restored, "
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated
@@ -6,10 +7,14 @@ from prefect import flow
 from prefect.runtime import flow_run
 from pydantic import Field
 
-from imap_mag.cli.fetch.binary import fetch_binary
+from imap_mag.cli.fetch.binary import (
+    create_fetch_binary,
+    download_and_publish_binaries,
+)
 from imap_mag.cli.fetch.DownloadDateManager import DownloadDateManager
 from imap_mag.cli.process import process
 from imap_mag.config import FetchMode, SaveMode
+from imap_mag.config.AppSettings import AppSettings
 from imap_mag.db import Database, update_database_with_progress
 from imap_mag.io.file import HKBinaryPathHandler
 from imap_mag.util import (
@@ -131,12 +136,29 @@ async def poll_hk_flow(
     use_database: bool = (force_database_update and force_ert) or automated_flow_run
     use_ert: bool = force_ert or automated_flow_run
 
-    for packet in hk_packets:
+    # Settings, logging and the WebPODA client are set up once, and shared by all
+    # packets, so that connections to WebPODA are reused between packets.
+    with Environment(CONSTANTS.ENV_VAR_NAMES.WEBPODA_AUTH_CODE, auth_code):
+        app_settings = AppSettings()  # type: ignore
+
+    fetch = create_fetch_binary(app_settings)
+
+    # Downloads for different packets overlap, up to the configured limit, as
+    # most of the time is spent waiting on WebPODA. Processing and progress
+    # updates are serialised, one packet at a time.
+    download_semaphore = asyncio.Semaphore(
+        app_settings.fetch_binary.max_concurrent_downloads
+    )
+    process_lock = asyncio.Lock()
+
+    # Set when any packet fails, so that packets waiting for a download slot or
+    # for the process lock stop, rather than start, once it is their turn.
+    polling_failed = asyncio.Event()
+
+    async def poll_packet(packet: HKPacket) -> None:
         progress_item_id = packet.packet_name
         packet_start_timestamp = datetime_provider.now()
 
-        logger.info(f"---------- Downloading Packet {progress_item_id} ----------")
-
         date_manager = DownloadDateManager(
             progress_item_id, database, datetime_provider=datetime_provider
         )
@@ -148,13 +170,23 @@ async def poll_hk_flow(
         )
 
         if packet_dates is None:
-            continue
+            return
         else:
             (packet_start_date, packet_end_date) = packet_dates
 
         # Download binary from WebPODA
-        with Environment(CONSTANTS.ENV_VAR_NAMES.WEBPODA_AUTH_CODE, auth_code):
-            downloaded_binaries: dict[Path, HKBinaryPathHandler] = fetch_binary(
+        async with download_semaphore:
+            if polling_failed.is_set():
+                return
+
+            logger.info(f"---------- Downloading Packet {progress_item_id} ----------")
+
+            downloaded_binaries: dict[
+                Path, HKBinaryPathHandler
+            ] = await asyncio.to_thread(
+                download_and_publish_binaries,
+                fetch,
+                app_settings,
                 packet=packet,
                 start_date=packet_start_date,
                 end_date=packet_end_date,
@@ -162,35 +194,58 @@ async def poll_hk_flow(
                 fetch_mode=FetchMode.DownloadAndUpdateProgress,
             )
 
-        if downloaded_binaries:
-            # Process binary data into CSV
-            files = [file for file in downloaded_binaries.keys()]
-            process(files, save_mode=SaveMode.LocalAndDatabase)
-        else:
-            logger.info(
-                f"No data downloaded for {progress_item_id} from {packet_start_date} to {packet_end_date}."
-            )
-
-        # Update database with latest content date as progress (for HK)
-        if use_database:
-            ert_timestamps: list[datetime] = [
-                metadata.ert
-                for metadata in downloaded_binaries.values()
-                if metadata.ert
-            ]
-            latest_ert_timestamp: datetime | None = (
-                max(ert_timestamps) if ert_timestamps else None
-            )
-
-            update_database_with_progress(
-                progress_item_id=progress_item_id,
-                database=database,
-                checked_timestamp=packet_start_timestamp,
-                latest_timestamp=latest_ert_timestamp,
-            )
-        else:
-            logger.info(
-                f"Database workflow progress not updated for {progress_item_id}."
-            )
+        async with process_lock:
+            if polling_failed.is_set():
+                return
+
+            if downloaded_binaries:
+                # Process binary data into CSV
+                files = [file for file in downloaded_binaries.keys()]
+                await asyncio.to_thread(
+                    process, files, save_mode=SaveMode.LocalAndDatabase
+                )
+            else:
+                logger.info(
+                    f"No data downloaded for {progress_item_id} from {packet_start_date} to {packet_end_date}."
+                )
+
+            # Update database with latest content date as progress (for HK)
+            if use_database:
+                ert_timestamps: list[datetime] = [
+                    metadata.ert
+                    for metadata in downloaded_binaries.values()
+                    if metadata.ert
+                ]
+                latest_ert_timestamp: datetime | None = (
+                    max(ert_timestamps) if ert_timestamps else None
+                )
+
+                update_database_with_progress(
+                    progress_item_id=progress_item_id,
+                    database=database,
+                    checked_timestamp=packet_start_timestamp,
+                    latest_timestamp=latest_ert_timestamp,
+                )
+            else:
+                logger.info(
+                    f"Database workflow progress not updated for {progress_item_id}."
+                )
+
+    async def poll_packet_or_stop(packet: HKPacket) -> None:
+        try:
+            await poll_packet(packet)
+        except Exception:
+            polling_failed.set()
+            raise
+
+    # If any packet fails, the task group cancels the remaining packets, so that
+    # no further packets are downloaded, processed or recorded as progress. The
+    # first failure is raised, as it would be if packets were polled one by one.
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            for packet in hk_packets:
+                task_group.create_task(poll_packet_or_stop(packet))
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0]
 
     logger.info("---------- Finished ----------")
@@ -1,22 +1,19 @@
-import asyncio
 from datetime import datetime
-from pathlib import Path
 from typing import Annotated
 
 from prefect import flow
 from prefect.runtime import flow_run
-from pydantic import Field
+from pydantic import Field, SecretStr
 
-from imap_mag.cli.fetch.DownloadDateManager import DownloadDateManager
-from imap_mag.cli.fetch.science import fetch_science
+from imap_mag.client.SDCDataAccess import SDCDataAccess
+from imap_mag.config.AppSettings import AppSettings
 from imap_mag.config.DatastoreSaveOption import DatastoreSaveOption
-from imap_mag.config.FetchMode import FetchMode
-from imap_mag.db import Database, update_database_with_progress
-from imap_mag.io.file import SciencePathHandler
+from imap_mag.data_pipelines import AutomaticRunParameters, FetchByDatesRunParameters
+from imap_mag.data_pipelines.SciencePipeline import SciencePipeline
+from imap_mag.db import Database
 from imap_mag.util import (
     CONSTANTS,
     DatetimeProvider,
-    Environment,
     ReferenceFrame,
     ScienceLevel,
     ScienceMode,
@@ -24,7 +21,6 @@ from imap_mag.util import (
 from prefect_server.constants import PREFECT_CONSTANTS
 from prefect_server.prefectUtils import get_secret_or_env_var, try_get_prefect_logger
 
-BATCH_SIZE = 30
 MAX_DOWNLOADS_PER_FLOW = 1000
 
 
@@ -46,70 +42,6 @@ def generate_flow_run_name() -> str:
     return f"Download-{','.join([m.short_name for m in modes])}-{level.value}-from-{start_date}-to-{end_date.strftime('%d-%m-%Y')}"
 
 
-def _get_latest_ingestion_date(
-    downloaded_science: dict[Path, SciencePathHandler],
-) -> datetime | None:
-    ingestion_dates: list[datetime] = [
-        metadata.ingestion_date
-        for metadata in downloaded_science.values()
-        if metadata.ingestion_date
-    ]
-    return max(ingestion_dates) if ingestion_dates else None
-
-
-def _download_batch_of_science(
-    level,
-    reference_frames,
-    modes,
-    start_date,
-    end_date,
-    logger,
-    database,
-    use_database,
-    use_ingestion_date,
-    progress_item_id,
-    packet_start_timestamp,
-    batch_size,
-    skip_items_count,
-    overwrite_option: DatastoreSaveOption = DatastoreSaveOption.FILE_OVERWRITES_BLOCKED,
-    version_str_or_latest: str | None = None,
-) -> dict[Path, SciencePathHandler]:
-    logger.info(
-        f"Downloading batch of up to {batch_size} files for {progress_item_id} from {start_date} to {end_date}, skipping first {skip_items_count} items."
-    )
-
-    # Download files from SDC
-    downloaded_science: dict[Path, SciencePathHandler] = fetch_science(
-        level=level,
-        reference_frames=reference_frames,
-        modes=modes,
-        start_date=start_date,
-        end_date=end_date,
-        use_ingestion_date=use_ingestion_date,
-        fetch_mode=FetchMode.DownloadAndUpdateProgress,
-        max_downloads=batch_size,
-        skip_items_count=skip_items_count,
-        overwrite_option=overwrite_option,
-        version_str_or_latest=version_str_or_latest,
-    )
-
-    # Update database with latest ingestion date as progress (for science)
-    if use_database:
-        latest_ingestion_date = _get_latest_ingestion_date(downloaded_science)
-
-        update_database_with_progress(
-            progress_item_id=progress_item_id,
-            database=database,
-            checked_timestamp=packet_start_timestamp,
-            latest_timestamp=latest_ingestion_date,
-        )
-        logger.info(f"Database workflow progress updated for {progress_item_id}.")
-    else:
-        logger.info(f"Database workflow progress not updated for {progress_item_id}.")
-
-    return downloaded_science
-
-
 @flow(
     name=PREFECT_CONSTANTS.FLOW_NAMES.POLL_SCIENCE,
     log_prints=True,
@@ -236,7 +168,6 @@ async def poll_science_flow(
     else:
         progress_item_id = f"ALL_MODES_{level.value.upper()}"
 
-    packet_start_timestamp = datetime_provider.now()
     frame_suffix = (
         ("_" + "_".join([rf.value for rf in reference_frames]))
         if reference_frames
@@ -245,74 +176,47 @@ async def poll_science_flow(
     progress_item_id += frame_suffix
 
     logger.info(
-        f"Downloading {progress_item_id} from SDC '{start_date}' to '{end_date}' in batches of {BATCH_SIZE} files. "
+        f"Downloading {progress_item_id} from SDC '{start_date}' to '{end_date}'."
     )
 
-    downloaded_science = []
-
-    total_batches = MAX_DOWNLOADS_PER_FLOW // BATCH_SIZE
-
-    date_manager = DownloadDateManager(
-        progress_item_id, database, datetime_provider=datetime_provider
+    settings = AppSettings()
+    client = SDCDataAccess(
+        auth_code=SecretStr(auth_code),
+        data_dir=settings.setup_work_folder_for_command(settings.fetch_science),
+        sdc_url=settings.fetch_science.api.url_base,
     )
 
-    packet_dates = date_manager.get_dates_for_download(
-        original_start_date=start_date,
-        original_end_date=end_date,
-        validate_with_database=use_database,
+    # files are downloaded, published and recorded as progress one at a time, in
+    # order of ingestion date, rather than in batches
+    pipeline = SciencePipeline(
+        database=database,
+        settings=settings,
+        client=client,
+        progress_item_id=progress_item_id,
+        level=level,
+        modes=modes,
+        reference_frames=reference_frames,
+        use_ingestion_date=use_ingestion_date,
+        update_progress=use_database,
+        version_str_or_latest=version_str_or_latest,
+        overwrite_option=overwrite_option,
+        # explicitly requested dates are downloaded again, to check for changes to
+        # files already in the datastore
+        skip_existing_files=automated_flow_run,
+        max_downloads=MAX_DOWNLOADS_PER_FLOW,
+        datetime_provider=datetime_provider,
     )
+    pipeline.build(
+        AutomaticRunParameters()
+        if automated_flow_run
+        else FetchByDatesRunParameters(start_date=start_date, end_date=end_date)
+    )
+    await pipeline.run()
+    result = pipeline.get_results()
 
-    if packet_dates is None:
-        logger.info(f"No dates for download of {progress_item_id} - skipping")
-        return
-    else:
-        (packet_start_date, packet_end_date) = packet_dates
-
-    first_path_in_previous_batch = Path("")
-
-    for _ in range(total_batches):  # arbitrary large number to prevent infinite loops
-        with Environment(CONSTANTS.ENV_VAR_NAMES.SDC_AUTH_CODE, auth_code):
-            items = _download_batch_of_science(
-                level,
-                reference_frames,
-                modes,
-                packet_start_date,
-                packet_end_date,
-                logger,
-                database,
-                use_database,
-                use_ingestion_date,
-                progress_item_id,
-                packet_start_timestamp,
-                BATCH_SIZE,
-                len(downloaded_science),
-                overwrite_option=overwrite_option,
-                version_str_or_latest=version_str_or_latest,
-            )
-            if items:
-                downloaded_science.extend(items.keys())
-
-        if items is None or len(items) < BATCH_SIZE:
-            # No more items to download
-            break
-
-        first_path_in_batch = next(iter(items.keys()))
-        if first_path_in_batch == first_path_in_previous_batch:
-            logger.warning(
-                "First item in batch is the same as the previous batch. Stopping to avoid infinite loop."
-            )
-            break
-
-        first_path_in_previous_batch = first_path_in_batch
-
-        if len(downloaded_science) >= MAX_DOWNLOADS_PER_FLOW:
-            logger.warning(
-                "Downloaded 1000 or more files in this flow run. Stopping to avoid excessive downloads."
-            )
-            break
-
-        await asyncio.sleep(3)  # brief pause between batches
+    if not result.success:
+        raise RuntimeError(f"Pipeline failed: {result}")
 
     logger.info(
-        f"Poll science flow complete. Downloaded total of {len(downloaded_science)} items."
+        f"Poll science flow complete. Downloaded total of {len(result.data_items)} items."
     )
@@ -86,6 +86,20 @@ async def _get_database_connectionstring(
     return db_url
 
 
+def _get_job_match_path(path: Path) -> Path:
+    """Path used to match a file to a crump job and extract values from its name.
+
+    Decoded HK may be saved as Parquet (see `process.hk_output_format`), but crump
+    jobs match HK files by their CSV file name, so Parquet files are matched by
+    their stem, as if they were CSV.
+    """
+
+    if path.suffix.lower() == ".parquet":
+        return path.with_suffix(".csv")
+
+    return path
+
+
 def _process_files(
     files: list[File],
     app_settings: AppSettings,
@@ -136,7 +150,7 @@ def _process_files(
                 f"Determining crump job for file {path_inc_datastore.as_posix()} and name {job_name}..."
             )
             detected_crump_job_details = crump_config.get_job_or_auto_detect(
-                job_name, filename=path_inc_datastore.as_posix()
+                job_name, filename=_get_job_match_path(path_inc_datastore).as_posix()
             )
             if detected_crump_job_details is None:
                 raise ValueError("No matching job found in crump config")
@@ -160,7 +174,7 @@ def _process_files(
             if detected_crump_job.filename_to_column:
                 filename_values = (
                     detected_crump_job.filename_to_column.extract_values_from_filename(
-                        path_inc_datastore
+                        _get_job_match_path(path_inc_datastore)
                     )
                 )
 
@@ -232,7 +246,7 @@ async def upload_new_files_to_postgres(
     progress_key="postgres-upload",
 ):
     """
-    Upload new CSV and CDF files to PostgreSQL database using crump.
+    Upload new CSV, Parquet and CDF files to PostgreSQL database using crump.
 
     This flow:
     1. Finds new/modified files since last run (or since find_files_after)
@@ -7,6 +7,7 @@ import pytest
 from wiremock.testing.testcontainer import wiremock_container
 
 from imap_mag.util.Environment import Environment
+from tests.util.LocalSDCServer import LocalSDCServer
 from tests.util.WireMockManager import WireMockManager
 
 # quieten some loggers for dependencies when run in tests with debug
@@ -52,6 +53,14 @@ def wiremock_manager():
         yield WireMockManager(mock_container)
 
 
+@pytest.fixture(autouse=False)
+def local_sdc_server() -> Generator[LocalSDCServer, None, None]:
+    """Fixture for a local stand-in for the SDC API, with slow responses."""
+
+    with LocalSDCServer(response_delay_seconds=0.2) as server:
+        yield server
+
+
 @pytest.fixture(autouse=False)
 def temp_file_path() -> Generator[Path, None, None]:
     """Fixture to create a temporary file for testing."""
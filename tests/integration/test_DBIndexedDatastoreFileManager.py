@@ -147,7 +147,7 @@ def test_DBIndexedDatastoreFileManager_same_file_already_exists_in_database(
         software_version=__version__,
     )
 
-    mock_database.get_files.return_value = [existing_file]
+    mock_database.get_active_files_in_folder.return_value = [existing_file]
     mock_database.get_files_by_path.return_value = [existing_file]
 
     test_file = Path(tempfile.gettempdir()) / "test_file.txt"
@@ -210,7 +210,7 @@ def test_DBIndexedDatastoreFileManager_same_file_already_exists_as_second_file_i
         content_date=datetime(2025, 5, 2),
         software_version=__version__,
     )
-    mock_database.get_files.side_effect = [
+    mock_database.get_active_files_in_folder.side_effect = [
         [
             File(
                 name="imap_mag_l1_hsk-pw_20250502_v001.txt",
@@ -286,7 +286,7 @@ def test_DBIndexedDatastoreFileManager_file_different_hash_already_exists_in_dat
         False,
     )
 
-    mock_database.get_files.side_effect = [
+    mock_database.get_active_files_in_folder.side_effect = [
         [
             File(
                 name="imap_mag_l1_hsk-pw_20250502_v001.txt",
@@ -1203,7 +1203,7 @@ def test_DBIndexedDatastoreFileManager_science_file_version_major_stored_in_db(
         path_handler,
         False,
     )
-    mock_database.get_files.return_value = []
+    mock_database.get_active_files_in_folder.return_value = []
 
     captured_files: list[File] = []
     mock_database.upsert_file.side_effect = lambda f: captured_files.append(f)
@@ -1244,7 +1244,7 @@ def test_DBIndexedDatastoreFileManager_get_next_available_version_major_scans_mi
     # Pre-populate DB with one legacy-format file (version=1) and one new-format
     # file (version=2).  The new file has different content so no hash match occurs.
     folder = "science/mag/l2-pre/2026/01"
-    mock_database.get_files.return_value = [
+    mock_database.get_active_files_in_folder.return_value = [
         File(
             name="imap_mag_l2-pre_norm-srf_20260116_v001.cdf",
             path=f"{folder}/imap_mag_l2-pre_norm-srf_20260116_v001.cdf",
@@ -1317,7 +1317,7 @@ def test_DBIndexedDatastoreFileManager_get_next_available_version_uses_max_plus_
 
     # Only v002 is in the DB; v001 was never written (or was deleted).
     folder = "science/mag/l2-pre/2026/01"
-    mock_database.get_files.return_value = [
+    mock_database.get_active_files_in_folder.return_value = [
         File(
             name="imap_mag_l2-pre_norm-srf_20260116_v001.0002.cdf",
             path=f"{folder}/imap_mag_l2-pre_norm-srf_20260116_v001.0002.cdf",
@@ -1427,3 +1427,246 @@ class TestDBIndexedDatastoreFileManagerUnit:
         assert (archive_folder / "subdir" / "test_file.csv").exists()
         mock_db.upsert_files.assert_called_once_with([mock_archived_file, mock_file])
         assert not source_file.exists()
+
+
+def _add_files_manager(
+    datastore: Path, database: mock.Mock
+) -> DBIndexedDatastoreFileManager:
+    settings = MagicMock()
+    settings.data_store = datastore
+    settings.disk_usage_threshold = 1.0
+
+    return DBIndexedDatastoreFileManager(
+        DatastoreFileManager(settings), database, settings=settings
+    )
+
+
+def _hk_handler(content_date: datetime) -> HKDecodedPathHandler:
+    return HKDecodedPathHandler(
+        descriptor="hsk-pw",
+        content_date=content_date,
+        extension="txt",
+    )
+
+
+def test_DBIndexedDatastoreFileManager_add_files_resolves_versions_together_and_upserts_once(
+    mock_database: mock.Mock,
+    tmp_path: Path,
+) -> None:
+    # Set up.
+    database_manager = _add_files_manager(tmp_path / "datastore", mock_database)
+    mock_database.get_active_files_in_folder.return_value = []
+
+    files = [
+        (
+            create_test_file(tmp_path / "first.txt", "first"),
+            _hk_handler(datetime(2025, 5, 2)),
+        ),
+        (
+            create_test_file(tmp_path / "second.txt", "second"),
+            _hk_handler(datetime(2025, 5, 2)),
+        ),
+        (
+            create_test_file(tmp_path / "third.txt", "third"),
+            _hk_handler(datetime(2025, 6, 2)),
+        ),
+    ]
+
+    # Exercise.
+    results = database_manager.add_files(files)
+
+    # Verify.
+    assert [result[0].name for result in results] == [
+        "imap_mag_l1_hsk-pw_20250502_v001.txt",
+        "imap_mag_l1_hsk-pw_20250502_v002.txt",
+        "imap_mag_l1_hsk-pw_20250602_v001.txt",
+    ]
+    assert [result[0].read_text() for result in results] == ["first", "second", "third"]
+
+    assert mock_database.get_active_files_in_folder.call_count == 2
+    mock_database.upsert_files.assert_called_once()
+    mock_database.upsert_file.assert_not_called()
+
+    records = mock_database.upsert_files.call_args.args[0]
+    assert [record.name for record in records] == [result[0].name for result in results]
+    assert mock_database.upsert_files.call_args.kwargs["batch_size"] == len(records)
+
+
+def test_DBIndexedDatastoreFileManager_add_files_skips_identical_files_in_database(
+    mock_database: mock.Mock,
+    tmp_path: Path,
+) -> None:
+    # Set up.
+    database_manager = _add_files_manager(tmp_path / "datastore", mock_database)
+
+    existing_handler = _hk_handler(datetime(2025, 5, 2))
+    existing_file = create_test_file(
+        existing_handler.get_full_path(tmp_path / "datastore"), "existing"
+    )
+    mock_database.get_active_files_in_folder.return_value = [
+        File(
+            name=existing_file.name,
+            path=str(existing_handler.get_full_path()),
+            version=1,
+            hash=hashlib.md5(b"existing").hexdigest(),
+        )
+    ]
+
+    files = [
+        (
+            create_test_file(tmp_path / "same.txt", "existing"),
+            _hk_handler(datetime(2025, 5, 2)),
+        ),
+        (
+            create_test_file(tmp_path / "new.txt", "new"),
+            _hk_handler(datetime(2025, 5, 2)),
+        ),
+    ]
+
+    # Exercise.
+    results = database_manager.add_files(files)
+
+    # Verify.
+    assert [result[0].name for result in results] == [
+        "imap_mag_l1_hsk-pw_20250502_v001.txt",
+        "imap_mag_l1_hsk-pw_20250502_v002.txt",
+    ]
+
+    records = mock_database.upsert_files.call_args.args[0]
+    assert [record.name for record in records] == [
+        "imap_mag_l1_hsk-pw_20250502_v002.txt"
+    ]
+
+
+def test_DBIndexedDatastoreFileManager_add_files_removes_published_files_when_database_fails(
+    mock_database: mock.Mock,
+    tmp_path: Path,
+) -> None:
+    # Set up.
+    database_manager = _add_files_manager(tmp_path / "datastore", mock_database)
+    mock_database.get_active_files_in_folder.return_value = []
+    mock_database.upsert_files.side_effect = Exception("Database unavailable")
+
+    files = [
+        (
+            create_test_file(tmp_path / "first.txt", "first"),
+            _hk_handler(datetime(2025, 5, 2)),
+        ),
+        (
+            create_test_file(tmp_path / "second.txt", "second"),
+            _hk_handler(datetime(2025, 6, 2)),
+        ),
+    ]
+
+    # Exercise.
+    with pytest.raises(Exception, match="Database unavailable"):
+        database_manager.add_files(files)
+
+    # Verify.
+    assert not [path for path in (tmp_path / "datastore").rglob("*") if path.is_file()]
+    assert all(original_file.exists() for original_file, _ in files)
+
+
+def test_DBIndexedDatastoreFileManager_add_files_writes_nothing_when_a_file_fails_to_publish(
+    mock_datastore_manager: mock.Mock,
+    mock_database: mock.Mock,
+    tmp_path: Path,
+) -> None:
+    # Set up.
+    database_manager = DBIndexedDatastoreFileManager(
+        mock_datastore_manager, mock_database
+    )
+    mock_database.get_active_files_in_folder.return_value = []
+
+    published_file = create_test_file(tmp_path / "published.txt", "published")
+
+    def add_file(original_file: Path, path_handler: HKDecodedPathHandler):
+        if original_file.name == "broken.txt":
+            raise OSError("Disk full")
+
+        return (published_file, path_handler, False)
+
+    mock_datastore_manager.add_file.side_effect = add_file
+
+    files = [
+        (
+            create_test_file(tmp_path / "first.txt", "first"),
+            _hk_handler(datetime(2025, 5, 2)),
+        ),
+        (
+            create_test_file(tmp_path / "broken.txt", "broken"),
+            _hk_handler(datetime(2025, 6, 2)),
+        ),
+    ]
+
+    # Exercise.
+    with pytest.raises(OSError, match="Disk full"):
+        database_manager.add_files(files)
+
+    # Verify.
+    assert not published_file.exists()
+    mock_database.upsert_files.assert_not_called()
+
+
+def test_DBIndexedDatastoreFileManager_find_existing_files_uses_active_database_records(
+    mock_database: mock.Mock,
+    tmp_path: Path,
+) -> None:
+    # Set up.
+    database_manager = _add_files_manager(tmp_path, mock_database)
+
+    indexed_handler = _hk_handler(datetime(2025, 5, 2))
+    not_on_disk_handler = _hk_handler(datetime(2025, 5, 3))
+    not_indexed_handler = _hk_handler(datetime(2025, 5, 4))
+
+    indexed_file = create_test_file(indexed_handler.get_full_path(tmp_path), "a")
+    create_test_file(not_indexed_handler.get_full_path(tmp_path), "c")
+
+    mock_database.get_files.return_value = [
+        File(path=indexed_handler.get_full_path().as_posix()),
+        File(path=not_on_disk_handler.get_full_path().as_posix()),
+    ]
+
+    # Exercise.
+    existing_files = database_manager.find_existing_files(
+        [indexed_handler, not_on_disk_handler, not_indexed_handler]
+    )
+
+    # Verify.
+    assert existing_files == [indexed_file, None, None]
+    mock_database.get_files.assert_called_once()
+
+
+def test_DBIndexedDatastoreFileManager_add_files_restores_overwritten_files_when_database_fails(
+    mock_database: mock.Mock,
+    tmp_path: Path,
+) -> None:
+    # Set up.
+    database_manager = _add_files_manager(tmp_path / "datastore", mock_database)
+    mock_database.upsert_files.side_effect = Exception("Database unavailable")
+
+    path_handler = _hk_handler(datetime(2025, 5, 2))
+    path_handler.allow_overwrite = True
+
+    existing_file = create_test_file(
+        path_handler.get_full_path(tmp_path / "datastore"), "existing"
+    )
+    mock_database.get_active_files_in_folder.return_value = [
+        File(
+            name=existing_file.name,
+            path=str(path_handler.get_full_path()),
+            version=1,
+            hash=hashlib.md5(b"existing").hexdigest(),
+        )
+    ]
+
+    original_file = create_test_file(tmp_path / "replacement.txt", "replacement")
+
+    # Exercise.
+    with pytest.raises(Exception, match="Database unavailable"):
+        database_manager.add_files([(original_file, path_handler)])
+
+    # Verify.
+    assert existing_file.read_text() == "existing"
+    assert [path for path in existing_file.parent.iterdir()] == [existing_file]
+    assert original_file.exists()
@@ -0,0 +1,149 @@
+"""Tests that queries on a large files table use the files table indexes."""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Engine, Select, event, text
+from sqlalchemy.dialects import postgresql
+
+from imap_mag.db import Database
+from tests.util.database import test_database, test_database_server_engine  # noqa: F401
+
+NUMBER_OF_FILES = 1_000_000
+
+
+@pytest.fixture
+def large_files_table(test_database, test_database_server_engine):  # noqa: F811
+    """Seed the files table with a million rows, one in ten of them deleted."""
+
+    with test_database_server_engine.begin() as connection:
+        connection.execute(
+            text(
+                """
+                INSERT INTO files (name, path, descriptor, version, version_major, hash, size,
+                                   content_date, last_modified_date, deletion_date, software_version)
+                SELECT
+                    'imap_mag_l1_hsk-' || (i % 100) || '_' || i || '_v001.csv',
+                    'hk/mag/l1/hsk-' || (i % 100) || '/' || (i % 1000) || '/imap_mag_l1_hsk-' || (i % 100) || '_' || i || '_v001.csv',
+                    'imap_mag_l1_hsk-' || (i % 100),
+                    1,
+                    0,
+                    md5(i::text),
+                    100,
+                    TIMESTAMP '2025-01-01' + (i % 1000) * INTERVAL '1 day',
+                    TIMESTAMP '2025-01-01' + i * INTERVAL '1 minute',
+                    CASE WHEN i % 10 = 0 THEN TIMESTAMP '2025-01-01' + i * INTERVAL '1 minute' END,
+                    '1.0'
+                FROM generate_series(1, :number_of_files) AS i
+                """
+            ),
+            dict(number_of_files=NUMBER_OF_FILES),
+        )
+        connection.execute(text("ANALYZE files"))
+
+    yield test_database
+
+
+@contextmanager
+def _capture_selects(engine: Engine) -> Iterator[list[Select]]:
+    """Capture the SELECT statements built by the code under test."""
+
+    selects: list[Select] = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        if context is not None and isinstance(
+            getattr(context.compiled, "statement", None), Select
+        ):
+            selects.append(context.compiled.statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield selects
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def _explain(database: Database, query) -> str:
+    """Run a database query and return the plan of the SELECT statement it ran."""
+
+    with _capture_selects(database.engine) as selects:
+        query()
+
+    assert len(selects) == 1
+
+    # Render with the named parameter style, so that "%" in LIKE patterns is not
+    # escaped twice when the plain SQL is wrapped in `text`.
+    compiled = selects[0].compile(
+        dialect=postgresql.dialect(paramstyle="named"),
+        compile_kwargs={"literal_binds": True},
+    )
+
+    with database.engine.connect() as connection:
+        plan = connection.execute(text(f"EXPLAIN {compiled}")).scalars().all()
+
+    return "\n".join(plan)
+
+
+@pytest.mark.skipif(
+    os.getenv("GITHUB_ACTIONS") and os.getenv("RUNNER_OS") == "Windows",
+    reason="Test containers do not work on Windows GitHub Actions",
+)
+class TestFilesTableIndexes:
+    def test_get_files_since_uses_active_last_modified_date_index(
+        self, large_files_table: Database
+    ):
+        plan = _explain(
+            large_files_table,
+            lambda: large_files_table.get_files_since(
+                datetime(2026, 10, 1), how_many=1000
+            ),
+        )
+
+        assert "ix_files_active_last_modified_date" in plan
+
+    def test_get_files_deleted_since_uses_deletion_date_index(
+        self, large_files_table: Database
+    ):
+        plan = _explain(
+            large_files_table,
+            lambda: large_files_table.get_files_deleted_since(
+                datetime(2026, 10, 1), how_many=1000
+            ),
+        )
+
+        assert "ix_files_deletion_date" in plan
+
+    def test_get_files_by_path_uses_path_pattern_index(
+        self, large_files_table: Database
+    ):
+        plan = _explain(
+            large_files_table,
+            lambda: large_files_table.get_files_by_path("hk/mag/l1/hsk-42/42/"),
+        )
+
+        assert "ix_files_path_pattern" in plan
+
+    def test_get_active_files_in_folder_uses_path_pattern_index(
+        self, large_files_table: Database
+    ):
+        plan = _explain(
+            large_files_table,
+            lambda: large_files_table.get_active_files_in_folder("hk/mag/l1/hsk-42/42"),
+        )
+
+        assert "ix_files_path_pattern" in plan
+
+    def test_get_active_files_by_descriptor_uses_descriptor_content_date_index(
+        self, large_files_table: Database
+    ):
+        plan = _explain(
+            large_files_table,
+            lambda: large_files_table.get_active_files_by_descriptor(
+                "imap_mag_l1_hsk-42", datetime(2025, 2, 12)
+            ),
+        )
+
+        assert "ix_files_active_descriptor_content_date" in plan
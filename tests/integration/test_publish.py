@@ -2,9 +2,11 @@ import json
 import os
 import re
 import shutil
+from http import HTTPStatus
 from pathlib import Path
 
 import pytest
+from pydantic import SecretStr
 from typer.testing import CliRunner
 from wiremock.client import (
     HttpMethods,
@@ -14,10 +16,13 @@ from wiremock.client import (
 )
 
 from imap_mag.cli.publish import publish
+from imap_mag.client.SDCDataAccess import SDCDataAccess
 from imap_mag.main import app
+from imap_mag.upload.PublishToSDC import PublishToSDC
 from imap_mag.util import Environment
 from prefect_server.publishFlow import publish_flow
 from tests.util.database import test_database  # noqa: F401
+from tests.util.LocalSDCServer import LocalSDCServer
 from tests.util.miscellaneous import (
     DATASTORE,
 )
@@ -221,3 +226,198 @@ def test_publish_resolves_absolute_path_to_offsets_file(
         publish([outside])
 
     assert f"Publishing 1 files: {outside}" in capture_cli_logs.text
+
+
+def _create_offsets_files(folder: Path, count: int) -> list[Path]:
+    files: list[Path] = []
+
+    for day in range(1, count + 1):
+        file = (
+            folder / f"imap_mag_l2-norm-offsets_202510{day:02}_202510{day:02}_v001.cdf"
+        )
+        file.write_bytes(f"offsets for day {day}".encode())
+        files.append(file)
+
+    return files
+
+
+def test_publish_to_sdc_uploads_files_concurrently(
+    local_sdc_server: LocalSDCServer, dynamic_work_folder
+):
+    # Set up.
+    files = _create_offsets_files(dynamic_work_folder, 4)
+
+    publish_to_sdc = PublishToSDC(
+        SDCDataAccess(
+            auth_code=SecretStr("12345"),
+            data_dir=dynamic_work_folder,
+            sdc_url=local_sdc_server.get_url(),
+        ),
+        max_concurrent_uploads=4,
+    )
+
+    # Exercise.
+    failed = publish_to_sdc.upload_files(files)
+
+    # Verify.
+    assert failed == {}
+    assert local_sdc_server.uploads == {file.name: file.read_bytes() for file in files}
+    assert local_sdc_server.max_concurrent_requests == 4
+
+
+def test_publish_rerun_only_uploads_files_not_already_published(
+    local_sdc_server: LocalSDCServer, capture_cli_logs, dynamic_work_folder
+):
+    # Set up.
+    files = _create_offsets_files(dynamic_work_folder, 3)
+    local_sdc_server.add_upload_failures(files[1].name, HTTPStatus.CONFLICT)
+
+    def publish_files() -> None:
+        with Environment(
+            MAG_DATA_STORE=str(dynamic_work_folder),
+            MAG_PUBLISH_API_URL_BASE=local_sdc_server.get_url(),
+            IMAP_API_KEY="12345",
+        ):
+            publish(files)
+
+    with pytest.raises(RuntimeError, match=re.escape("Failed to publish 1 files.")):
+        publish_files()
+
+    # Exercise.
+    publish_files()
+
+    # Verify.
+    assert [local_sdc_server.get_upload_attempts(file.name) for file in files] == [
+        1,
+        2,
+        1,
+    ]
+    assert local_sdc_server.uploads == {file.name: file.read_bytes() for file in files}
+
+    assert "Skipped 2 files already published" in capture_cli_logs.text
+    assert (dynamic_work_folder / PublishToSDC.STATE_FILE_NAME).exists()
+
+
+def test_publish_to_sdc_reuploads_files_changed_since_published(
+    local_sdc_server: LocalSDCServer, dynamic_work_folder
+):
+    # Set up.
+    (file,) = _create_offsets_files(dynamic_work_folder, 1)
+    state_file = dynamic_work_folder / PublishToSDC.STATE_FILE_NAME
+
+    data_access = SDCDataAccess(
+        auth_code=SecretStr("12345"),
+        data_dir=dynamic_work_folder,
+        sdc_url=local_sdc_server.get_url(),
+    )
+
+    PublishToSDC(data_access, state_file=state_file).upload_files([file])
+    file.write_bytes(b"updated offsets")
+
+    # Exercise.
+    failed = PublishToSDC(data_access, state_file=state_file).upload_files([file])
+
+    # Verify.
+    assert failed == {}
+    assert local_sdc_server.get_upload_attempts(file.name) == 2
+    assert local_sdc_server.uploads[file.name] == b"updated offsets"
+
+
+def test_publish_to_sdc_state_is_kept_per_sdc(
+    local_sdc_server: LocalSDCServer, dynamic_work_folder
+):
+    # Set up.
+    (file,) = _create_offsets_files(dynamic_work_folder, 1)
+    state_file = dynamic_work_folder / PublishToSDC.STATE_FILE_NAME
+
+    def create_publisher(sdc_url: str) -> PublishToSDC:
+        return PublishToSDC(
+            SDCDataAccess(
+                auth_code=SecretStr("12345"),
+                data_dir=dynamic_work_folder,
+                sdc_url=sdc_url,
+            ),
+            state_file=state_file,
+        )
+
+    with LocalSDCServer() as other_sdc_server:
+        create_publisher(other_sdc_server.get_url()).upload_files([file])
+
+        # Exercise.
+        failed = create_publisher(local_sdc_server.get_url()).upload_files([file])
+
+    # Verify.
+    assert failed == {}
+    assert other_sdc_server.get_upload_attempts(file.name) == 1
+    assert local_sdc_server.get_upload_attempts(file.name) == 1
+
+
+def test_publish_to_sdc_runs_sharing_a_state_file_keep_each_others_entries(
+    local_sdc_server: LocalSDCServer, dynamic_work_folder
+):
+    # Set up.
+    files = _create_offsets_files(dynamic_work_folder, 3)
+    state_file = dynamic_work_folder / PublishToSDC.STATE_FILE_NAME
+
+    data_access = SDCDataAccess(
+        auth_code=SecretStr("12345"),
+        data_dir=dynamic_work_folder,
+        sdc_url=local_sdc_server.get_url(),
+    )
+
+    # both runs start before either one has uploaded anything
+    first_run = PublishToSDC(data_access, state_file=state_file)
+    second_run = PublishToSDC(data_access, state_file=state_file)
+
+    first_run.upload_files(files[:2])
+    second_run.upload_files(files[2:])
+
+    # Exercise.
+    failed = PublishToSDC(data_access, state_file=state_file).upload_files(files)
+
+    # Verify.
+    assert failed == {}
+    assert [local_sdc_server.get_upload_attempts(file.name) for file in files] == [
+        1,
+        1,
+        1,
+    ]
+    assert [path.name for path in dynamic_work_folder.glob(".*.part")] == []
+
+
+@pytest.mark.parametrize(
+    "status_codes, expected_attempts, expected_uploaded",
+    [
+        ([HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.TOO_MANY_REQUESTS], 3, True),
+        ([HTTPStatus.SERVICE_UNAVAILABLE] * 3, 3, False),
+        ([HTTPStatus.CONFLICT], 1, False),
+    ],
+)
+def test_publish_to_sdc_retries_transient_upload_failures(
+    local_sdc_server: LocalSDCServer,
+    dynamic_work_folder,
+    status_codes,
+    expected_attempts,
+    expected_uploaded,
+):
+    # Set up.
+    (file,) = _create_offsets_files(dynamic_work_folder, 1)
+    local_sdc_server.add_upload_failures(file.name, *status_codes)
+
+    publish_to_sdc = PublishToSDC(
+        SDCDataAccess(
+            auth_code=SecretStr("12345"),
+            data_dir=dynamic_work_folder,
+            sdc_url=local_sdc_server.get_url(),
+        ),
+        retries=2,
+        retry_delay_seconds=0,
+    )
+
+    # Exercise.
+    failed = publish_to_sdc.upload_files([file])
+
+    # Verify.
+    assert local_sdc_server.get_upload_attempts(file.name) == expected_attempts
+    assert (file.name in local_sdc_server.uploads) == expected_uploaded
+    assert list(failed) == ([] if expected_uploaded else [file])
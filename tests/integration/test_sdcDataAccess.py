@@ -13,7 +13,9 @@ from pydantic import SecretStr
 
 from imap_mag.cli.fetch.spice import fetch_spice
 from imap_mag.client.SDCDataAccess import SDCDataAccess, SDCUploadError
-from imap_mag.util import Environment
+from imap_mag.download.FetchScience import FetchScience
+from imap_mag.util import Environment, MAGSensor, ScienceLevel, ScienceMode
+from tests.util.LocalSDCServer import LocalSDCServer
 
 
 def test_sdc_data_access_constructor_sets_config() -> None:
@@ -817,3 +819,63 @@ def call_fetch_spice(wiremock_manager, start_date):
         )
 
     return downloaded
+
+
+def _sdc_science_files(descriptor: str, count: int) -> list[dict[str, str]]:
+    return [
+        {
+            "file_path": f"imap/mag/l1c/2025/05/imap_mag_l1c_{descriptor}_202505{day + 1:02}_v001.cdf",
+            "instrument": "mag",
+            "data_level": "l1c",
+            "descriptor": descriptor,
+            "start_date": f"202505{day + 1:02}",
+            "repointing": None,  # type: ignore[dict-item]
+            "version": "v001",
+            "extension": "cdf",
+            "ingestion_date": f"20250601 00:00:{day:02}",
+        }
+        for day in range(count)
+    ]
+
+
+def test_fetch_science_queries_descriptors_concurrently(
+    local_sdc_server: LocalSDCServer, temp_folder_path: Path
+) -> None:
+    # Set up.
+    descriptors = ["norm-magi", "norm-mago", "burst-magi", "burst-mago"]
+
+    for descriptor in descriptors:
+        files = _sdc_science_files(descriptor, 2)
+        local_sdc_server.add_query_response(descriptor, files)
+
+        for file in files:
+            local_sdc_server.add_download(file["file_path"], b"science")
+
+    fetch_science = FetchScience(
+        SDCDataAccess(
+            auth_code=SecretStr("test_token"),
+            data_dir=temp_folder_path,
+            sdc_url=local_sdc_server.get_url(),
+        ),
+        max_concurrent_downloads=4,
+    )
+
+    # Exercise.
+    downloaded: list[Path] = list(
+        fetch_science.download_science(
+            level=ScienceLevel.l1c,
+            start_date=datetime(2025, 5, 1),
+            end_date=datetime(2025, 5, 31),
+            modes=[ScienceMode.Normal, ScienceMode.Burst],
+            sensors=[MAGSensor.IBS, MAGSensor.OBS],
+        ).keys()
+    )
+
+    # Verify.
+    assert len(downloaded) == 8
+    assert len(set(downloaded)) == 8
+
+    assert sorted(q["descriptor"] for q in local_sdc_server.get_queries()) == sorted(
+        descriptors
+    )
+    assert local_sdc_server.max_concurrent_requests == 4
@@ -1,5 +1,7 @@
 """Tests for the datastoreIndexerFlow."""
 
+from unittest import mock
+
 import pytest
 
 from imap_db.model import File
@@ -130,3 +132,69 @@ async def test_index_datastore_empty_datastore(
     # Should complete without errors; no files indexed
     records = test_database.get_files()
     assert len(records) == 0
+
+
+@pytest.mark.asyncio
+async def test_index_datastore_updates_file_with_changed_size(
+    test_database,
+    clean_datastore,
+):
+    """File on disk whose size differs from its active DB record should be re-indexed."""
+    rel_path = (
+        "hk/mag/l1/hsk-procstat/2025/11/imap_mag_l1_hsk-procstat_20251101_v001.csv"
+    )
+    full_path = clean_datastore / rel_path
+    _make_hk_file(clean_datastore, rel_path, content="changed-content")
+
+    existing = File(
+        name=full_path.name,
+        path=rel_path,
+        descriptor=File.get_descriptor_from_filename(full_path.name),
+        version=1,
+        hash="old-hash",
+        size=1,
+        content_date=None,
+        software_version="1.0.0",
+    )
+    test_database.upsert_file(existing)
+
+    await index_datastore_flow.fn()
+
+    record = _db_record_for_path(test_database, rel_path)
+    assert record is not None
+    assert record.hash != "old-hash"
+    assert record.size == full_path.stat().st_size
+    assert len(test_database.get_files()) == 1
+
+
+@pytest.mark.asyncio
+async def test_index_datastore_queries_sdc_once_for_all_spice_files(
+    test_database,
+    clean_datastore,
+):
+    """Metadata for all new SPICE files should come from a single SDC query."""
+    spice_files = [
+        "spice/sclk/imap_sclk_0032.tsc",
+        "spice/sclk/imap_sclk_0136.tsc",
+    ]
+    for rel_path in spice_files:
+        _make_hk_file(clean_datastore, rel_path)
+
+    query_results = [
+        {"file_name": "imap/spice/sclk/imap_sclk_0032.tsc", "kernel_type": "sclk"},
+        {"file_name": "imap/spice/sclk/imap_sclk_0136.tsc", "kernel_type": "sclk"},
+    ]
+
+    with mock.patch(
+        "prefect_server.datastoreIndexerFlow.SDCDataAccess.spice_query",
+        return_value=query_results,
+    ) as mock_spice_query:
+        await index_datastore_flow.fn()
+
+    mock_spice_query.assert_called_once_with()
+
+    for rel_path in spice_files:
+        record = _db_record_for_path(test_database, rel_path)
+        assert record is not None
+        assert record.file_meta is not None
+        assert record.file_meta.get("kernel_type") == "sclk"
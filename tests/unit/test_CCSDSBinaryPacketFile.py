@@ -78,3 +78,40 @@ class TestCombineDaysByApid:
         result = CCSDSBinaryPacketFile.combine_days_by_apid([HK_PW_PKTS, HK_PW_PKTS])
         direct = CCSDSBinaryPacketFile(HK_PW_PKTS).get_days_by_apid()
         assert set(result.keys()) == set(direct.keys())
+
+
+class TestGetPacketIndex:
+    def test_indexes_every_packet_in_file(self):
+        index = CCSDSBinaryPacketFile(HK_PW_PKTS).get_packet_index()
+        assert len(index) > 0
+        assert index.offsets[0] == 0
+        assert index.offsets[-1] + index.lengths[-1] == HK_PW_PKTS.stat().st_size
+        assert set(index.apids.tolist()) == {1063}
+
+    def test_index_is_cached(self):
+        packet_file = CCSDSBinaryPacketFile(HK_PW_PKTS)
+        assert packet_file.get_packet_index() is packet_file.get_packet_index()
+
+    def test_sequence_counts_and_shcoarse_are_decoded(self):
+        index = CCSDSBinaryPacketFile(HK_PW_PKTS).get_packet_index()
+        assert index.shcoarse[0] == 483848304
+        assert (index.sequence_counts < 2**14).all()
+
+    def test_truncated_packet_is_not_indexed(self, tmp_path, capture_cli_logs):
+        truncated = tmp_path / "truncated.pkts"
+        truncated.write_bytes(HK_PW_PKTS.read_bytes()[:-1])
+
+        index = CCSDSBinaryPacketFile(truncated).get_packet_index()
+
+        assert (
+            len(index) == len(CCSDSBinaryPacketFile(HK_PW_PKTS).get_packet_index()) - 1
+        )
+        assert f"Error decoding 49 bytes in {truncated}" in capture_cli_logs.text
+
+    def test_empty_file_has_empty_index(self):
+        index = CCSDSBinaryPacketFile(TEST_DATA / "EMPTY_HK.pkts").get_packet_index()
+        assert len(index) == 0
+
+    def test_split_by_day_gathers_all_packet_bytes(self):
+        result = CCSDSBinaryPacketFile(HK_PW_PKTS).split_packets_by_day()
+        assert b"".join(result.values()) == HK_PW_PKTS.read_bytes()
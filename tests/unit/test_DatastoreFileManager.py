@@ -1,6 +1,7 @@
 """Tests for `OutputManager` class."""
 
 import json
+import os
 import re
 import shutil
 from datetime import datetime
@@ -10,22 +11,32 @@ from unittest.mock import patch
 
 import pytest
 
+from imap_mag.config import PublishStrategy
 from imap_mag.io import DatastoreFileManager
 from imap_mag.io.file import (
     CalibrationLayerPathHandler,
     HKDecodedPathHandler,
     IFilePathHandler,
 )
+from imap_mag.util import FileHash
 from tests.util.miscellaneous import (
     create_test_file,
     write_calibration_layer_pair,
 )
 
 
-def _manager(path: Path, disk_usage_threshold: float = 1.0) -> DatastoreFileManager:
+def _manager(
+    path: Path,
+    disk_usage_threshold: float = 1.0,
+    publish_strategy: PublishStrategy = PublishStrategy.Copy,
+) -> DatastoreFileManager:
     """Create a DatastoreFileManager with a minimal settings stub."""
     return DatastoreFileManager(
-        SimpleNamespace(data_store=path, disk_usage_threshold=disk_usage_threshold)  # type: ignore[arg-type]
+        SimpleNamespace(  # type: ignore[arg-type]
+            data_store=path,
+            disk_usage_threshold=disk_usage_threshold,
+            publish_strategy=publish_strategy,
+        )
     )
 
 
@@ -47,7 +58,7 @@ def test_copy_new_file(capture_cli_logs, temp_folder_path):
 
     # Verify.
     assert (
-        f"Copied to {Path(f'{temp_folder_path}/hk/mag/l1/pwr/2025/05/imap_mag_l1_pwr_20250502_v001.txt')}."
+        f"Published {original_file} to {Path(f'{temp_folder_path}/hk/mag/l1/pwr/2025/05/imap_mag_l1_pwr_20250502_v001.txt')} using "
         in capture_cli_logs.text
     )
 
@@ -56,6 +67,106 @@ def test_copy_new_file(capture_cli_logs, temp_folder_path):
     ).exists()
 
 
+@pytest.mark.parametrize(
+    "publish_strategy, source_kept",
+    [
+        (PublishStrategy.Copy, True),
+        (PublishStrategy.Clone, True),
+        (PublishStrategy.Move, False),
+    ],
+)
+def test_publish_strategy(
+    capture_cli_logs, temp_folder_path, publish_strategy, source_kept
+):
+    # Set up.
+    manager = _manager(temp_folder_path, publish_strategy=publish_strategy)
+
+    original_file = create_test_file(
+        Path(f"{temp_folder_path}/work/some_test_file.txt"), "some content"
+    )
+
+    # Exercise.
+    (destination_file, _, _) = manager.add_file(
+        original_file,
+        HKDecodedPathHandler(
+            descriptor="pwr",
+            content_date=datetime(2025, 5, 2),
+            extension="txt",
+        ),
+    )
+
+    # Verify.
+    assert destination_file.read_text() == "some content"
+    assert original_file.exists() == source_kept
+    assert not list(destination_file.parent.glob(".*.part"))
+
+    if publish_strategy == PublishStrategy.Copy:
+        assert " using copy." in capture_cli_logs.text
+    elif publish_strategy == PublishStrategy.Move:
+        assert " using rename." in capture_cli_logs.text
+
+
+def test_copy_with_different_hash_fails_verification(temp_folder_path):
+    # Set up.
+    manager = _manager(temp_folder_path, publish_strategy=PublishStrategy.Copy)
+
+    original_file = create_test_file(
+        Path(f"{temp_folder_path}/some_test_file.txt"), "some content"
+    )
+
+    # Exercise and verify.
+    with (
+        patch(
+            "imap_mag.io.DatastoreFileManager.publish_file",
+            side_effect=lambda source, destination, **_: (
+                shutil.copy2(source, destination),
+                ("copy", "not-the-hash"),
+            )[1],
+        ),
+        pytest.raises(FileNotFoundError, match="does not match source"),
+    ):
+        manager.add_file(
+            original_file,
+            HKDecodedPathHandler(
+                descriptor="pwr",
+                content_date=datetime(2025, 5, 2),
+                extension="txt",
+            ),
+        )
+
+
+@pytest.mark.parametrize("publish_strategy", list(PublishStrategy))
+def test_published_file_is_not_read_again(temp_folder_path, publish_strategy):
+    # Set up.
+    manager = _manager(temp_folder_path, publish_strategy=publish_strategy)
+
+    original_file = create_test_file(
+        Path(f"{temp_folder_path}/work/some_test_file.txt"), "some content"
+    )
+
+    # Pretend the file was last modified long ago, so its hash can be cached.
+    os.utime(original_file, (1_700_000_000, 1_700_000_000))
+    source_hash = FileHash.hash(original_file)
+
+    # Exercise.
+    with patch(
+        "imap_mag.io.DatastoreFileManager.IFilePathHandler.default_file_hash",
+        side_effect=IFilePathHandler.default_file_hash,
+    ) as mock_hash:
+        (destination_file, _, _) = manager.add_file(
+            original_file,
+            HKDecodedPathHandler(
+                descriptor="pwr",
+                content_date=datetime(2025, 5, 2),
+                extension="txt",
+            ),
+        )
+
+    # Verify.
+    assert all(call.args[0] != destination_file for call in mock_hash.call_args_list)
+    assert FileHash.get_cached(destination_file) == source_hash
+
+
 def test_copy_file_same_content(capture_cli_logs, temp_folder_path):
     # Set up.
     manager = _manager(temp_folder_path)
@@ -186,6 +297,87 @@ def test_copy_file_existing_versions(
     ).exists()
 
 
+def test_existing_versions_resolved_from_one_listing_without_hashing_different_sizes(
+    temp_folder_path,
+):
+    # Set up.
+    manager = _manager(temp_folder_path)
+
+    original_file = create_test_file(
+        Path(f"{temp_folder_path}/test_existing_versions_one_listing.txt"),
+        "some longer content",
+    )
+
+    existing_files = [
+        create_test_file(
+            Path(
+                f"{temp_folder_path}/hk/mag/l1/pwr/2025/05/imap_mag_l1_pwr_20250502_v{version:03}.txt"
+            ),
+            "short",
+        )
+        for version in range(1, 4)
+    ]
+
+    # Exercise.
+    with (
+        patch(
+            "imap_mag.io.DatastoreIndex.os.scandir", side_effect=os.scandir
+        ) as mock_scandir,
+        patch.object(FileHash, "hash", side_effect=FileHash.hash) as mock_hash,
+    ):
+        (_, path_handler, _) = manager.add_file(
+            original_file,
+            HKDecodedPathHandler(
+                descriptor="pwr",
+                content_date=datetime(2025, 5, 2),
+                extension="txt",
+            ),
+        )
+
+    # Verify.
+    assert path_handler.get_sequence() == 4
+    assert mock_scandir.call_count == 1
+
+    hashed_files = {Path(call.args[0]) for call in mock_hash.call_args_list}
+    assert hashed_files.isdisjoint(existing_files)
+
+
+def test_new_version_is_one_after_latest_existing_version(temp_folder_path):
+    # Set up.
+    manager = _manager(temp_folder_path)
+
+    original_file = create_test_file(
+        Path(f"{temp_folder_path}/test_new_version_after_latest.txt"),
+        "some content",
+    )
+
+    # Version 2 is missing, e.g. because it was deleted.
+    for version in (1, 3):
+        create_test_file(
+            Path(
+                f"{temp_folder_path}/hk/mag/l1/pwr/2025/05/imap_mag_l1_pwr_20250502_v{version:03}.txt"
+            ),
+            f"content {version}",
+        )
+
+    # Exercise.
+    (destination_file, path_handler, _) = manager.add_file(
+        original_file,
+        HKDecodedPathHandler(
+            descriptor="pwr",
+            content_date=datetime(2025, 5, 2),
+            extension="txt",
+        ),
+    )
+
+    # Verify.
+    assert path_handler.get_sequence() == 4
+    assert destination_file.name == "imap_mag_l1_pwr_20250502_v004.txt"
+    assert not Path(
+        f"{temp_folder_path}/hk/mag/l1/pwr/2025/05/imap_mag_l1_pwr_20250502_v002.txt"
+    ).exists()
+
+
 def test_copy_file_forced_version(temp_folder_path):
     # Set up.
     manager = _manager(temp_folder_path)
@@ -498,3 +690,88 @@ def test_add_file_uses_parent_when_datastore_not_yet_created(tmp_path):
         # Should have been called on an existing path (the tmp_path ancestor)
         called_path = mock_usage.call_args[0][0]
         assert called_path.exists()
+
+
+def test_add_files_versions_files_for_same_folder_in_order(temp_folder_path):
+    # Set up.
+    manager = _manager(temp_folder_path)
+
+    files = [
+        (
+            create_test_file(Path(f"{temp_folder_path}/{name}.txt"), name),
+            HKDecodedPathHandler(
+                descriptor="pwr",
+                content_date=content_date,
+                extension="txt",
+            ),
+        )
+        for name, content_date in [
+            ("first", datetime(2025, 5, 2)),
+            ("second", datetime(2025, 5, 2)),
+            ("third", datetime(2025, 6, 2)),
+        ]
+    ]
+
+    # Exercise.
+    results = manager.add_files(files, max_workers=2)
+
+    # Verify.
+    assert [result[0].name for result in results] == [
+        "imap_mag_l1_pwr_20250502_v001.txt",
+        "imap_mag_l1_pwr_20250502_v002.txt",
+        "imap_mag_l1_pwr_20250602_v001.txt",
+    ]
+    assert [result[0].read_text() for result in results] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_add_files_raises_first_error_after_adding_other_files(temp_folder_path):
+    # Set up.
+    manager = _manager(temp_folder_path)
+
+    files = [
+        (
+            Path(f"{temp_folder_path}/missing.txt"),
+            HKDecodedPathHandler(
+                descriptor="pwr", content_date=datetime(2025, 5, 2), extension="txt"
+            ),
+        ),
+        (
+            create_test_file(Path(f"{temp_folder_path}/present.txt"), "present"),
+            HKDecodedPathHandler(
+                descriptor="pwr", content_date=datetime(2025, 6, 2), extension="txt"
+            ),
+        ),
+    ]
+
+    # Exercise.
+    with pytest.raises(FileNotFoundError):
+        manager.add_files(files)
+
+    # Verify.
+    assert Path(
+        f"{temp_folder_path}/hk/mag/l1/pwr/2025/06/imap_mag_l1_pwr_20250602_v001.txt"
+    ).exists()
+
+
+def test_find_existing_files_finds_files_in_datastore(temp_folder_path):
+    # Set up.
+    manager = _manager(temp_folder_path)
+
+    existing_handler = HKDecodedPathHandler(
+        descriptor="pwr", content_date=datetime(2025, 5, 2), extension="txt"
+    )
+    missing_handler = HKDecodedPathHandler(
+        descriptor="pwr", content_date=datetime(2025, 5, 3), extension="txt"
+    )
+
+    existing_file = create_test_file(existing_handler.get_full_path(temp_folder_path))
+
+    # Exercise.
+    existing_files = manager.find_existing_files([existing_handler, missing_handler])
+
+    # Verify.
+    assert existing_files == [existing_file, None]
@@ -0,0 +1,147 @@
+"""Tests for `DatastoreIndex` class."""
+
+import os
+import re
+from pathlib import Path
+from unittest import mock
+
+from imap_mag.io import DatastoreIndex
+
+
+def _create_files(folder: Path, names: list[str], mtime: int = 1_700_000_000) -> None:
+    folder.mkdir(parents=True, exist_ok=True)
+
+    for name in names:
+        (folder / name).write_text(name)
+
+    # Pretend the folder was last modified long ago, so it is not racy.
+    os.utime(folder, (mtime, mtime))
+
+
+def test_list_files_returns_sorted_files_only(tmp_path: Path) -> None:
+    # Set up.
+    _create_files(tmp_path, ["b.cdf", "a.cdf", ".hidden"])
+    (tmp_path / "subfolder").mkdir()
+    os.utime(tmp_path, (1_700_000_000, 1_700_000_000))
+
+    # Exercise.
+    files = DatastoreIndex().list_files(tmp_path)
+
+    # Verify.
+    assert files == [tmp_path / "a.cdf", tmp_path / "b.cdf"]
+
+
+def test_list_files_returns_empty_list_for_missing_folder(tmp_path: Path) -> None:
+    assert DatastoreIndex().list_files(tmp_path / "missing") == []
+
+
+def test_unchanged_folder_is_listed_once(tmp_path: Path) -> None:
+    # Set up.
+    _create_files(tmp_path, ["a.cdf"])
+    index = DatastoreIndex()
+
+    # Exercise.
+    with mock.patch(
+        "imap_mag.io.DatastoreIndex.os.scandir", side_effect=os.scandir
+    ) as mock_scandir:
+        for _ in range(3):
+            index.list_files(tmp_path)
+
+    # Verify.
+    assert mock_scandir.call_count == 1
+
+
+def test_folder_is_listed_again_when_modified(tmp_path: Path) -> None:
+    # Set up.
+    _create_files(tmp_path, ["a.cdf"])
+    index = DatastoreIndex()
+
+    assert index.list_files(tmp_path) == [tmp_path / "a.cdf"]
+
+    # Exercise.
+    _create_files(tmp_path, ["b.cdf"], mtime=1_700_000_100)
+
+    # Verify.
+    assert index.list_files(tmp_path) == [tmp_path / "a.cdf", tmp_path / "b.cdf"]
+
+
+def test_recently_modified_folder_is_always_listed_again(tmp_path: Path) -> None:
+    # Set up.
+    tmp_path.mkdir(exist_ok=True)
+    (tmp_path / "a.cdf").write_text("a")
+
+    index = DatastoreIndex()
+
+    # Exercise.
+    with mock.patch(
+        "imap_mag.io.DatastoreIndex.os.scandir", side_effect=os.scandir
+    ) as mock_scandir:
+        for _ in range(2):
+            index.list_files(tmp_path)
+
+    # Verify.
+    assert mock_scandir.call_count == 2
+
+
+def test_glob_matches_files_in_folder(tmp_path: Path) -> None:
+    # Set up.
+    folder = tmp_path / "science" / "mag" / "l1c" / "2025" / "05"
+    _create_files(
+        folder,
+        [
+            "imap_mag_l1c_norm-mago_20250502_v001.cdf",
+            "imap_mag_l1c_norm-mago_20250502_v002.cdf",
+            "imap_mag_l1c_norm-magi_20250502_v001.cdf",
+            "imap_mag_l1c_norm-mago_20250503_v001.cdf",
+        ],
+    )
+
+    # Exercise.
+    files = DatastoreIndex().glob(
+        tmp_path, "science/mag/l1c/2025/05/imap_mag_l1c_norm-mago_20250502_v*.cdf"
+    )
+
+    # Verify.
+    assert files == [
+        folder / "imap_mag_l1c_norm-mago_20250502_v001.cdf",
+        folder / "imap_mag_l1c_norm-mago_20250502_v002.cdf",
+    ]
+
+
+def test_glob_with_wildcard_folders_falls_back_to_globbing(tmp_path: Path) -> None:
+    # Set up.
+    _create_files(tmp_path / "2025" / "05", ["a.cdf"])
+    _create_files(tmp_path / "2025" / "06", ["b.cdf"])
+
+    # Exercise.
+    files = DatastoreIndex().glob(tmp_path, "2025/*/*.cdf")
+
+    # Verify.
+    assert files == [
+        tmp_path / "2025" / "05" / "a.cdf",
+        tmp_path / "2025" / "06" / "b.cdf",
+    ]
+
+
+def test_find_sequences_returns_highest_sequence_first(tmp_path: Path) -> None:
+    # Set up.
+    _create_files(
+        tmp_path,
+        [
+            "imap_mag_l1_hsk-pw_20250502_v001.csv",
+            "imap_mag_l1_hsk-pw_20250502_v003.csv",
+            "imap_mag_l1_hsk-pw_20250502_v002.csv",
+            "imap_mag_l1_hsk-pw_20250503_v004.csv",
+        ],
+    )
+    pattern = re.compile(r"imap_mag_l1_hsk-pw_20250502_v(?P<version>\d+)\.csv")
+
+    # Exercise.
+    sequences = DatastoreIndex().find_sequences(tmp_path, pattern, "version")
+
+    # Verify.
+    assert sequences == [
+        ((tmp_path / "imap_mag_l1_hsk-pw_20250502_v003.csv").as_posix(), 3),
+        ((tmp_path / "imap_mag_l1_hsk-pw_20250502_v002.csv").as_posix(), 2),
+        ((tmp_path / "imap_mag_l1_hsk-pw_20250502_v001.csv").as_posix(), 1),
+    ]
@@ -0,0 +1,94 @@
+"""Tests for `FileHash` class."""
+
+import hashlib
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from imap_mag.util import FileHash
+
+
+@pytest.fixture(autouse=True)
+def clear_hash_cache():
+    FileHash.clear_cache()
+    yield
+    FileHash.clear_cache()
+
+
+def _create_file(file: Path, content: bytes, mtime: int = 1_700_000_000) -> Path:
+    file.write_bytes(content)
+
+    # Pretend the file was last modified long ago, so it is not racy.
+    os.utime(file, (mtime, mtime))
+    return file
+
+
+def test_hash_matches_hashlib_for_multiple_chunks(tmp_path: Path) -> None:
+    # Set up.
+    content = os.urandom(3 * 1024 + 17)
+    file = _create_file(tmp_path / "file.bin", content)
+
+    # Exercise.
+    with mock.patch.object(FileHash, "CHUNK_SIZE", 1024):
+        digest = FileHash.hash(file)
+
+    # Verify.
+    assert digest == hashlib.md5(content).hexdigest()
+
+
+def test_unchanged_file_is_hashed_once(tmp_path: Path) -> None:
+    # Set up.
+    file = _create_file(tmp_path / "file.bin", b"content")
+
+    # Exercise.
+    with mock.patch("imap_mag.util.FileHash.open", side_effect=open) as mock_open:
+        for _ in range(3):
+            FileHash.hash(file)
+
+    # Verify.
+    assert mock_open.call_count == 1
+
+
+def test_modified_file_is_hashed_again(tmp_path: Path) -> None:
+    # Set up.
+    file = _create_file(tmp_path / "file.bin", b"content-1")
+    first_hash = FileHash.hash(file)
+
+    # Exercise.
+    _create_file(file, b"content-2", mtime=1_700_000_100)
+
+    # Verify.
+    assert FileHash.hash(file) != first_hash
+    assert FileHash.hash(file) == hashlib.md5(b"content-2").hexdigest()
+
+
+def test_recently_modified_file_is_not_cached(tmp_path: Path) -> None:
+    # Set up.
+    file = tmp_path / "file.bin"
+    file.write_bytes(b"content")
+
+    # Exercise.
+    with mock.patch("imap_mag.util.FileHash.open", side_effect=open) as mock_open:
+        for _ in range(2):
+            FileHash.hash(file)
+
+    # Verify.
+    assert mock_open.call_count == 2
+
+
+def test_remembered_hash_is_used_without_reading_file(tmp_path: Path) -> None:
+    # Set up.
+    file = _create_file(tmp_path / "file.bin", b"content")
+    assert FileHash.get_cached(file) is None
+
+    # Exercise.
+    FileHash.remember(file, hashlib.md5(b"content").hexdigest())
+
+    # Verify.
+    with mock.patch("imap_mag.util.FileHash.open", side_effect=open) as mock_open:
+        assert FileHash.get_cached(file) == hashlib.md5(b"content").hexdigest()
+        assert FileHash.hash(file) == hashlib.md5(b"content").hexdigest()
+
+    mock_open.assert_not_called()
@@ -0,0 +1,106 @@
+"""Tests for HKBulkDecoder."""
+
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+import space_packet_parser as spp
+
+from imap_mag.process.HKBulkDecoder import HKBulkDecoder, normalise_field_name
+from imap_mag.process.HKProcessor import _decommutate_subsystem
+from imap_mag.util import CCSDSBinaryPacketFile
+from tests.util.miscellaneous import TEST_DATA
+
+MAG_XTCE = Path("src/imap_mag/packet_def/mag_17.9.xml")
+
+logger = logging.getLogger(__name__)
+
+
+def decode_packet_by_packet(
+    file: Path, definition: spp.xtce.definitions.XtcePacketDefinition
+) -> dict[int, dict[str, list]]:
+    data: dict[int, dict[str, list]] = {}
+
+    with open(file, "rb") as f:
+        for binary_packet in spp.ccsds_generator(f):
+            packet = definition.parse_bytes(binary_packet)
+            apid = binary_packet.apid
+            for key, value in (packet.user_data | packet.header).items():
+                if isinstance(value, bytes):
+                    value = int.from_bytes(value, byteorder="big")
+
+                data.setdefault(apid, {}).setdefault(
+                    normalise_field_name(key), []
+                ).append(value)
+
+    return data
+
+
+@pytest.mark.parametrize(
+    "file",
+    [
+        "MAG_HSK_PW.pkts",
+        "MAG_HSK_SCI.pkts",
+        "MAG_HSK_STATUS.pkts",
+        "MAG_HSK_PROCSTAT.pkts",
+        "MAG_HSK_SID15.pkts",
+    ],
+)
+def test_bulk_decode_matches_packet_by_packet_decode(file: str) -> None:
+    # Set up.
+    definition = spp.load_xtce(MAG_XTCE)
+    packet_file = CCSDSBinaryPacketFile(TEST_DATA / file)
+
+    expected = decode_packet_by_packet(TEST_DATA / file, definition)
+
+    # Exercise.
+    actual = HKBulkDecoder(MAG_XTCE, definition).decode(
+        packet_file.read_bytes(), packet_file.get_packet_index()
+    )
+
+    # Verify.
+    assert actual.keys() == expected.keys()
+
+    for apid, columns in actual.items():
+        assert columns is not None
+        assert list(columns.keys()) == list(expected[apid].keys())
+
+        for name, values in columns.items():
+            np.testing.assert_array_equal(values, np.asarray(expected[apid][name]))
+
+
+@pytest.mark.parametrize(
+    "file", sorted(TEST_DATA.glob("MAG_HSK_*.pkts")), ids=lambda file: file.name
+)
+def test_benchmark_hk_decode_throughput(file: Path, record_property) -> None:
+    """Record how many packets per second are decoded by the HK decode path."""
+
+    # Set up.
+    packet_file = CCSDSBinaryPacketFile(file)
+    packet_count = len(packet_file.get_packet_index())
+
+    # Warm up XTCE and layout caches, which are shared across files.
+    _decommutate_subsystem(packet_file, MAG_XTCE)
+
+    # Exercise.
+    repeats = 5
+    start = time.perf_counter()
+
+    for _ in range(repeats):
+        decoded = _decommutate_subsystem(packet_file, MAG_XTCE)
+
+    elapsed = time.perf_counter() - start
+
+    # Verify.
+    packets_per_second = packet_count * repeats / elapsed
+    record_property("packets_per_second", round(packets_per_second))
+
+    logger.info(
+        f"Decoded {packet_count} packets from {file.name} at {packets_per_second:,.0f} packets/s."
+    )
+
+    assert sum(len(next(iter(columns.values()))) for columns in decoded.values()) == (
+        packet_count
+    )
@@ -0,0 +1,50 @@
+"""Tests for HKMergeCache."""
+
+from datetime import date
+
+import pandas as pd
+
+from imap_mag.process.HKMergeCache import HKMergeCache, HKMergeCacheEntry
+
+DAY = date(2025, 10, 17)
+
+
+def create_entry() -> HKMergeCacheEntry:
+    return HKMergeCacheEntry(
+        data=pd.DataFrame(
+            {"pkt_apid": [1063, 1063], "shcoarse": [1, 2], "name": ["A", "B"]},
+            index=pd.Index([10, 20], name="epoch"),
+        ),
+        l0_hashes={"abc", "def"},
+    )
+
+
+def test_load_returns_saved_entry(temp_folder_path):
+    # Set up.
+    cache = HKMergeCache(temp_folder_path)
+    entry = create_entry()
+
+    # Exercise.
+    cache.save("MAG_HSK_PW", DAY, "xtce", entry)
+    loaded = cache.load("MAG_HSK_PW", DAY, "xtce")
+
+    # Verify.
+    assert loaded is not None
+    assert loaded.l0_hashes == entry.l0_hashes
+    pd.testing.assert_frame_equal(loaded.data, entry.data)
+
+
+def test_load_ignores_entry_decoded_with_different_xtce(temp_folder_path):
+    # Set up.
+    cache = HKMergeCache(temp_folder_path)
+    cache.save("MAG_HSK_PW", DAY, "old-xtce", create_entry())
+
+    # Exercise.
+    loaded = cache.load("MAG_HSK_PW", DAY, "new-xtce")
+
+    # Verify.
+    assert loaded is None
+
+
+def test_load_returns_none_when_nothing_is_cached(temp_folder_path):
+    assert HKMergeCache(temp_folder_path).load("MAG_HSK_PW", DAY, "xtce") is None
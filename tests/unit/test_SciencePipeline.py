@@ -0,0 +1,276 @@
+"""Tests for SciencePipeline."""
+
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from imap_db.model import WorkflowProgress
+from imap_mag.client.SDCDataAccess import SDCDataAccess
+from imap_mag.config import AppSettings
+from imap_mag.data_pipelines import AutomaticRunParameters, FileRecord
+from imap_mag.data_pipelines.PublishScienceFilesStage import PublishScienceFilesStage
+from imap_mag.data_pipelines.Record import ScienceFileRecord
+from imap_mag.data_pipelines.SciencePipeline import SciencePipeline
+from imap_mag.db import Database
+from imap_mag.io.file import SciencePathHandler
+from imap_mag.util import DatetimeProvider, MAGSensor, ScienceLevel, ScienceMode
+
+NOW = datetime(2025, 6, 1, 12, 0, 0)
+
+
+def _ingestion_date(index: int) -> datetime:
+    return datetime(2025, 5, 20, 10, 0, index)
+
+
+def _sdc_files(count: int) -> list[dict[str, str]]:
+    files = [
+        {
+            "file_path": f"imap/mag/l1c/2025/05/imap_mag_l1c_norm-magi_202505{index + 1:02}_v001.cdf",
+            "descriptor": "norm-magi",
+            "start_date": f"202505{index + 1:02}",
+            "ingestion_date": _ingestion_date(index).strftime("%Y%m%d %H:%M:%S"),
+            "version": "v001",
+        }
+        for index in range(count)
+    ]
+
+    # query results are not in ingestion order
+    return list(reversed(files))
+
+
+@pytest.fixture
+def mock_sdc(dynamic_work_folder: Path) -> mock.Mock:
+    sdc = mock.create_autospec(SDCDataAccess, spec_set=True)
+    sdc.query_sdc_files.side_effect = lambda **_: _sdc_files(5)
+
+    def download(file_path: str) -> Path:
+        file = dynamic_work_folder / Path(file_path).name
+        file.write_text(f"science for {file.name}")
+        return file
+
+    sdc.download.side_effect = download
+    return sdc
+
+
+@pytest.fixture
+def mock_database() -> mock.Mock:
+    database = mock.create_autospec(Database, spec_set=True)
+    database.get_files.return_value = []
+    database.get_active_files_in_folder.return_value = []
+    database.get_workflow_progress.return_value = WorkflowProgress(item_name="TEST_L1C")
+    return database
+
+
+def _create_pipeline(
+    mock_sdc: mock.Mock, mock_database: mock.Mock
+) -> tuple[SciencePipeline, list[datetime | None]]:
+    settings = AppSettings()  # type: ignore
+    settings.fetch_science.max_concurrent_downloads = 3
+
+    saved_progress: list[datetime | None] = []
+    mock_database.save.side_effect = lambda progress: saved_progress.append(
+        progress.progress_timestamp
+    )
+
+    pipeline = SciencePipeline(
+        database=mock_database,
+        settings=settings,
+        client=mock_sdc,
+        progress_item_id="TEST_L1C",
+        level=ScienceLevel.l1c,
+        modes=[ScienceMode.Normal],
+        sensors=[MAGSensor.IBS],
+        use_ingestion_date=True,
+        datetime_provider=DatetimeProvider(fixed_now=NOW),
+    )
+    pipeline.build(AutomaticRunParameters())
+
+    return (pipeline, saved_progress)
+
+
+@pytest.mark.asyncio
+async def test_science_pipeline_publishes_files_and_saves_progress_in_ingestion_order(
+    mock_sdc, mock_database, dynamic_work_folder, clean_datastore
+):
+    # Set up.
+    (pipeline, saved_progress) = _create_pipeline(mock_sdc, mock_database)
+
+    # Exercise.
+    await pipeline.run()
+
+    # Verify.
+    results = pipeline.get_results().data_items
+
+    assert [result.file_path.name for result in results] == [
+        f"imap_mag_l1c_norm-magi_202505{index + 1:02}_v001.cdf" for index in range(5)
+    ]
+    assert all(
+        result.file_path.is_relative_to(clean_datastore / "science")
+        and result.file_path.exists()
+        for result in results
+    )
+
+    assert saved_progress == [_ingestion_date(index) for index in range(5)]
+    assert mock_database.upsert_file.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_science_pipeline_only_saves_progress_up_to_first_failed_file(
+    mock_sdc, mock_database, dynamic_work_folder, clean_datastore
+):
+    # Set up.
+    (pipeline, saved_progress) = _create_pipeline(mock_sdc, mock_database)
+
+    def upsert_file(file, *args, **kwargs):
+        if "20250503" in file.name:
+            raise RuntimeError("Database unavailable.")
+
+    mock_database.upsert_file.side_effect = upsert_file
+
+    # Exercise.
+    with pytest.raises(RuntimeError, match=re.escape("Database unavailable.")):
+        await pipeline.run()
+
+    # Verify.
+    assert saved_progress == [_ingestion_date(0), _ingestion_date(1)]
+
+
+@pytest.mark.asyncio
+async def test_science_pipeline_stops_downloading_when_a_file_fails(
+    mock_sdc, mock_database, dynamic_work_folder, clean_datastore
+):
+    # Set up.
+    mock_sdc.query_sdc_files.side_effect = lambda **_: _sdc_files(30)
+    (pipeline, _) = _create_pipeline(mock_sdc, mock_database)
+
+    mock_database.upsert_file.side_effect = RuntimeError("Database unavailable.")
+
+    # Exercise.
+    with pytest.raises(RuntimeError, match=re.escape("Database unavailable.")):
+        await pipeline.run()
+
+    # Verify.
+    assert mock_sdc.download.call_count < 30
+
+
+@pytest.mark.asyncio
+async def test_publish_science_files_stage_passes_on_files_in_order_received() -> None:
+    # Set up.
+    publish_delays = {"first.cdf": 0.3, "second.cdf": 0.0, "third.cdf": 0.1}
+
+    def add_file(file: Path, path_handler: SciencePathHandler):
+        time.sleep(publish_delays[file.name])
+        return (Path("datastore") / file.name, path_handler, False)
+
+    datastore_manager = mock.Mock()
+    datastore_manager.add_file.side_effect = add_file
+
+    next_stage = mock.AsyncMock()
+    stage = PublishScienceFilesStage(datastore_manager, max_concurrent_publishes=3)
+    stage.prepare(AutomaticRunParameters(), next_stage, index=1)
+
+    context: dict = {}
+
+    # Exercise.
+    for index, name in enumerate(publish_delays):
+        await stage.process(
+            ScienceFileRecord(
+                Path(name),
+                SciencePathHandler(
+                    level="l1c",
+                    descriptor="norm-magi",
+                    content_date=datetime(2025, 5, 1),
+                    ingestion_date=_ingestion_date(index),
+                ),
+            ),
+            context,
+        )
+
+    await stage.stage_completed(context)
+
+    # Verify.
+    published: list[FileRecord] = [
+        call.args[0] for call in next_stage.process.call_args_list
+    ]
+
+    assert [record.file_path for record in published] == [
+        Path("datastore") / name for name in publish_delays
+    ]
+    assert stage.files_saved == 3
+    assert datastore_manager.add_file.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_publish_science_files_stage_publishes_one_file_per_folder_at_a_time() -> (
+    None
+):
+    # Set up.
+    lock = threading.Lock()
+    active_folders: list[str] = []
+    overlapping_folders: set[str] = set()
+    peak_publishes = 0
+    publish_order: list[str] = []
+
+    def add_file(file: Path, path_handler: SciencePathHandler):
+        nonlocal peak_publishes
+        folder = path_handler.get_folder_structure()
+
+        with lock:
+            if folder in active_folders:
+                overlapping_folders.add(folder)
+
+            active_folders.append(folder)
+            peak_publishes = max(peak_publishes, len(active_folders))
+            publish_order.append(file.name)
+
+        time.sleep(0.1)
+
+        with lock:
+            active_folders.remove(folder)
+
+        return (Path("datastore") / file.name, path_handler, False)
+
+    datastore_manager = mock.Mock()
+    datastore_manager.add_file.side_effect = add_file
+
+    next_stage = mock.AsyncMock()
+    stage = PublishScienceFilesStage(datastore_manager, max_concurrent_publishes=4)
+    stage.prepare(AutomaticRunParameters(), next_stage, index=1)
+
+    context: dict = {}
+
+    # Exercise.
+    for index, (name, month) in enumerate(
+        [("a1.cdf", 5), ("b1.cdf", 6), ("a2.cdf", 5), ("b2.cdf", 6)]
+    ):
+        await stage.process(
+            ScienceFileRecord(
+                Path(name),
+                SciencePathHandler(
+                    level="l1c",
+                    descriptor="norm-magi",
+                    content_date=datetime(2025, month, 1),
+                    ingestion_date=_ingestion_date(index),
+                ),
+            ),
+            context,
+        )
+
+    await stage.stage_completed(context)
+
+    # Verify.
+    assert not overlapping_folders
+    assert peak_publishes == 2
+    assert [name for name in publish_order if name.startswith("a")] == [
+        "a1.cdf",
+        "a2.cdf",
+    ]
+    assert [name for name in publish_order if name.startswith("b")] == [
+        "b1.cdf",
+        "b2.cdf",
+    ]
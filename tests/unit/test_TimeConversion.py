@@ -4,6 +4,7 @@ from datetime import UTC, date, datetime
 
 import numpy as np
 
+from imap_mag.util.constants import CONSTANTS
 from imap_mag.util.TimeConversion import TimeConversion
 
 
@@ -91,6 +92,70 @@ class TestTimeConversionMetToDate:
         assert isinstance(result, list)
 
 
+class TestTimeConversionJ2000NsToDatetime64:
+    def test_returns_datetime64_array_with_microsecond_resolution(self):
+        result = TimeConversion.convert_j2000ns_to_datetime64(np.array([0, 1]))
+        assert result.dtype == np.dtype("datetime64[us]")
+        assert len(result) == 2
+
+    def test_utc_mode_is_offset_from_j2000_epoch(self):
+        result = TimeConversion.convert_j2000ns_to_datetime64(
+            np.array([0, 86_400_000_000_000]), utc=True
+        )
+        assert result.tolist() == [
+            datetime(2000, 1, 1, 11, 58, 55, 816000),
+            datetime(2000, 1, 2, 11, 58, 55, 816000),
+        ]
+
+    def test_matches_python_datetime_conversion(self):
+        j2000ns = np.array([0, 1_500, 812_345_678_123_456_789, -1_000_000_000])
+        result = TimeConversion.convert_j2000ns_to_datetime64(j2000ns)
+        assert result.tolist() == [
+            datetime.fromtimestamp(CONSTANTS.J2000_EPOCH_POSIX + ns / 1e9)
+            for ns in j2000ns.tolist()
+        ]
+
+    def test_utc_mode_matches_expected_datetimes(self):
+        j2000ns = np.array([0, 1_000, 812_345_678_123_456_000, -1_000_000_000])
+        result = TimeConversion.convert_j2000ns_to_datetime(j2000ns, utc=True)
+        assert result == [
+            datetime(2000, 1, 1, 11, 58, 55, 816000),
+            datetime(2000, 1, 1, 11, 58, 55, 816001),
+            datetime(2025, 9, 28, 15, 33, 33, 939456),
+            datetime(2000, 1, 1, 11, 58, 54, 816000),
+        ]
+
+
+class TestTimeConversionDayCodes:
+    def test_day_codes_are_days_since_unix_epoch(self):
+        result = TimeConversion.convert_j2000ns_to_day_code(
+            np.array([0, 86_400_000_000_000]), utc=True
+        )
+        assert result.tolist() == [10957, 10958]
+
+    def test_day_code_converts_back_to_date(self):
+        assert TimeConversion.convert_day_code_to_date(10957) == date(2000, 1, 1)
+
+    def test_day_codes_match_dates(self):
+        j2000ns = np.array([0, 43_200_000_000_000, 86_400_000_000_000])
+        codes = TimeConversion.convert_j2000ns_to_day_code(j2000ns, utc=True)
+        dates = TimeConversion.convert_j2000ns_to_date(j2000ns, utc=True)
+        assert [TimeConversion.convert_day_code_to_date(c) for c in codes] == dates
+
+
+class TestTimeConversionDatetime64ToIsoString:
+    def test_omits_zero_microseconds_like_isoformat(self):
+        datetimes = np.array(
+            ["2025-05-02T12:00:00", "2025-05-02T12:00:00.000123"],
+            dtype="datetime64[us]",
+        )
+        result = TimeConversion.convert_datetime64_to_isostring(datetimes)
+        assert result.tolist() == [
+            datetime(2025, 5, 2, 12).isoformat(),
+            datetime(2025, 5, 2, 12, 0, 0, 123).isoformat(),
+        ]
+
+
 class TestTryExtractIsoLikeDatetime:
     def test_returns_none_if_dict_is_none(self):
         result = TimeConversion.try_extract_iso_like_datetime(None, "key")
@@ -1,7 +1,9 @@
 """Tests for WebPODA client."""
 
+import io
+import threading
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -10,6 +12,14 @@ from pydantic import SecretStr
 from imap_mag.client.WebPODA import WebPODA
 
 
+def _make_response(content: bytes, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.raw = io.BytesIO(content)
+    response.status_code = status_code
+    response.url = "http://webpoda.example.com/"
+    return response
+
+
 def _make_poda(tmp_path):
     return WebPODA(
         auth_code=SecretStr("test"),
@@ -39,10 +49,11 @@ class TestWebPODAInit:
 class TestWebPODADownload:
     def test_download_creates_output_file(self, tmp_path):
         poda = _make_poda(tmp_path)
-        mock_response = MagicMock()
-        mock_response.content = b"binary_data"
+        mock_response = _make_response(b"binary_data")
 
-        with patch("imap_mag.client.WebPODA.requests.get", return_value=mock_response):
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get", return_value=mock_response
+        ):
             result = poda.download(
                 packet="P_MAG_SID1",
                 start_date=datetime(2025, 1, 1),
@@ -52,6 +63,22 @@ class TestWebPODADownload:
         assert result.exists()
         assert result.read_bytes() == b"binary_data"
 
+    def test_download_streams_large_response_in_chunks(self, tmp_path):
+        poda = _make_poda(tmp_path)
+        content = bytes(range(256)) * (WebPODA.CHUNK_SIZE // 100)
+        mock_response = _make_response(content)
+
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get", return_value=mock_response
+        ):
+            result = poda.download(
+                packet="P_MAG_SID1",
+                start_date=datetime(2025, 1, 1),
+                end_date=datetime(2025, 1, 2),
+            )
+
+        assert result.read_bytes() == content
+
     def test_download_creates_directory_if_not_exists(self, tmp_path):
         nested_dir = tmp_path / "subdir" / "nested"
         poda = WebPODA(
@@ -59,10 +86,11 @@ class TestWebPODADownload:
             output_dir=nested_dir,
             webpoda_url="http://webpoda.example.com/",
         )
-        mock_response = MagicMock()
-        mock_response.content = b"data"
+        mock_response = _make_response(b"data")
 
-        with patch("imap_mag.client.WebPODA.requests.get", return_value=mock_response):
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get", return_value=mock_response
+        ):
             result = poda.download(
                 packet="P_MAG_SID1",
                 start_date=datetime(2025, 1, 1),
@@ -74,15 +102,16 @@ class TestWebPODADownload:
 
     def test_download_url_includes_packet_and_dates(self, tmp_path):
         poda = _make_poda(tmp_path)
-        mock_response = MagicMock()
-        mock_response.content = b"data"
+        mock_response = _make_response(b"data")
         captured_url = []
 
-        def capture_request(url, headers):
+        def capture_request(url, headers, stream):
             captured_url.append(url)
             return mock_response
 
-        with patch("imap_mag.client.WebPODA.requests.get", side_effect=capture_request):
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get", side_effect=capture_request
+        ):
             poda.download(
                 packet="P_MAG_SID1",
                 start_date=datetime(2025, 1, 1),
@@ -96,12 +125,11 @@ class TestWebPODADownload:
 
     def test_download_raises_on_http_error(self, tmp_path):
         poda = _make_poda(tmp_path)
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            "404"
-        )
+        mock_response = _make_response(b"", status_code=404)
 
-        with patch("imap_mag.client.WebPODA.requests.get", return_value=mock_response):
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get", return_value=mock_response
+        ):
             with pytest.raises(requests.exceptions.RequestException):
                 poda.download(
                     packet="P_MAG_SID1",
@@ -111,15 +139,16 @@ class TestWebPODADownload:
 
     def test_download_with_ert_mode(self, tmp_path):
         poda = _make_poda(tmp_path)
-        mock_response = MagicMock()
-        mock_response.content = b"data"
+        mock_response = _make_response(b"data")
         captured_url = []
 
-        def capture_request(url, headers):
+        def capture_request(url, headers, stream):
             captured_url.append(url)
             return mock_response
 
-        with patch("imap_mag.client.WebPODA.requests.get", side_effect=capture_request):
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get", side_effect=capture_request
+        ):
             poda.download(
                 packet="P_MAG_SID1",
                 start_date=datetime(2025, 1, 1),
@@ -130,13 +159,38 @@ class TestWebPODADownload:
         assert "ert" in captured_url[0]
 
 
+class TestWebPODAGetDownloadPath:
+    def test_whole_days_use_dates_only(self, tmp_path):
+        poda = _make_poda(tmp_path)
+
+        result = poda.get_download_path(
+            packet="P_MAG_SID1",
+            start_date=datetime(2025, 1, 1),
+            end_date=datetime(2025, 1, 2),
+        )
+
+        assert result == tmp_path / "P_MAG_SID1_20250101_20250102.bin"
+
+    def test_partial_days_include_times(self, tmp_path):
+        poda = _make_poda(tmp_path)
+
+        result = poda.get_download_path(
+            packet="P_MAG_SID1",
+            start_date=datetime(2025, 1, 1, 6),
+            end_date=datetime(2025, 1, 1, 12),
+        )
+
+        assert result == tmp_path / "P_MAG_SID1_20250101T060000_20250101T120000.bin"
+
+
 class TestWebPODAGetMaxErt:
     def test_returns_none_when_no_data(self, tmp_path):
         poda = _make_poda(tmp_path)
-        mock_response = MagicMock()
-        mock_response.content = b"ert\n"
+        mock_response = _make_response(b"ert\n")
 
-        with patch("imap_mag.client.WebPODA.requests.get", return_value=mock_response):
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get", return_value=mock_response
+        ):
             result = poda.get_max_ert(
                 packet="P_MAG_SID1",
                 start_date=datetime(2025, 1, 1),
@@ -147,12 +201,13 @@ class TestWebPODAGetMaxErt:
 
     def test_returns_max_datetime_from_response(self, tmp_path):
         poda = _make_poda(tmp_path)
-        mock_response = MagicMock()
-        mock_response.content = (
+        mock_response = _make_response(
             b"ert\n2025-01-01T10:00:00\n2025-01-01T12:00:00\n2025-01-01T11:00:00"
         )
 
-        with patch("imap_mag.client.WebPODA.requests.get", return_value=mock_response):
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get", return_value=mock_response
+        ):
             result = poda.get_max_ert(
                 packet="P_MAG_SID1",
                 start_date=datetime(2025, 1, 1),
@@ -160,3 +215,55 @@ class TestWebPODAGetMaxErt:
             )
 
         assert result == datetime(2025, 1, 1, 12, 0, 0)
+
+    def test_reuses_session_for_requests_from_same_thread(self, tmp_path):
+        poda = _make_poda(tmp_path)
+        sessions = []
+
+        def capture_request(session, url, headers, stream):
+            sessions.append(session)
+            return _make_response(b"ert\n2025-01-01T10:00:00\n")
+
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get",
+            autospec=True,
+            side_effect=capture_request,
+        ):
+            for _ in range(2):
+                poda.get_max_ert(
+                    packet="P_MAG_SID1",
+                    start_date=datetime(2025, 1, 1),
+                    end_date=datetime(2025, 1, 2),
+                )
+
+        assert len(sessions) == 2
+        assert sessions[0] is sessions[1]
+
+    def test_uses_separate_session_for_each_thread(self, tmp_path):
+        poda = _make_poda(tmp_path)
+        sessions = []
+
+        def capture_request(session, url, headers, stream):
+            sessions.append(session)
+            return _make_response(b"ert\n2025-01-01T10:00:00\n")
+
+        def get_max_ert():
+            poda.get_max_ert(
+                packet="P_MAG_SID1",
+                start_date=datetime(2025, 1, 1),
+                end_date=datetime(2025, 1, 2),
+            )
+
+        with patch(
+            "imap_mag.client.WebPODA.requests.Session.get",
+            autospec=True,
+            side_effect=capture_request,
+        ):
+            get_max_ert()
+
+            thread = threading.Thread(target=get_max_ert)
+            thread.start()
+            thread.join()
+
+        assert len(sessions) == 2
+        assert sessions[0] is not sessions[1]
@@ -228,6 +228,36 @@ def test_check_ialirt_files_with_anomalies(
     assert anomalies[0] == expected_anomaly
 
 
+def test_check_ialirt_parquet_files_with_anomalies(temp_folder_path) -> None:
+    # Set up.
+    write_test_ialirt_packet_definition_file(temp_folder_path)
+    test_ialirt_data = write_test_ialirt_data_file(temp_folder_path)
+
+    ialirt_data = pd.read_csv(test_ialirt_data)
+    ialirt_data.loc[1, "danger_limit_param"] = 25  # introduce anomaly
+
+    parquet_file = test_ialirt_data.with_suffix(".parquet")
+    ialirt_data.to_parquet(parquet_file, index=False)
+
+    # Execute.
+    anomalies: list[IALiRTAnomaly] = check_ialirt_files(
+        files=[parquet_file],
+        packet_definition_folder=temp_folder_path,
+    )
+
+    # Verify.
+    assert anomalies == [
+        IALiRTOutOfBoundsAnomaly(
+            time_range=(datetime(2024, 1, 1, 1), datetime(2024, 1, 1, 1)),
+            parameter="My Danger Limit",
+            severity=SeverityLevel.Danger,
+            count=1,
+            value=25.0,
+            limits=(10, 20),
+        )
+    ]
+
+
 def test_check_ialirt_raises_error_when_no_checks_run(temp_folder_path) -> None:
     # Set up: YAML has known params, but CSV has completely different columns.
     write_test_ialirt_packet_definition_file(temp_folder_path)
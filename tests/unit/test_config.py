@@ -4,9 +4,18 @@ from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
-
-from imap_mag.config import AppSettings, NestedAliasEnvSettingsSource
+from pydantic import ValidationError
+
+from imap_mag.config import (
+    AppSettings,
+    NestedAliasEnvSettingsSource,
+    PublishStrategy,
+)
+from imap_mag.config.ApiSource import SdcApiSource, WebPodaApiSource
 from imap_mag.config.CommandConfig import CommandConfig
+from imap_mag.config.FetchConfig import FetchBinaryConfig, FetchScienceConfig
+from imap_mag.config.ProcessConfig import ProcessConfig
+from imap_mag.config.PublishConfig import PublishConfig
 from imap_mag.util.Environment import Environment
 
 
@@ -186,6 +195,17 @@ def test_version_major_overridden_by_env_var():
     assert settings.version_major == 2
 
 
+# ── publish_strategy settings ─────────────────────────────────────────────────
+
+
+def test_publish_strategy_defaults_to_copy():
+    """Files are copied into the datastore unless clone or move is opted into."""
+    settings = AppSettings()
+
+    assert AppSettings.model_fields["publish_strategy"].default == PublishStrategy.Copy
+    assert settings.publish_strategy == PublishStrategy.Copy
+
+
 def test_setup_work_folder_blocked_for_sub_folder(tmp_path):
     """setup_work_folder checks disk space even for nested sub-folders."""
     config = CommandConfig(work_sub_folder="science")
@@ -194,3 +214,64 @@ def test_setup_work_folder_blocked_for_sub_folder(tmp_path):
     with patch("shutil.disk_usage", return_value=_fake_disk_usage(0.99)):
         with pytest.raises(OSError, match="threshold"):
             config.setup_work_folder(settings)
+
+
+# ── process settings ──────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_hk_decode_workers_must_be_at_least_1(workers):
+    """hk_decode_workers below 1 is rejected when the settings are loaded."""
+    with pytest.raises(ValidationError, match="hk_decode_workers"):
+        ProcessConfig(hk_decode_workers=workers)
+
+
+@pytest.mark.parametrize("workers", [1, 4, None])
+def test_hk_decode_workers_accepts_positive_or_none(workers):
+    """hk_decode_workers may be any positive number, or None for all CPUs."""
+    assert ProcessConfig(hk_decode_workers=workers).hk_decode_workers == workers
+
+
+# ── fetch settings ────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [
+        ("max_concurrent_downloads", 0),
+        ("max_concurrent_slice_downloads", 0),
+        ("download_retries", -1),
+    ],
+)
+def test_fetch_binary_settings_reject_out_of_range_values(setting, value):
+    """Out of range concurrency settings are rejected when the settings are loaded."""
+    with pytest.raises(ValidationError, match=setting):
+        FetchBinaryConfig(
+            api=WebPodaApiSource(url_base="http://webpoda"), **{setting: value}
+        )
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [
+        ("max_concurrent_downloads", 0),
+        ("download_retries", -1),
+    ],
+)
+def test_fetch_science_settings_reject_out_of_range_values(setting, value):
+    """Out of range concurrency settings are rejected when the settings are loaded."""
+    with pytest.raises(ValidationError, match=setting):
+        FetchScienceConfig(api=SdcApiSource(url_base="http://sdc"), **{setting: value})
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [
+        ("max_concurrent_uploads", 0),
+        ("upload_retries", -1),
+    ],
+)
+def test_publish_settings_reject_out_of_range_values(setting, value):
+    """Out of range concurrency settings are rejected when the settings are loaded."""
+    with pytest.raises(ValidationError, match=setting):
+        PublishConfig(api=SdcApiSource(url_base="http://sdc"), **{setting: value})
@@ -1,5 +1,7 @@
 """Unit tests for Database class that do not require a real database connection."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import patch
 
@@ -158,6 +160,63 @@ class TestDatabaseOperations:
         assert len(files) == 1
         assert files[0].hash == "hash_v2"
 
+    def test_upsert_files_commits_in_batches(self, sqlite_db):
+        files = [
+            _make_file(f"batch{i}.cdf", f"science/batch{i}.cdf", f"h{i}")
+            for i in range(5)
+        ]
+
+        with patch.object(
+            sqlite_db, "session", wraps=sqlite_db.session
+        ) as mock_session:
+            sqlite_db.upsert_files(files, batch_size=2)
+
+        assert mock_session.call_count == 3
+        assert len(sqlite_db.get_files()) == 5
+
+    def test_upsert_files_merges_existing_and_duplicate_records(self, sqlite_db):
+        sqlite_db.upsert_files(
+            [
+                _make_file("a.cdf", "science/a.cdf", "ha_v1"),
+                _make_file("b.cdf", "science/b.cdf", "hb"),
+            ]
+        )
+
+        sqlite_db.upsert_files(
+            [
+                _make_file("a.cdf", "science/a.cdf", "ha_v2"),
+                _make_file("b.cdf", "science/b.cdf", "hb"),
+                _make_file("c.cdf", "science/c.cdf", "hc_v1"),
+                _make_file("c.cdf", "science/c.cdf", "hc_v2"),
+            ]
+        )
+
+        files = {f.name: f for f in sqlite_db.get_files()}
+        assert len(files) == 3
+        assert files["a.cdf"].hash == "ha_v2"
+        assert files["b.cdf"].hash == "hb"
+        assert files["c.cdf"].hash == "hc_v2"
+
+    def test_upsert_files_sets_ids_and_server_defaults_on_new_files(self, sqlite_db):
+        files = [
+            _make_file(f"new{i}.cdf", f"science/new{i}.cdf", f"h{i}") for i in range(3)
+        ]
+
+        sqlite_db.upsert_files(files)
+
+        stored_ids = {f.path: f.id for f in sqlite_db.get_files()}
+        assert [f.id for f in files] == [stored_ids[f.path] for f in files]
+        assert all(f.creation_date is not None for f in files)
+        assert all(f.last_modified_date is not None for f in files)
+
+        # files with an id are updated, rather than inserted again
+        files[0].hash = "h0_v2"
+        sqlite_db.upsert_file(files[0])
+
+        stored = {f.path: f for f in sqlite_db.get_files()}
+        assert len(stored) == 3
+        assert stored[files[0].path].hash == "h0_v2"
+
     def test_get_files_by_path(self, sqlite_db):
         f1 = _make_file("f1.cdf", "science/mag/l2/f1.cdf", "h1")
         f2 = _make_file("f2.cdf", "hk/mag/l1/f2.cdf", "h2")
@@ -200,6 +259,44 @@ class TestDatabaseOperations:
         results = sqlite_db.get_files_deleted_since(datetime(2025, 6, 1))
         assert any(f.name == "gone.cdf" for f in results)
 
+    def test_concurrent_operations_each_use_their_own_session(self, sqlite_db):
+        sqlite_db.upsert_files(
+            [_make_file(f"f{i}.cdf", f"science/f{i}.cdf", f"h{i}") for i in range(2)]
+        )
+
+        # both operations are in progress before either one queries
+        both_in_progress = threading.Barrier(2, timeout=5)
+        created_sessions: dict[int, object] = {}
+        queried_sessions: dict[int, object] = {}
+        create_session = sqlite_db.session
+
+        def create_session_and_wait(**kwargs):
+            session = create_session(**kwargs)
+            query = session.query
+
+            def query_and_record(*args, **query_kwargs):
+                queried_sessions[threading.get_ident()] = session
+                return query(*args, **query_kwargs)
+
+            session.query = query_and_record
+            created_sessions[threading.get_ident()] = session
+            both_in_progress.wait()
+            return session
+
+        with (
+            patch.object(sqlite_db, "session", side_effect=create_session_and_wait),
+            ThreadPoolExecutor(max_workers=2) as executor,
+        ):
+            results = list(
+                executor.map(lambda i: sqlite_db.get_files(name=f"f{i}.cdf"), range(2))
+            )
+
+        assert [[f.name for f in files] for files in results] == [
+            ["f0.cdf"],
+            ["f1.cdf"],
+        ]
+        assert queried_sessions == created_sessions
+
     def test_get_workflow_progress_creates_new_when_not_found(self, sqlite_db):
         progress = sqlite_db.get_workflow_progress("NEW_ITEM")
         assert progress is not None
@@ -241,6 +338,59 @@ class TestDatabaseOperations:
         results = sqlite_db.get_active_files_matching_patterns([])
         assert results == []
 
+    def test_get_active_files_in_folder_excludes_subfolders_and_deleted(
+        self, sqlite_db
+    ):
+        sqlite_db.upsert_file(_make_file("a.cdf", "science/mag/l2/a.cdf", "ha"))
+        sqlite_db.upsert_file(_make_file("b.cdf", "science/mag/l2/sub/b.cdf", "hb"))
+        sqlite_db.upsert_file(_make_file("c.cdf", "science/mag/l2_x/c.cdf", "hc"))
+        sqlite_db.upsert_file(
+            _make_file(
+                "d.cdf",
+                "science/mag/l2/d.cdf",
+                "hd",
+                deletion_date=datetime(2025, 1, 1),
+            )
+        )
+
+        results = sqlite_db.get_active_files_in_folder("science/mag/l2")
+        assert [f.name for f in results] == ["a.cdf"]
+
+    def test_get_active_files_by_descriptor_filters_by_day_and_major_version(
+        self, sqlite_db
+    ):
+        def make_file(name, content_date, version, version_major, **kwargs):
+            file = _make_file(name, f"science/mag/l1c/{name}", name, **kwargs)
+            file.descriptor = "imap_mag_l1c_norm-mago"
+            file.content_date = content_date
+            file.version = version
+            file.version_major = version_major
+            return file
+
+        sqlite_db.upsert_file(make_file("a.cdf", datetime(2026, 1, 16), 1, 1))
+        sqlite_db.upsert_file(make_file("b.cdf", datetime(2026, 1, 16), 2, 1))
+        sqlite_db.upsert_file(make_file("c.cdf", datetime(2026, 1, 16), 1, 2))
+        sqlite_db.upsert_file(make_file("d.cdf", datetime(2026, 1, 17), 3, 1))
+        sqlite_db.upsert_file(
+            make_file(
+                "e.cdf",
+                datetime(2026, 1, 16),
+                3,
+                1,
+                deletion_date=datetime(2026, 1, 18),
+            )
+        )
+
+        results = sqlite_db.get_active_files_by_descriptor(
+            "imap_mag_l1c_norm-mago", datetime(2026, 1, 16, 12)
+        )
+        assert [f.name for f in results] == ["c.cdf", "b.cdf", "a.cdf"]
+
+        results = sqlite_db.get_active_files_by_descriptor(
+            "imap_mag_l1c_norm-mago", datetime(2026, 1, 16), version_major=1
+        )
+        assert [f.name for f in results] == ["b.cdf", "a.cdf"]
+
     def test_get_files_since_with_limit(self, sqlite_db):
         files = [
             _make_file(
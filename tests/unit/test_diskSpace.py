@@ -0,0 +1,116 @@
+"""Tests for `DiskSpaceMonitor` class."""
+
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from imap_mag.util.diskSpace import DiskSpaceMonitor
+
+TOTAL = 1_000_000
+
+
+def _disk_usage(used: int):
+    return shutil.disk_usage(Path("/"))._replace(
+        total=TOTAL, used=used, free=TOTAL - used
+    )  # type: ignore[attr-defined]
+
+
+def test_disk_usage_is_sampled_once_for_several_checks(tmp_path: Path) -> None:
+    # Set up.
+    monitor = DiskSpaceMonitor(tmp_path, threshold=0.9)
+
+    # Exercise.
+    with patch(
+        "shutil.disk_usage", return_value=_disk_usage(500_000)
+    ) as mock_disk_usage:
+        for _ in range(10):
+            monitor.check(1_000)
+            monitor.record_write(1_000)
+
+    # Verify.
+    assert mock_disk_usage.call_count == 1
+    assert monitor.headroom == 900_000 - 500_000 - 10_000
+
+
+def test_disk_usage_is_sampled_again_after_sample_bytes_written(
+    tmp_path: Path,
+) -> None:
+    # Set up.
+    monitor = DiskSpaceMonitor(tmp_path, threshold=0.9)
+    monitor.SAMPLE_BYTES = 5_000
+
+    # Exercise.
+    with patch(
+        "shutil.disk_usage", return_value=_disk_usage(500_000)
+    ) as mock_disk_usage:
+        for _ in range(6):
+            monitor.check(1_000)
+            monitor.record_write(1_000)
+
+    # Verify.
+    assert mock_disk_usage.call_count == 2
+
+
+def test_disk_usage_is_sampled_again_after_sample_interval(tmp_path: Path) -> None:
+    # Set up.
+    monitor = DiskSpaceMonitor(tmp_path, threshold=0.9)
+    monitor.SAMPLE_INTERVAL_NS = 0
+
+    # Exercise.
+    with patch(
+        "shutil.disk_usage", return_value=_disk_usage(500_000)
+    ) as mock_disk_usage:
+        for _ in range(3):
+            monitor.check()
+
+    # Verify.
+    assert mock_disk_usage.call_count == 3
+
+
+def test_write_crossing_threshold_is_refused(tmp_path: Path) -> None:
+    # Set up.
+    monitor = DiskSpaceMonitor(tmp_path, threshold=0.9)
+
+    # Exercise and verify.
+    with patch("shutil.disk_usage", return_value=_disk_usage(850_000)):
+        monitor.check(40_000)
+
+        with pytest.raises(OSError, match=r"from 85\.0% to 90\.0%.*threshold"):
+            monitor.check(50_000)
+
+
+def test_write_refused_by_estimate_is_allowed_if_space_was_freed(
+    tmp_path: Path,
+) -> None:
+    # Set up.
+    monitor = DiskSpaceMonitor(tmp_path, threshold=0.9)
+
+    with patch("shutil.disk_usage", return_value=_disk_usage(800_000)):
+        monitor.check()
+        monitor.record_write(90_000)
+
+    # Exercise.
+    with patch(
+        "shutil.disk_usage", return_value=_disk_usage(500_000)
+    ) as mock_disk_usage:
+        monitor.check(20_000)
+
+    # Verify.
+    assert mock_disk_usage.call_count == 1
+    assert monitor.headroom == 400_000
+
+
+def test_missing_path_is_not_checked(tmp_path: Path) -> None:
+    # Set up.
+    monitor = DiskSpaceMonitor(tmp_path / "missing", threshold=0.9)
+
+    # Exercise and verify.
+    with (
+        patch("pathlib.Path.exists", return_value=False),
+        patch("shutil.disk_usage") as mock_disk_usage,
+    ):
+        monitor.check(1_000_000_000)
+
+    mock_disk_usage.assert_not_called()
@@ -1,16 +1,18 @@
 """Tests for `FetchBinary` class."""
 
+import os
 import tempfile
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest import mock
 
 import pytest
+import requests
 
 from imap_mag.client.WebPODA import WebPODA
 from imap_mag.download.FetchBinary import FetchBinary
 from imap_mag.io.file import HKBinaryPathHandler
-from imap_mag.util import HKPacket
+from imap_mag.util import CCSDSBinaryPacketFile, HKPacket
 from tests.util.miscellaneous import (
     TEST_DATA,
     create_test_file,
@@ -199,3 +201,267 @@ def test_fetch_binary_with_ert_start_end_date(mock_poda: mock.Mock) -> None:
         )
     finally:
         expected_file.unlink(missing_ok=True)
+
+
+def _mock_download_path(tmp_path: Path):
+    return lambda *, packet, start_date, end_date: (
+        tmp_path
+        / f"{packet}_{start_date.strftime('%Y%m%dT%H%M%S')}_{end_date.strftime('%Y%m%dT%H%M%S')}.bin"
+    )
+
+
+def test_fetch_binary_in_slices_gives_same_output_as_single_download(
+    mock_poda: mock.Mock, tmp_path: Path
+) -> None:
+    # Set up.
+    test_data: bytes = (TEST_DATA / "MAG_HSK_PW.pkts").read_bytes()
+    split_offset = int(
+        CCSDSBinaryPacketFile(TEST_DATA / "MAG_HSK_PW.pkts")
+        .get_packet_index()
+        .offsets[500]
+    )
+
+    slice_data: dict[datetime, bytes] = {
+        datetime(2025, 5, 2): test_data[:split_offset],
+        datetime(2025, 5, 3): test_data[split_offset:],
+    }
+
+    def download_slice(*, packet, start_date, end_date, ert):
+        file = _mock_download_path(tmp_path)(
+            packet=packet, start_date=start_date, end_date=end_date
+        )
+        file.write_bytes(
+            test_data
+            if (end_date - start_date) > timedelta(days=1)
+            else slice_data[start_date]
+        )
+        return file
+
+    mock_poda.get_download_path.side_effect = _mock_download_path(tmp_path)
+    mock_poda.download.side_effect = download_slice
+    mock_poda.get_max_ert.side_effect = lambda **_: datetime(2025, 6, 3, 8, 58, 39)
+
+    # Exercise.
+    single_downloaded = FetchBinary(mock_poda).download_binaries(
+        packet=HKPacket.SID3_PW,
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 3),
+    )
+    single_data = {file: file.read_bytes() for file in single_downloaded}
+
+    sliced_downloaded = FetchBinary(
+        mock_poda, slice_duration=timedelta(days=1), max_concurrent_slices=2
+    ).download_binaries(
+        packet=HKPacket.SID3_PW,
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 3),
+    )
+    sliced_data = {file: file.read_bytes() for file in sliced_downloaded}
+
+    # Verify.
+    assert mock_poda.download.call_count == 3
+    assert sliced_downloaded == single_downloaded
+    assert sliced_data == single_data
+
+    # Slices are removed once stitched together.
+    assert not any(
+        f.name.startswith("MAG_HSK_PW_20250502T000000_20250503T")
+        for f in tmp_path.iterdir()
+    )
+
+
+def test_fetch_binary_in_slices_reuses_previously_downloaded_ert_slices(
+    mock_poda: mock.Mock, tmp_path: Path
+) -> None:
+    # Set up.
+    test_data: bytes = (TEST_DATA / "MAG_HSK_PW.pkts").read_bytes()
+
+    mock_poda.get_download_path.side_effect = _mock_download_path(tmp_path)
+    mock_poda.get_max_ert.side_effect = lambda **_: None
+
+    first_slice = _mock_download_path(tmp_path)(
+        packet="MAG_HSK_PW",
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 3),
+    )
+    first_slice.write_bytes(test_data)
+
+    def download_slice(*, packet, start_date, end_date, ert):
+        file = _mock_download_path(tmp_path)(
+            packet=packet, start_date=start_date, end_date=end_date
+        )
+        file.write_bytes(b"")
+        return file
+
+    mock_poda.download.side_effect = download_slice
+
+    # Exercise.
+    actual_downloaded = FetchBinary(
+        mock_poda, slice_duration=timedelta(days=1)
+    ).download_binaries(
+        packet=HKPacket.SID3_PW,
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 3),
+        use_ert=True,
+    )
+
+    # Verify.
+    mock_poda.download.assert_called_once_with(
+        packet="MAG_HSK_PW",
+        start_date=datetime(2025, 5, 3),
+        end_date=datetime(2025, 5, 4),
+        ert=True,
+    )
+
+    assert len(actual_downloaded) == 1
+    assert next(iter(actual_downloaded)).read_bytes() == test_data
+
+
+def test_fetch_binary_in_slices_downloads_ert_slices_fetched_too_soon_again(
+    mock_poda: mock.Mock, tmp_path: Path
+) -> None:
+    # Set up.
+    test_data: bytes = (TEST_DATA / "MAG_HSK_PW.pkts").read_bytes()
+
+    mock_poda.get_download_path.side_effect = _mock_download_path(tmp_path)
+    mock_poda.get_max_ert.side_effect = lambda **_: None
+
+    # Packets received just before the end of this window may not have reached
+    # WebPODA when this slice was downloaded.
+    first_slice = _mock_download_path(tmp_path)(
+        packet="MAG_HSK_PW",
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 3),
+    )
+    first_slice.write_bytes(b"")
+
+    downloaded_at = datetime(2025, 5, 3, 0, 10, tzinfo=UTC).timestamp()
+    os.utime(first_slice, (downloaded_at, downloaded_at))
+
+    def download_slice(*, packet, start_date, end_date, ert):
+        file = _mock_download_path(tmp_path)(
+            packet=packet, start_date=start_date, end_date=end_date
+        )
+        file.write_bytes(test_data if start_date == datetime(2025, 5, 2) else b"")
+        return file
+
+    mock_poda.download.side_effect = download_slice
+
+    # Exercise.
+    actual_downloaded = FetchBinary(
+        mock_poda,
+        slice_duration=timedelta(days=1),
+        slice_settling_time=timedelta(hours=1),
+    ).download_binaries(
+        packet=HKPacket.SID3_PW,
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 3),
+        use_ert=True,
+    )
+
+    # Verify.
+    assert mock_poda.download.call_count == 2
+    mock_poda.download.assert_any_call(
+        packet="MAG_HSK_PW",
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 3),
+        ert=True,
+    )
+
+    assert len(actual_downloaded) == 1
+    assert next(iter(actual_downloaded)).read_bytes() == test_data
+
+
+def test_fetch_binary_in_slices_downloads_measurement_time_slices_again(
+    mock_poda: mock.Mock, tmp_path: Path
+) -> None:
+    # Set up.
+    test_data: bytes = (TEST_DATA / "MAG_HSK_PW.pkts").read_bytes()
+
+    mock_poda.get_download_path.side_effect = _mock_download_path(tmp_path)
+    mock_poda.get_max_ert.side_effect = lambda **_: None
+
+    # More data for this window may have arrived since this slice was downloaded.
+    first_slice = _mock_download_path(tmp_path)(
+        packet="MAG_HSK_PW",
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 3),
+    )
+    first_slice.write_bytes(b"")
+
+    def download_slice(*, packet, start_date, end_date, ert):
+        file = _mock_download_path(tmp_path)(
+            packet=packet, start_date=start_date, end_date=end_date
+        )
+        file.write_bytes(test_data if start_date == datetime(2025, 5, 2) else b"")
+        return file
+
+    mock_poda.download.side_effect = download_slice
+
+    # Exercise.
+    actual_downloaded = FetchBinary(
+        mock_poda, slice_duration=timedelta(days=1)
+    ).download_binaries(
+        packet=HKPacket.SID3_PW,
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 3),
+    )
+
+    # Verify.
+    assert mock_poda.download.call_args_list == [
+        mock.call(
+            packet="MAG_HSK_PW",
+            start_date=datetime(2025, 5, 2),
+            end_date=datetime(2025, 5, 3),
+            ert=False,
+        ),
+        mock.call(
+            packet="MAG_HSK_PW",
+            start_date=datetime(2025, 5, 3),
+            end_date=datetime(2025, 5, 4),
+            ert=False,
+        ),
+    ]
+
+    assert len(actual_downloaded) == 1
+    assert next(iter(actual_downloaded)).read_bytes() == test_data
+
+
+def test_fetch_binary_retries_failed_download(mock_poda: mock.Mock) -> None:
+    # Set up.
+    test_file = Path(tempfile.gettempdir()) / "test_file"
+
+    mock_poda.download.side_effect = [
+        requests.exceptions.ConnectionError("Connection reset"),
+        create_test_file(test_file, None),
+    ]
+
+    # Exercise.
+    actual_downloaded = FetchBinary(
+        mock_poda, retries=1, retry_delay_seconds=0
+    ).download_binaries(
+        packet=HKPacket.SID3_PW,
+        start_date=datetime(2025, 5, 2),
+        end_date=datetime(2025, 5, 2),
+    )
+
+    # Verify.
+    assert mock_poda.download.call_count == 2
+    assert actual_downloaded == dict()
+
+
+def test_fetch_binary_raises_when_retries_exhausted(mock_poda: mock.Mock) -> None:
+    # Set up.
+    mock_poda.download.side_effect = requests.exceptions.ConnectionError(
+        "Connection reset"
+    )
+
+    # Exercise and verify.
+    with pytest.raises(requests.exceptions.ConnectionError):
+        FetchBinary(mock_poda, retries=2, retry_delay_seconds=0).download_binaries(
+            packet=HKPacket.SID3_PW,
+            start_date=datetime(2025, 5, 2),
+            end_date=datetime(2025, 5, 2),
+        )
+
+    assert mock_poda.download.call_count == 3
@@ -6,6 +6,8 @@ from pathlib import Path
 from unittest import mock
 
 import pytest
+import requests
+from imap_data_access.io import IMAPDataAccessError
 
 from imap_mag.client.SDCDataAccess import SDCDataAccess
 from imap_mag.download.FetchScience import FetchScience
@@ -300,3 +302,199 @@ def test_fetch_l2_science_with_both_sensors(
         )
         in actual_downloaded.values()
     )
+
+
+def _science_files(tmp_path: Path, count: int) -> list[dict[str, str]]:
+    files = []
+
+    for index in range(count):
+        file = tmp_path / f"imap_mag_l1b_norm-mago_2025050{index + 1}_v001.cdf"
+        file.write_text(f"contents {index}")
+        files.append(
+            {
+                "file_path": str(file),
+                "descriptor": "norm-mago",
+                "start_date": f"2025050{index + 1}",
+                # query results are not in ingestion order
+                "ingestion_date": f"20250602 00:00:0{count - index}",
+                "version": "v001",
+            }
+        )
+
+    return files
+
+
+def test_fetch_science_concurrent_downloads_keep_ingestion_order(
+    mock_soc: mock.Mock, tmp_path: Path
+) -> None:
+    # Set up.
+    fetchScience = FetchScience(mock_soc, max_concurrent_downloads=4)
+
+    files = _science_files(tmp_path, 6)
+    mock_soc.query_sdc_files.side_effect = lambda **_: files
+    mock_soc.download.side_effect = lambda file_path: Path(file_path)
+
+    published: list[Path] = []
+
+    # Exercise.
+    actual_downloaded = fetchScience.download_science(
+        level=ScienceLevel.l1b,
+        start_date=datetime(2025, 5, 1),
+        end_date=datetime(2025, 5, 6),
+        modes=[ScienceMode.Normal],
+        sensors=[MAGSensor.OBS],
+        on_downloaded=lambda file, _: published.append(file),
+    )
+
+    # Verify.
+    expected = [Path(file["file_path"]) for file in reversed(files)]
+
+    assert list(actual_downloaded.keys()) == expected
+    assert published == expected
+
+
+def test_fetch_science_concurrent_downloads_respect_skip_and_max_downloads(
+    mock_soc: mock.Mock, tmp_path: Path
+) -> None:
+    # Set up.
+    fetchScience = FetchScience(mock_soc, max_concurrent_downloads=4)
+
+    files = _science_files(tmp_path, 6)
+    mock_soc.query_sdc_files.side_effect = lambda **_: files
+    mock_soc.download.side_effect = lambda file_path: Path(file_path)
+
+    # Exercise.
+    actual_downloaded = fetchScience.download_science(
+        level=ScienceLevel.l1b,
+        start_date=datetime(2025, 5, 1),
+        end_date=datetime(2025, 5, 6),
+        modes=[ScienceMode.Normal],
+        sensors=[MAGSensor.OBS],
+        skip_items_count=1,
+        max_downloads=2,
+    )
+
+    # Verify.
+    assert list(actual_downloaded.keys()) == [
+        Path(files[4]["file_path"]),
+        Path(files[3]["file_path"]),
+    ]
+
+    # no more files are downloaded than could be needed
+    assert mock_soc.download.call_count == 2
+
+
+def test_fetch_science_retries_transient_download_errors(
+    mock_soc: mock.Mock, tmp_path: Path
+) -> None:
+    # Set up.
+    fetchScience = FetchScience(
+        mock_soc, max_concurrent_downloads=2, retries=2, retry_delay_seconds=0
+    )
+
+    files = _science_files(tmp_path, 2)
+    mock_soc.query_sdc_files.side_effect = lambda **_: files
+
+    failures = {files[0]["file_path"]: 2}
+
+    def download(file_path: str) -> Path:
+        if failures.get(file_path, 0) > 0:
+            failures[file_path] -= 1
+            raise IMAPDataAccessError("Connection reset") from (
+                requests.exceptions.ConnectionError("Connection reset")
+            )
+
+        return Path(file_path)
+
+    mock_soc.download.side_effect = download
+
+    # Exercise.
+    actual_downloaded = fetchScience.download_science(
+        level=ScienceLevel.l1b,
+        start_date=datetime(2025, 5, 1),
+        end_date=datetime(2025, 5, 2),
+        modes=[ScienceMode.Normal],
+        sensors=[MAGSensor.OBS],
+    )
+
+    # Verify.
+    assert len(actual_downloaded) == 2
+    assert mock_soc.download.call_count == 4
+
+
+def test_fetch_science_does_not_retry_client_errors(
+    mock_soc: mock.Mock, tmp_path: Path
+) -> None:
+    # Set up.
+    fetchScience = FetchScience(mock_soc, retries=2, retry_delay_seconds=0)
+
+    files = _science_files(tmp_path, 1)
+    mock_soc.query_sdc_files.side_effect = lambda **_: files
+
+    response = requests.Response()
+    response.status_code = 404
+
+    def download(file_path: str) -> Path:
+        raise IMAPDataAccessError("404 Not Found") from requests.exceptions.HTTPError(
+            response=response
+        )
+
+    mock_soc.download.side_effect = download
+
+    # Exercise.
+    with pytest.raises(IMAPDataAccessError, match="404"):
+        fetchScience.download_science(
+            level=ScienceLevel.l1b,
+            start_date=datetime(2025, 5, 1),
+            end_date=datetime(2025, 5, 2),
+            modes=[ScienceMode.Normal],
+            sensors=[MAGSensor.OBS],
+        )
+
+    # Verify.
+    assert mock_soc.download.call_count == 1
+
+
+def test_fetch_science_does_not_download_existing_files(
+    mock_soc: mock.Mock, tmp_path: Path
+) -> None:
+    # Set up.
+    fetchScience = FetchScience(mock_soc, max_concurrent_downloads=2)
+
+    files = _science_files(tmp_path, 3)
+    mock_soc.query_sdc_files.side_effect = lambda **_: files
+    mock_soc.download.side_effect = lambda file_path: Path(file_path)
+
+    existing_file = tmp_path / "datastore" / "existing.cdf"
+
+    def find_existing_files(
+        path_handlers: list[SciencePathHandler],
+    ) -> list[Path | None]:
+        return [
+            existing_file if path_handler.content_date == datetime(2025, 5, 2) else None
+            for path_handler in path_handlers
+        ]
+
+    published: list[Path] = []
+
+    # Exercise.
+    actual_downloaded = fetchScience.download_science(
+        level=ScienceLevel.l1b,
+        start_date=datetime(2025, 5, 1),
+        end_date=datetime(2025, 5, 3),
+        modes=[ScienceMode.Normal],
+        sensors=[MAGSensor.OBS],
+        max_downloads=2,
+        on_downloaded=lambda file, _: published.append(file),
+        find_existing_files=find_existing_files,
+    )
+
+    # Verify.
+    assert list(actual_downloaded.keys()) == [
+        Path(files[2]["file_path"]),
+        existing_file,
+    ]
+    assert actual_downloaded[existing_file].content_date == datetime(2025, 5, 2)
+    assert published == [Path(files[2]["file_path"])]
+
+    mock_soc.download.assert_called_once_with(files[2]["file_path"])
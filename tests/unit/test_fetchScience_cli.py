@@ -14,6 +14,19 @@ from imap_mag.io import DatastoreFileManager, DBIndexedDatastoreFileManager
 from imap_mag.io.file import SciencePathHandler
 
 
+def _download_science(downloaded: dict[Path, SciencePathHandler]):
+    """Stand-in for `FetchScience.download_science`, passing each file to `on_downloaded`."""
+
+    def download_science(*, on_downloaded=None, **_):
+        for file, path_handler in downloaded.items():
+            if on_downloaded is not None:
+                on_downloaded(file, path_handler)
+
+        return downloaded
+
+    return download_science
+
+
 class TestFetchScience:
     def test_fetch_science_returns_empty_when_no_data(
         self, dynamic_work_folder, clean_datastore
@@ -108,7 +121,9 @@ class TestFetchScienceOverwriteOption:
         handler = self._make_downloaded_handler()
 
         mock_fetch = MagicMock()
-        mock_fetch.download_science.return_value = {downloaded_file: handler}
+        mock_fetch.download_science.side_effect = _download_science(
+            {downloaded_file: handler}
+        )
 
         with (
             patch("imap_mag.cli.fetch.science.SDCDataAccess"),
@@ -136,7 +151,9 @@ class TestFetchScienceOverwriteOption:
         handler = self._make_downloaded_handler()
 
         mock_fetch = MagicMock()
-        mock_fetch.download_science.return_value = {downloaded_file: handler}
+        mock_fetch.download_science.side_effect = _download_science(
+            {downloaded_file: handler}
+        )
 
         with (
             patch("imap_mag.cli.fetch.science.SDCDataAccess"),
@@ -169,7 +186,9 @@ class TestFetchScienceOverwriteOption:
         handler = self._make_downloaded_handler()
 
         mock_fetch = MagicMock()
-        mock_fetch.download_science.return_value = {downloaded_file: handler}
+        mock_fetch.download_science.side_effect = _download_science(
+            {downloaded_file: handler}
+        )
 
         with (
             patch("imap_mag.cli.fetch.science.SDCDataAccess"),
@@ -201,7 +220,9 @@ class TestFetchScienceOverwriteOption:
         handler = self._make_downloaded_handler()
 
         mock_fetch = MagicMock()
-        mock_fetch.download_science.return_value = {downloaded_file: handler}
+        mock_fetch.download_science.side_effect = _download_science(
+            {downloaded_file: handler}
+        )
 
         db_manager, mock_db = self._db_backed_manager(AppSettings())  # type: ignore
 
@@ -264,7 +285,9 @@ class TestFetchScienceOverwriteOption:
         )
 
         mock_fetch = MagicMock()
-        mock_fetch.download_science.return_value = {downloaded_file: handler}
+        mock_fetch.download_science.side_effect = _download_science(
+            {downloaded_file: handler}
+        )
 
         mock_db = MagicMock()
         mock_db.get_files.return_value = [db_record_at_different_version]
@@ -298,3 +321,51 @@ class TestFetchScienceOverwriteOption:
         assert result[output_file].version == self._VERSION
         assert result[output_file].version_is_locked is True
         mock_db.upsert_file.assert_called_once()
+
+    # ── Skipping existing files ─────────────────────────────────────────────
+
+    @pytest.mark.parametrize(
+        "skip_existing_files, overwrite_option, expect_lookup",
+        [
+            (False, DatastoreSaveOption.FILE_OVERWRITES_BLOCKED, False),
+            (True, DatastoreSaveOption.FILE_OVERWRITES_BLOCKED, True),
+            (True, DatastoreSaveOption.FILE_OVERWRITES_ALLOWED, False),
+        ],
+    )
+    def test_existing_files_only_skipped_when_requested_and_overwrites_blocked(
+        self,
+        dynamic_work_folder,
+        clean_datastore,
+        skip_existing_files,
+        overwrite_option,
+        expect_lookup,
+    ):
+        """Files already in the datastore are only looked up, to skip downloading them, when requested."""
+        existing_handler = self._create_existing_file_in_datastore(clean_datastore)
+
+        mock_fetch = MagicMock()
+        mock_fetch.download_science.side_effect = _download_science({})
+
+        with (
+            patch("imap_mag.cli.fetch.science.SDCDataAccess"),
+            patch("imap_mag.cli.fetch.science.FetchScience", return_value=mock_fetch),
+            patch("imap_mag.cli.fetch.science.initialiseLoggingForCommand"),
+        ):
+            fetch_science(
+                start_date=self._DATE,
+                end_date=self._DATE,
+                fetch_mode=FetchMode.DownloadOnly,
+                overwrite_option=overwrite_option,
+                skip_existing_files=skip_existing_files,
+            )
+
+        find_existing_files = mock_fetch.download_science.call_args.kwargs[
+            "find_existing_files"
+        ]
+
+        if expect_lookup:
+            assert find_existing_files([self._make_downloaded_handler()]) == [
+                existing_handler.get_full_path(clean_datastore)
+            ]
+        else:
+            assert find_existing_files is None
@@ -1,7 +1,12 @@
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
+from unittest import mock
 
 import pytest
 
+from imap_db.model import Base, File
+from imap_mag.db.Database import Database
+from imap_mag.io.DatastoreIndex import DatastoreIndex
 from imap_mag.io.FileFinder import FileFinder
 from imap_mag.util import MAGSensor, ScienceMode
 
@@ -591,3 +596,146 @@ class TestFindMatchingFilesPlaceholderValidation:
             end_date=datetime(2026, 1, 30),
         )
         assert result == []
+
+
+class TestFindFilesInDatabase:
+    LAYER_FOLDER = "calibration/layers/2026/01"
+    SCIENCE_FOLDER = "science/mag/l1c/2026/01"
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        db = Database(db_url=f"sqlite:///{tmp_path}/test.db")
+        Base.metadata.create_all(db.engine)
+        return db
+
+    @staticmethod
+    def _index(database: Database, path: str, version: int) -> None:
+        name = path.split("/")[-1]
+        database.upsert_file(
+            File(
+                name=name,
+                path=path,
+                descriptor=File.get_descriptor_from_filename(name),
+                version=version,
+                version_major=1,
+                hash=path,
+                size=0,
+                content_date=datetime(2026, 1, 16),
+                software_version="1.0",
+            )
+        )
+
+    def test_layers_are_found_from_database(self, datastore, database):
+        # Only index v001, so the database result differs from the datastore one.
+        self._index(
+            database,
+            f"{self.LAYER_FOLDER}/imap_mag_noop-norm-layer_20260116_v001.json",
+            1,
+        )
+        finder = FileFinder(datastore, database=database, search_database=True)
+
+        result = finder.find_layers_by_date_and_patterns(
+            ["*noop*"], datetime(2026, 1, 16), ScienceMode.Normal
+        )
+
+        assert result == ["imap_mag_noop-norm-layer_20260116_v001.json"]
+
+    def test_science_file_is_found_from_database(self, datastore, database):
+        self._index(
+            database,
+            f"{self.SCIENCE_FOLDER}/imap_mag_l1c_norm-mago_20260116_v001.cdf",
+            1,
+        )
+
+        finder = FileFinder(datastore, database=database, search_database=True)
+
+        with mock.patch.object(DatastoreIndex, "list_files") as mock_list_files:
+            result = finder.find_latest_science_by_date(
+                datetime(2026, 1, 16), ScienceMode.Normal, MAGSensor.OBS
+            )
+
+        assert result == "imap_mag_l1c_norm-mago_20260116_v001.cdf"
+        mock_list_files.assert_not_called()
+
+    def test_datastore_is_searched_when_database_science_file_is_missing(
+        self, datastore, database
+    ):
+        self._index(
+            database,
+            f"{self.SCIENCE_FOLDER}/imap_mag_l1c_norm-mago_20260116_v001.cdf",
+            1,
+        )
+        self._index(
+            database,
+            f"{self.SCIENCE_FOLDER}/imap_mag_l1c_norm-mago_20260116_v002.cdf",
+            2,
+        )
+        finder = FileFinder(datastore, database=database, search_database=True)
+
+        result = finder.find_latest_science_by_date(
+            datetime(2026, 1, 16), ScienceMode.Normal, MAGSensor.OBS
+        )
+
+        assert result == "imap_mag_l1c_norm-mago_20260116_v001.cdf"
+
+    def test_datastore_is_searched_when_folder_changed_after_indexing(
+        self, datastore, database
+    ):
+        self._index(
+            database,
+            f"{self.LAYER_FOLDER}/imap_mag_noop-norm-layer_20260116_v001.json",
+            1,
+        )
+
+        # A file was added to the folder after it was indexed.
+        modified = (datetime.now() + timedelta(hours=1)).timestamp()
+        os.utime(datastore / self.LAYER_FOLDER, (modified, modified))
+
+        finder = FileFinder(datastore, database=database, search_database=True)
+
+        result = finder.find_layers_by_date_and_patterns(
+            ["*noop*"], datetime(2026, 1, 16), ScienceMode.Normal
+        )
+
+        assert result == ["imap_mag_noop-norm-layer_20260116_v002.json"]
+
+    def test_datastore_is_searched_when_database_has_no_match(
+        self, datastore, database
+    ):
+        finder = FileFinder(datastore, database=database, search_database=True)
+
+        result = finder.find_layers_by_date_and_patterns(
+            ["*noop*"], datetime(2026, 1, 16), ScienceMode.Normal
+        )
+
+        assert result == ["imap_mag_noop-norm-layer_20260116_v002.json"]
+
+    def test_datastore_is_searched_when_database_file_is_missing(
+        self, datastore, database
+    ):
+        self._index(
+            database,
+            f"{self.LAYER_FOLDER}/imap_mag_noop-norm-layer_20260116_v003.json",
+            3,
+        )
+        finder = FileFinder(datastore, database=database, search_database=True)
+
+        result = finder.find_layers_by_date_and_patterns(
+            ["*noop*"], datetime(2026, 1, 16), ScienceMode.Normal
+        )
+
+        assert result == ["imap_mag_noop-norm-layer_20260116_v002.json"]
+
+    def test_database_is_not_searched_unless_enabled(self, datastore, database):
+        self._index(
+            database,
+            f"{self.LAYER_FOLDER}/imap_mag_noop-norm-layer_20260116_v001.json",
+            1,
+        )
+        finder = FileFinder(datastore, database=database)
+
+        result = finder.find_layers_by_date_and_patterns(
+            ["*noop*"], datetime(2026, 1, 16), ScienceMode.Normal
+        )
+
+        assert result == ["imap_mag_noop-norm-layer_20260116_v002.json"]
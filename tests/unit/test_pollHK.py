@@ -1,10 +1,14 @@
-"""Unit tests for pollHK flow name generation."""
+"""Unit tests for pollHK flow and flow name generation."""
 
+import threading
+import time
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from imap_mag.util import HKPacket
-from prefect_server.pollHK import generate_flow_run_name
+import pytest
+
+from imap_mag.util import DatetimeProvider, Environment, HKPacket
+from prefect_server.pollHK import generate_flow_run_name, poll_hk_flow
 
 
 class TestPollHKFlowGenerateName:
@@ -32,3 +36,157 @@ class TestPollHKFlowGenerateName:
             name = generate_flow_run_name()
 
         assert "01-06-2025" in name
+
+
+class TestPollHKFlowUnit:
+    @pytest.mark.asyncio
+    async def test_shares_one_webpoda_client_across_packets(self):
+        mock_fetch = MagicMock()
+        mock_dm = MagicMock()
+        mock_dm.get_dates_for_download.return_value = (
+            datetime(2025, 6, 1),
+            datetime(2025, 6, 2),
+        )
+
+        with (
+            patch("prefect_server.pollHK.try_get_prefect_logger"),
+            patch("prefect_server.pollHK.Database", return_value=MagicMock()),
+            patch("prefect_server.pollHK.get_secret_or_env_var", return_value="code"),
+            patch("prefect_server.pollHK.DownloadDateManager", return_value=mock_dm),
+            patch(
+                "prefect_server.pollHK.create_fetch_binary", return_value=mock_fetch
+            ) as mock_create_fetch_binary,
+            patch(
+                "prefect_server.pollHK.download_and_publish_binaries",
+                return_value={},
+            ) as mock_download,
+        ):
+            await poll_hk_flow.fn(
+                hk_packets=[HKPacket.SID1, HKPacket.SID2, HKPacket.SID3_PW],
+                start_date=datetime(2025, 6, 1),
+                end_date=datetime(2025, 6, 2),
+            )
+
+        mock_create_fetch_binary.assert_called_once()
+        assert (
+            mock_create_fetch_binary.call_args.args[
+                0
+            ].fetch_binary.api.auth_code.get_secret_value()
+            == "code"
+        )
+
+        assert sorted(
+            call.kwargs["packet"].packet_name for call in mock_download.call_args_list
+        ) == sorted(
+            p.packet_name for p in [HKPacket.SID1, HKPacket.SID2, HKPacket.SID3_PW]
+        )
+        assert all(call.args[0] is mock_fetch for call in mock_download.call_args_list)
+
+
+class TestPollHKFlowConcurrency:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrent_downloads", [1, 2])
+    async def test_downloads_overlap_up_to_configured_limit(
+        self, max_concurrent_downloads
+    ):
+        lock = threading.Lock()
+        active_downloads = 0
+        peak_downloads = 0
+        processed_packets: list[str] = []
+
+        def fake_download_and_publish_binaries(
+            fetch, app_settings, *, packet, **kwargs
+        ):
+            nonlocal active_downloads, peak_downloads
+
+            with lock:
+                active_downloads += 1
+                peak_downloads = max(peak_downloads, active_downloads)
+
+            time.sleep(0.1)
+
+            with lock:
+                active_downloads -= 1
+
+            return {packet.packet_name: None}
+
+        def fake_process(files, save_mode):
+            processed_packets.extend(files)
+
+        with (
+            patch("prefect_server.pollHK.AppSettings") as mock_app_settings,
+            patch("prefect_server.pollHK.Database"),
+            patch("prefect_server.pollHK.create_fetch_binary"),
+            patch(
+                "prefect_server.pollHK.download_and_publish_binaries",
+                side_effect=fake_download_and_publish_binaries,
+            ),
+            patch("prefect_server.pollHK.process", side_effect=fake_process),
+            Environment(IMAP_WEBPODA_TOKEN="12345"),
+        ):
+            mock_app_settings.return_value.fetch_binary.max_concurrent_downloads = (
+                max_concurrent_downloads
+            )
+
+            await poll_hk_flow.fn(
+                hk_packets=[HKPacket.SID1, HKPacket.SID2, HKPacket.SID3_PW],
+                start_date=datetime(2025, 6, 1),
+                end_date=datetime(2025, 6, 2),
+                datetime_provider=DatetimeProvider(fixed_now=datetime(2025, 6, 3)),
+            )
+
+        assert peak_downloads == max_concurrent_downloads
+        assert sorted(processed_packets) == sorted(
+            p.packet_name for p in [HKPacket.SID1, HKPacket.SID2, HKPacket.SID3_PW]
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrent_downloads", [1, 3])
+    async def test_failed_download_stops_remaining_packets(
+        self, max_concurrent_downloads
+    ):
+        started_packets: list[str] = []
+
+        def fake_download_and_publish_binaries(
+            fetch, app_settings, *, packet, **kwargs
+        ):
+            started_packets.append(packet.packet_name)
+
+            if packet == HKPacket.SID1:
+                raise RuntimeError("WebPODA unavailable")
+
+            time.sleep(0.1)
+            return {packet.packet_name: None}
+
+        with (
+            patch("prefect_server.pollHK.AppSettings") as mock_app_settings,
+            patch("prefect_server.pollHK.Database"),
+            patch("prefect_server.pollHK.create_fetch_binary"),
+            patch(
+                "prefect_server.pollHK.download_and_publish_binaries",
+                side_effect=fake_download_and_publish_binaries,
+            ),
+            patch("prefect_server.pollHK.process") as mock_process,
+            patch(
+                "prefect_server.pollHK.update_database_with_progress"
+            ) as mock_update_progress,
+            Environment(IMAP_WEBPODA_TOKEN="12345"),
+        ):
+            mock_app_settings.return_value.fetch_binary.max_concurrent_downloads = (
+                max_concurrent_downloads
+            )
+
+            with pytest.raises(RuntimeError, match="WebPODA unavailable"):
+                await poll_hk_flow.fn(
+                    hk_packets=[HKPacket.SID1, HKPacket.SID2, HKPacket.SID3_PW],
+                    start_date=datetime(2025, 6, 1),
+                    end_date=datetime(2025, 6, 2),
+                    datetime_provider=DatetimeProvider(fixed_now=datetime(2025, 6, 3)),
+                )
+
+            # Give any download already running in a thread time to finish.
+            time.sleep(0.2)
+
+        assert len(started_packets) == max_concurrent_downloads
+        mock_process.assert_not_called()
+        mock_update_progress.assert_not_called()
@@ -2,16 +2,21 @@
 
 import contextlib
 import os
+import sqlite3
 from datetime import UTC, datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pandas as pd
 import pytest
+from crump import CrumpConfig
 
 from prefect_server.postgresUploadFlow import (
     _get_database_connectionstring,
     _process_files,
     upload_new_files_to_postgres,
 )
+from tests.util.miscellaneous import DATASTORE
 
 
 class TestGetDatabaseConnectionstring:
@@ -218,6 +223,43 @@ class TestProcessFiles:
         assert uploaded == 0
         assert failed == 1
 
+    def test_syncs_parquet_hk_file_using_job_for_csv_file_of_same_name(self, tmp_path):
+        # Set up.
+        hk_path = Path("hk/mag/l1/hsk-pw/2025/11/imap_mag_l1_hsk-pw_20251102_v001")
+        csv_data = pd.read_csv(DATASTORE / hk_path.with_suffix(".csv"))
+
+        parquet_file = tmp_path / hk_path.with_suffix(".parquet")
+        parquet_file.parent.mkdir(parents=True)
+        csv_data.to_parquet(parquet_file, index=False, compression="zstd")
+
+        mock_settings = self._make_mock_settings(tmp_path)
+        mock_file = self._make_mock_file(hk_path.with_suffix(".parquet").as_posix())
+
+        crump_config = CrumpConfig.from_yaml(Path("imap-db-ingest-config.yaml"))
+        database_file = tmp_path / "target.db"
+
+        # Exercise.
+        uploaded, failed = _process_files(
+            [mock_file],
+            mock_settings,
+            crump_config,
+            f"sqlite:///{database_file}",
+            None,
+            MagicMock(),
+        )
+
+        # Verify.
+        assert uploaded == 1
+        assert failed == 0
+
+        with sqlite3.connect(database_file) as connection:
+            (row_count, file_date) = connection.execute(
+                "SELECT COUNT(*), MIN(file_date) FROM hsk_pw"
+            ).fetchone()
+
+        assert row_count == len(csv_data)
+        assert file_date == "20251102"
+
 
 class TestUploadNewFilesToPostgres:
     def _make_mock_settings(self, tmp_path):
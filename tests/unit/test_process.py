@@ -6,10 +6,12 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
+from imap_mag.config import HKOutputFormat, ProcessConfig
 from imap_mag.io import FileFinder
 from imap_mag.io.file import HKDecodedPathHandler, IFilePathHandler
 from imap_mag.process import HKProcessor, dispatch
 from imap_mag.util import CONSTANTS, HKPacket, TimeConversion
+from imap_mag.util.tabularFile import read_tabular_file
 from tests.util.miscellaneous import (
     DATASTORE,
     TEST_DATA,
@@ -256,6 +258,88 @@ def test_decode_hk_packet_with_two_files_for_two_days(capture_cli_logs):
     assert "Generating file for 2025-10-17." in capture_cli_logs.text
 
 
+def test_decode_hk_packets_with_process_pool_gives_same_output_as_serial_decode(
+    temp_folder_path,
+):
+    """Test that decoding files and subsystems in a process pool gives the same output as decoding serially."""
+
+    # Set up.
+    packet_paths = [
+        TEST_DATA / "MAG_HSK_PW_20250421_sclk.bin",
+        TEST_DATA / "MAG_HSK_PW_20251017_sclk.pkts",
+        TEST_DATA / "MAG_HSK_STATUS.pkts",
+        TEST_DATA / "MAG_HSK_SCI.pkts",
+    ]
+
+    processors: list[HKProcessor] = []
+
+    for name, workers in [("serial", 1), ("parallel", 2)]:
+        (temp_folder_path / name).mkdir()
+
+        processor = HKProcessor(
+            temp_folder_path / name,
+            FileFinder(DATASTORE),
+            ProcessConfig(hk_decode_workers=workers),
+        )
+        processor.initialize(Path("packet_def"))
+
+        processors.append(processor)
+
+    # Exercise.
+    serial_files = processors[0].process(packet_paths)
+    parallel_files = processors[1].process(packet_paths)
+
+    # Verify.
+    assert [path.name for path in parallel_files] == [
+        path.name for path in serial_files
+    ]
+
+    for serial_path, parallel_path in zip(serial_files, parallel_files):
+        assert parallel_path.read_text() == serial_path.read_text()
+
+
+def test_decode_hk_packet_to_parquet_gives_same_data_as_csv(temp_folder_path):
+    """Test that decoded HK data saved as Parquet contains the same data as the CSV output."""
+
+    # Set up.
+    packet_path = TEST_DATA / "MAG_HSK_PW_20251017_sclk.pkts"
+
+    processors: list[HKProcessor] = []
+
+    for output_format in [HKOutputFormat.CSV, HKOutputFormat.Parquet]:
+        (temp_folder_path / output_format.value).mkdir()
+
+        processor = HKProcessor(
+            temp_folder_path / output_format.value,
+            FileFinder(DATASTORE),
+            ProcessConfig(hk_output_format=output_format),
+        )
+        processor.initialize(Path("packet_def"))
+
+        processors.append(processor)
+
+    # Exercise.
+    csv_path = next(iter(processors[0].process(packet_path)))
+    parquet_path = next(iter(processors[1].process(packet_path)))
+
+    # Verify.
+    assert csv_path.name == "imap_mag_l1_hsk-pw_20251017_v001.csv"
+    assert parquet_path.name == "imap_mag_l1_hsk-pw_20251017_v001.parquet"
+
+    parquet_data = read_tabular_file(parquet_path)
+    csv_data = read_tabular_file(csv_path)
+
+    # Empty columns are read back as None from Parquet, but NaN from CSV.
+    assert parquet_data["epoch_iso"].isna().all()
+    assert csv_data["epoch_iso"].isna().all()
+
+    pd.testing.assert_frame_equal(
+        parquet_data.drop(columns="epoch_iso"),
+        csv_data.drop(columns="epoch_iso"),
+        check_dtype=False,
+    )
+
+
 def test_decode_hk_packet_with_data_from_multiple_apids(capture_cli_logs):
     """Test that HKProcessor splits data into separate files for each day, for each ApID."""
 
@@ -404,6 +488,46 @@ def test_decode_hk_packet_data_already_exists_in_datastore(capture_cli_logs):
     )
 
 
+def test_decode_hk_packet_with_merge_cache_gives_same_output_as_full_decode(
+    capture_cli_logs, temp_folder_path
+):
+    """Test that merging new HK data with cached data gives the same output as re-decoding the datastore."""
+
+    # Set up.
+    packet_path = TEST_DATA / "MAG_HSK_PW_20251017_sclk.pkts"
+
+    full_processor = HKProcessor(temp_folder_path / "full", FileFinder(DATASTORE))
+    full_processor.initialize(Path("packet_def"))
+
+    (temp_folder_path / "full").mkdir()
+    (temp_folder_path / "cached").mkdir()
+
+    expected_path = next(iter(full_processor.process(packet_path)))
+
+    cached_processor = HKProcessor(
+        temp_folder_path / "cached",
+        FileFinder(DATASTORE),
+        ProcessConfig(hk_merge_cache=temp_folder_path / "cache"),
+    )
+    cached_processor.initialize(Path("packet_def"))
+
+    # Exercise.
+    first_path = next(iter(cached_processor.process(packet_path)))
+    first_output = first_path.read_text()
+
+    second_path = next(iter(cached_processor.process(packet_path)))
+
+    # Verify.
+    assert first_output == expected_path.read_text()
+    assert second_path.read_text() == expected_path.read_text()
+
+    assert (temp_folder_path / "cache" / "MAG_HSK_PW" / "20251017.json").exists()
+    assert (
+        "Merging 0 new files for MAG_HSK_PW on 2025-10-17 with cached data."
+        in capture_cli_logs.text
+    )
+
+
 def test_decode_hk_packet_groupby_returns_tuple_for_day():
     """Very specific test to check that we support the `groupby` method returning a tuple for the `day` parameter."""
 
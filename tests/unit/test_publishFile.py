@@ -0,0 +1,62 @@
+"""Tests for `publish_file`."""
+
+import errno
+import hashlib
+from pathlib import Path
+from unittest import mock
+
+from imap_mag.util.publishFile import publish_file
+
+
+def test_copy_is_the_default_and_returns_hash_of_data_written(tmp_path: Path) -> None:
+    # Set up.
+    source = tmp_path / "source.txt"
+    source.write_bytes(b"some content")
+
+    # Exercise.
+    method, copied_hash = publish_file(source, tmp_path / "dest.txt")
+
+    # Verify.
+    assert method == "copy"
+    assert copied_hash == hashlib.md5(b"some content").hexdigest()
+    assert (tmp_path / "dest.txt").read_bytes() == b"some content"
+    assert source.exists()
+
+
+def test_move_renames_file_on_same_file_system(tmp_path: Path) -> None:
+    # Set up.
+    source = tmp_path / "source.txt"
+    source.write_bytes(b"some content")
+
+    # Exercise.
+    method, copied_hash = publish_file(source, tmp_path / "dest.txt", move=True)
+
+    # Verify.
+    assert method == "rename"
+    assert copied_hash is None
+    assert (tmp_path / "dest.txt").read_bytes() == b"some content"
+    assert not source.exists()
+
+
+def test_clone_falls_back_to_copy_when_not_supported(tmp_path: Path) -> None:
+    # Set up.
+    source = tmp_path / "source.txt"
+    source.write_bytes(b"some content")
+
+    not_supported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    # Exercise.
+    with (
+        mock.patch("imap_mag.util.publishFile.fcntl", None),
+        mock.patch(
+            "imap_mag.util.publishFile.os.copy_file_range",
+            side_effect=not_supported,
+            create=True,
+        ),
+    ):
+        method, _ = publish_file(source, tmp_path / "dest.txt", clone=True)
+
+    # Verify.
+    assert method == "copy"
+    assert (tmp_path / "dest.txt").read_bytes() == b"some content"
+    assert not list(tmp_path.glob(".*.part"))
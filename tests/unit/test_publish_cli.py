@@ -17,6 +17,7 @@ class TestPublishCli:
         test_file.write_text("fake cdf content")
 
         mock_sdc = MagicMock()
+        mock_sdc.get_url_base.return_value = "https://sdc.test"
 
         with (
             patch("imap_mag.cli.publish.SDCDataAccess", return_value=mock_sdc),
@@ -0,0 +1,68 @@
+"""Tests for `call_with_retry` function."""
+
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from imap_mag.util.retry import call_with_retry
+
+
+def test_retryable_errors_are_retried_with_increasing_delay() -> None:
+    # Set up.
+    func = Mock(side_effect=[ConnectionError("1"), ConnectionError("2"), "result"])
+
+    # Exercise.
+    with patch("imap_mag.util.retry.time.sleep") as mock_sleep:
+        result = call_with_retry(
+            func,
+            retries=2,
+            delay_seconds=5,
+            is_retryable=lambda e: isinstance(e, ConnectionError),
+            description="Test call",
+        )
+
+    # Verify.
+    assert result == "result"
+    assert func.call_count == 3
+    assert mock_sleep.call_args_list == [call(5), call(10)]
+
+
+def test_last_error_is_raised_once_retries_are_used_up() -> None:
+    # Set up.
+    func = Mock(side_effect=[ConnectionError("1"), ConnectionError("2")])
+
+    # Exercise and verify.
+    with (
+        patch("imap_mag.util.retry.time.sleep"),
+        pytest.raises(ConnectionError, match="2"),
+    ):
+        call_with_retry(
+            func,
+            retries=1,
+            delay_seconds=0,
+            is_retryable=lambda e: isinstance(e, ConnectionError),
+            description="Test call",
+        )
+
+    assert func.call_count == 2
+
+
+def test_other_errors_are_not_retried() -> None:
+    # Set up.
+    func = Mock(side_effect=ValueError("Not retryable"))
+
+    # Exercise and verify.
+    with (
+        patch("imap_mag.util.retry.time.sleep") as mock_sleep,
+        pytest.raises(ValueError, match="Not retryable"),
+    ):
+        call_with_retry(
+            func,
+            retries=3,
+            delay_seconds=0,
+            is_retryable=lambda e: isinstance(e, ConnectionError),
+            description="Test call",
+        )
+
+    assert func.call_count == 1
+    mock_sleep.assert_not_called()
@@ -0,0 +1,146 @@
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class LocalSDCServer:
+    """Stand-in for the SDC API, serving canned query results and downloads, and
+    accepting uploads, from a local HTTP server."""
+
+    __server: ThreadingHTTPServer
+    __thread: threading.Thread
+
+    def __init__(self, response_delay_seconds: float = 0) -> None:
+        self.response_delay_seconds = response_delay_seconds
+
+        self.query_responses: dict[str | None, list[dict[str, str]]] = dict()
+        self.downloads: dict[str, bytes] = dict()
+        self.uploads: dict[str, bytes] = dict()
+        self.upload_failures: dict[str, list[int]] = dict()
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.max_concurrent_requests = 0
+
+        self.__lock = threading.Lock()
+        self.__concurrent_requests = 0
+
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), self.__create_handler())
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever, daemon=True
+        )
+
+    def __enter__(self) -> "LocalSDCServer":
+        self.__thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def get_url(self) -> str:
+        (host, port) = self.__server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def add_query_response(
+        self, descriptor: str | None, files: list[dict[str, str]]
+    ) -> None:
+        """Return `files` for science queries with the given descriptor."""
+
+        self.query_responses[descriptor] = files
+
+    def add_download(self, file_path: str, content: bytes) -> None:
+        self.downloads[file_path] = content
+
+    def add_upload_failures(self, file_name: str, *status_codes: int) -> None:
+        """Fail the next uploads of `file_name`, one for each status code given."""
+
+        self.upload_failures.setdefault(file_name, []).extend(status_codes)
+
+    def get_upload_attempts(self, file_name: str) -> int:
+        """Number of times uploading `file_name` was requested so far."""
+
+        with self.__lock:
+            return sum(
+                1 for (path, _) in self.requests if path == f"/upload/{file_name}"
+            )
+
+    def get_queries(self) -> list[dict[str, str]]:
+        """Parameters of each query requested so far."""
+
+        with self.__lock:
+            return [params for (path, params) in self.requests if path == "/query"]
+
+    def __handle(self, handler: BaseHTTPRequestHandler) -> None:
+        url = urlparse(handler.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        # requests authenticated with an API key are prefixed with "/api-key"
+        path = url.path.removeprefix("/api-key")
+
+        with self.__lock:
+            self.requests.append((path, params))
+            self.__concurrent_requests += 1
+            self.max_concurrent_requests = max(
+                self.max_concurrent_requests, self.__concurrent_requests
+            )
+
+        try:
+            time.sleep(self.response_delay_seconds)
+
+            if path == "/query":
+                body = json.dumps(
+                    self.query_responses.get(params.get("descriptor"), [])
+                ).encode()
+            elif path.startswith("/download/"):
+                body = self.downloads.get(path.removeprefix("/download/"), b"")
+            elif path.startswith("/upload/"):
+                file_name = path.removeprefix("/upload/")
+
+                with self.__lock:
+                    failures = self.upload_failures.get(file_name, [])
+                    status = failures.pop(0) if failures else None
+
+                if status is not None:
+                    handler.send_error(status)
+                    return
+
+                # files are uploaded by PUT to the URL returned, like an S3 presigned URL
+                body = json.dumps(f"{self.get_url()}/s3-upload/{file_name}").encode()
+            elif path.startswith("/s3-upload/") and handler.command == "PUT":
+                length = int(handler.headers.get("Content-Length", 0))
+
+                with self.__lock:
+                    self.uploads[path.removeprefix("/s3-upload/")] = handler.rfile.read(
+                        length
+                    )
+
+                body = b""
+            else:
+                handler.send_error(HTTPStatus.NOT_FOUND)
+                return
+
+            handler.send_response(HTTPStatus.OK)
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+        finally:
+            with self.__lock:
+                self.__concurrent_requests -= 1
+
+    def __create_handler(self) -> type[BaseHTTPRequestHandler]:
+        handle = self.__handle
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                handle(self)
+
+            def do_PUT(self) -> None:
+                handle(self)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return Handler